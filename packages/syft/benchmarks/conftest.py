@@ -0,0 +1,91 @@
+# stdlib
+import json
+import tracemalloc
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+
+# third party
+import pytest
+
+# payloads this large are timed over a fixed number of rounds
+LARGE_PAYLOAD = 64 * 1024 * 1024
+LARGE_PAYLOAD_ROUNDS = 3
+
+
+def pytest_addoption(parser: Any) -> None:
+    group = parser.getgroup("syft benchmarks")
+    group.addoption(
+        "--memory-compare",
+        metavar="PATH",
+        default=None,
+        help="json written by --benchmark-json to compare the peak memory with",
+    )
+    group.addoption(
+        "--memory-compare-fail",
+        metavar="PERCENT",
+        type=float,
+        default=10.0,
+        help="fail if the peak memory grew by more than PERCENT (default: 10)",
+    )
+
+
+@pytest.fixture(scope="session")
+def memory_baseline(request: Any) -> Dict[str, int]:
+    path = request.config.getoption("--memory-compare")
+    if path is None:
+        return {}
+
+    with open(path) as fp:
+        results = json.load(fp)
+    return {
+        result["fullname"]: result["extra_info"]["peak_memory"]
+        for result in results["benchmarks"]
+        if "peak_memory" in result["extra_info"]
+    }
+
+
+def peak_memory(fn: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+@pytest.fixture
+def measure(benchmark: Any, request: Any, memory_baseline: Dict[str, int]) -> Callable:
+    """Benchmarks fn processing size bytes.
+
+    The peak memory of a separate traced call and the throughput in bytes per
+    second are added to the extra_info of the benchmark, so they end up in the
+    json of --benchmark-json / --benchmark-autosave next to the timings.
+    """
+    threshold = request.config.getoption("--memory-compare-fail")
+
+    def run(fn: Callable[[], Any], size: int, rounds: Optional[int] = None) -> None:
+        peak = peak_memory(fn)
+        if rounds is None and size >= LARGE_PAYLOAD:
+            rounds = LARGE_PAYLOAD_ROUNDS
+        if rounds is None:
+            benchmark(fn)
+        else:
+            benchmark.pedantic(fn, rounds=rounds, iterations=1)
+
+        benchmark.extra_info["bytes"] = size
+        benchmark.extra_info["peak_memory"] = peak
+        # no stats when benchmarks are disabled, e.g. with xdist
+        if benchmark.stats is not None:
+            benchmark.extra_info["throughput"] = size / benchmark.stats.stats.mean
+
+        baseline = memory_baseline.get(benchmark.fullname, None)
+        if baseline is not None and peak > baseline * (1 + threshold / 100):
+            pytest.fail(
+                f"Peak memory regressed from {baseline} to {peak} bytes, "
+                f"more than {threshold}%"
+            )
+
+    return run
@@ -0,0 +1,168 @@
+# stdlib
+from typing import Any
+from typing import Callable
+
+# third party
+import numpy as np
+import pandas as pd
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.client.api import SignedSyftAPICall
+from syft.client.api import SyftAPICall
+from syft.client.api import SyftAPIData
+from syft.node.credentials import SyftSigningKey
+from syft.node.worker import Worker
+from syft.serde.parallel import KiB
+from syft.serde.parallel import MiB
+from syft.serde.wire_format import SERDE_VERSION_1
+from syft.serde.wire_format import SERDE_VERSION_2
+from syft.service.action.action_object import ActionObject
+from syft.service.message.messages import Message
+from syft.types.datetime import DateTime
+from syft.types.twin_object import TwinObject
+from syft.types.uid import UID
+
+GiB = 1024 * MiB
+
+ARRAY_SIZES = [
+    pytest.param(KiB, id="1KiB"),
+    pytest.param(MiB, id="1MiB"),
+    pytest.param(64 * MiB, id="64MiB"),
+    pytest.param(GiB, id="1GiB", marks=pytest.mark.slow),
+]
+ENVELOPE_SIZES = ARRAY_SIZES[:3]
+VERSIONS = [
+    pytest.param(SERDE_VERSION_1, id="v1"),
+    pytest.param(SERDE_VERSION_2, id="v2"),
+]
+OPERATIONS = ["serialize", "deserialize"]
+
+
+def array(size: int) -> np.ndarray:
+    return np.random.default_rng(0).random(size // 8)
+
+
+def bench_serde(
+    measure: Callable, obj: Any, version: int, operation: str, **kwargs: Any
+) -> None:
+    blob = sy.serialize(obj, to_bytes=True, version=version)
+    if operation == "serialize":
+        measure(
+            lambda: sy.serialize(obj, to_bytes=True, version=version),
+            len(blob),
+            **kwargs,
+        )
+    else:
+        measure(lambda: sy.deserialize(blob, from_bytes=True), len(blob), **kwargs)
+
+
+@pytest.fixture(scope="module")
+def signing_key() -> SyftSigningKey:
+    return SyftSigningKey.generate()
+
+
+@pytest.mark.parametrize("operation", OPERATIONS)
+@pytest.mark.parametrize("version", VERSIONS)
+def test_api_call_kwargs(measure, version, operation) -> None:
+    call = SyftAPICall(
+        node_uid=UID(),
+        path="dataset.search",
+        args=[1, 2.5, "three", None, True],
+        kwargs={
+            "name": "dataset",
+            "page_size": 100,
+            "page_index": 0,
+            "ids": list(range(1000)),
+            "scores": [i / 7 for i in range(1000)],
+            "tags": [f"tag {i}" for i in range(1000)],
+            "filters": {f"column {i}": {"min": i, "max": i * 2} for i in range(100)},
+        },
+    )
+    bench_serde(measure, call, version, operation)
+
+
+@pytest.mark.parametrize("size", ENVELOPE_SIZES)
+def test_signed_envelope_send(measure, signing_key, size) -> None:
+    data = SyftAPIData(data=array(size))
+    measure(lambda: data.sign(signing_key).to_envelope(), size)
+
+
+@pytest.mark.parametrize("size", ENVELOPE_SIZES)
+def test_signed_envelope_receive(measure, signing_key, size) -> None:
+    envelope = SyftAPIData(data=array(size)).sign(signing_key).to_envelope()
+
+    def receive() -> Any:
+        # from_envelope verifies the signature
+        signed = SignedSyftAPICall.from_envelope(envelope).ok()
+        return signed.message.data
+
+    measure(receive, len(envelope))
+
+
+@pytest.mark.parametrize("operation", OPERATIONS)
+@pytest.mark.parametrize("version", VERSIONS)
+@pytest.mark.parametrize("size", ARRAY_SIZES)
+def test_action_object(measure, size, version, operation) -> None:
+    obj = ActionObject.from_obj(array(size))
+    bench_serde(measure, obj, version, operation)
+
+
+@pytest.mark.parametrize("operation", OPERATIONS)
+@pytest.mark.parametrize("version", VERSIONS)
+@pytest.mark.parametrize("size", ARRAY_SIZES)
+def test_twin_object(measure, size, version, operation) -> None:
+    private = array(size)
+    obj = TwinObject(private_obj=private, mock_obj=np.zeros_like(private))
+    bench_serde(measure, obj, version, operation)
+
+
+@pytest.mark.parametrize("operation", OPERATIONS)
+@pytest.mark.parametrize("version", VERSIONS)
+def test_dataframe(measure, version, operation) -> None:
+    rows = 100_000
+    df = pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "value": array(rows * 8),
+            "name": [f"name {i}" for i in range(rows)],
+            "category": pd.Categorical([f"category {i % 10}" for i in range(rows)]),
+        }
+    )
+    bench_serde(measure, df, version, operation)
+
+
+@pytest.mark.parametrize("operation", OPERATIONS)
+@pytest.mark.parametrize("version", VERSIONS)
+@pytest.mark.parametrize("dtype", [str, object])
+def test_string_array(measure, dtype, version, operation) -> None:
+    strings = np.array([f"value {i} ✓" for i in range(100_000)], dtype=dtype)
+    bench_serde(measure, strings, version, operation)
+
+
+@pytest.mark.parametrize("operation", OPERATIONS)
+@pytest.mark.parametrize("version", VERSIONS)
+def test_messages(measure, signing_key, version, operation) -> None:
+    node_uid = UID()
+    receiver = SyftSigningKey.generate().verify_key
+    messages = [
+        Message(
+            subject=f"message {i}",
+            node_uid=node_uid,
+            from_user_verify_key=signing_key.verify_key,
+            to_user_verify_key=receiver,
+            created_at=DateTime.now(),
+            linked_obj=None,
+        )
+        for i in range(10_000)
+    ]
+    bench_serde(measure, messages, version, operation)
+
+
+@pytest.mark.parametrize("operation", OPERATIONS)
+@pytest.mark.parametrize("version", VERSIONS)
+def test_syft_api(measure, version, operation) -> None:
+    worker = Worker(name="benchmark", processes=0)
+    api = worker.get_api(for_user=worker.root_client.credentials.verify_key)
+    bench_serde(measure, api, version, operation)
@@ -0,0 +1,210 @@
+# stdlib
+from itertools import count
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import List
+
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.node.credentials import SyftSigningKey
+from syft.node.credentials import SyftVerifyKey
+from syft.serde.serializable import serializable
+from syft.store.document_store import PartitionKey
+from syft.store.document_store import PartitionSettings
+from syft.store.document_store import QueryKeys
+from syft.store.locks import NoLockingConfig
+from syft.store.sqlite_document_store import SQLiteStoreClientConfig
+from syft.store.sqlite_document_store import SQLiteStoreConfig
+from syft.store.sqlite_document_store import SQLiteStorePartition
+from syft.types.syft_object import SYFT_OBJECT_VERSION_1
+from syft.types.syft_object import SyftObject
+
+BATCH = 100
+
+# the default WAL mode, the rollback journal SQLite uses on its own and WAL
+# with the opt-in cache of stored messages
+CONFIGS = [
+    pytest.param({}, id="wal"),
+    pytest.param({"journal_mode": "DELETE", "synchronous": "FULL"}, id="journal"),
+    pytest.param({"cache_size": 1024}, id="cached"),
+]
+LARGE_CONFIGS = [
+    pytest.param({}, id="uncached"),
+    pytest.param({"cache_size": 1024, "cache_bytes": 1024 * 1024 * 1024}, id="cached"),
+]
+LARGE_BATCH = 8
+LARGE_ARRAY = 4 * 1024 * 1024
+
+
+@serializable()
+class BenchmarkRecord(SyftObject):
+    __canonical_name__ = "BenchmarkRecord"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    name: str
+    tag: str
+    data: bytes
+
+    __attr_searchable__ = ["tag"]
+    __attr_unique__ = ["name"]
+
+
+@serializable()
+class LargeBenchmarkRecord(SyftObject):
+    __canonical_name__ = "LargeBenchmarkRecord"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    name: str
+    array: np.ndarray
+
+    __attr_unique__ = ["name"]
+
+
+@pytest.fixture(scope="module")
+def credentials() -> SyftVerifyKey:
+    return SyftSigningKey.generate().verify_key
+
+
+@pytest.fixture(params=CONFIGS)
+def partition(
+    request: Any, tmp_path: Path, credentials: SyftVerifyKey
+) -> SQLiteStorePartition:
+    client_config = SQLiteStoreClientConfig(
+        filename="benchmark.sqlite", path=tmp_path, **request.param
+    )
+    store_config = SQLiteStoreConfig(
+        client_config=client_config, locking_config=NoLockingConfig()
+    )
+    settings = PartitionSettings(name="benchmark", object_type=BenchmarkRecord)
+    partition = SQLiteStorePartition(credentials, settings, store_config)
+    yield partition
+    partition.close()
+
+
+@pytest.fixture(params=LARGE_CONFIGS)
+def large_partition(
+    request: Any, tmp_path: Path, credentials: SyftVerifyKey
+) -> SQLiteStorePartition:
+    client_config = SQLiteStoreClientConfig(
+        filename="benchmark.sqlite", path=tmp_path, **request.param
+    )
+    store_config = SQLiteStoreConfig(
+        client_config=client_config, locking_config=NoLockingConfig()
+    )
+    settings = PartitionSettings(name="large", object_type=LargeBenchmarkRecord)
+    partition = SQLiteStorePartition(credentials, settings, store_config)
+    yield partition
+    partition.close()
+
+
+@pytest.fixture
+def make_records() -> Callable[[int], List[BenchmarkRecord]]:
+    counter = count()
+
+    def make(n: int) -> List[BenchmarkRecord]:
+        return [
+            BenchmarkRecord(name=f"record {i}", tag=f"tag {i % 10}", data=bytes(1024))
+            for i in (next(counter) for _ in range(n))
+        ]
+
+    return make
+
+
+def records_size(records: List[BenchmarkRecord]) -> int:
+    return sum(len(sy.serialize(record, to_bytes=True)) for record in records)
+
+
+def fill(partition, credentials, records) -> None:
+    with partition.transaction():
+        for record in records:
+            assert partition.set(credentials, record).is_ok()
+
+
+def test_set(measure, partition, credentials, make_records) -> None:
+    size = records_size(make_records(BATCH))
+
+    def set_records() -> None:
+        for record in make_records(BATCH):
+            assert partition.set(credentials, record).is_ok()
+
+    measure(set_records, size)
+
+
+def test_set_transaction(measure, partition, credentials, make_records) -> None:
+    size = records_size(make_records(BATCH))
+    measure(lambda: fill(partition, credentials, make_records(BATCH)), size)
+
+
+def test_get(measure, partition, credentials, make_records) -> None:
+    records = make_records(BATCH)
+    fill(partition, credentials, records)
+    keys = [partition.settings.store_key.with_obj(record) for record in records]
+
+    def get_records() -> None:
+        for key in keys:
+            assert partition.get_all_from_store(credentials, QueryKeys(qks=[key])).ok()
+
+    measure(get_records, records_size(records))
+
+
+def test_find(measure, partition, credentials, make_records) -> None:
+    records = make_records(BATCH)
+    fill(partition, credentials, records)
+    name_key = PartitionKey(key="name", type_=str)
+    keys = [QueryKeys(qks=[name_key.with_obj(record.name)]) for record in records]
+
+    def find_records() -> None:
+        for key in keys:
+            res = partition.find_index_or_search_keys(
+                credentials, key, QueryKeys(qks=[])
+            )
+            assert len(res.ok()) == 1
+
+    measure(find_records, records_size(records))
+
+
+def test_update(measure, partition, credentials, make_records) -> None:
+    records = make_records(BATCH)
+    fill(partition, credentials, records)
+    keys = [partition.settings.store_key.with_obj(record) for record in records]
+
+    def update_records() -> None:
+        for key, record in zip(keys, records):
+            assert partition.update(credentials, key, record).is_ok()
+
+    measure(update_records, records_size(records))
+
+
+def test_delete(measure, partition, credentials, make_records) -> None:
+    size = records_size(make_records(BATCH))
+
+    def delete_records() -> None:
+        records = make_records(BATCH)
+        fill(partition, credentials, records)
+        for record in records:
+            key = partition.settings.store_key.with_obj(record)
+            assert partition.delete(credentials, key).is_ok()
+
+    measure(delete_records, size)
+
+
+def test_get_large(measure, large_partition, credentials) -> None:
+    array = np.random.default_rng(0).random(LARGE_ARRAY // 8)
+    records = [
+        LargeBenchmarkRecord(name=f"record {i}", array=array)
+        for i in range(LARGE_BATCH)
+    ]
+    fill(large_partition, credentials, records)
+    keys = [large_partition.settings.store_key.with_obj(record) for record in records]
+
+    def get_records() -> None:
+        for key in keys:
+            res = large_partition.get_all_from_store(credentials, QueryKeys(qks=[key]))
+            assert res.ok()
+
+    measure(get_records, records_size(records))
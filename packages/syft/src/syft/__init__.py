@@ -29,6 +29,9 @@ from .serde import NOTHING  # noqa: F401
 from .serde.deserialize import _deserialize as deserialize  # noqa: F401
 from .serde.serializable import serializable  # noqa: F401
 from .serde.serialize import _serialize as serialize  # noqa: F401
+from .serde.size import serialized_size  # noqa: F401
+from .serde.stream import deserialize_from  # noqa: F401
+from .serde.stream import serialize_to  # noqa: F401
 from .service.action.action_object import ActionObject  # noqa: F401
 from .service.action.plan import Plan  # noqa: F401
 from .service.action.plan import planify  # noqa: F401
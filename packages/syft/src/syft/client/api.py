@@ -4,10 +4,12 @@ from __future__ import annotations
 # stdlib
 import inspect
 from inspect import signature
+import struct
 import types
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Union
@@ -15,8 +17,11 @@ from typing import _GenericAlias
 
 # third party
 from nacl.exceptions import BadSignatureError
+from nacl.signing import VerifyKey
 from pydantic import BaseModel
 from pydantic import EmailStr
+from result import Err
+from result import Ok
 from result import OkErr
 from result import Result
 from typeguard import check_type
@@ -26,15 +31,18 @@ from ..abstract_node import AbstractNode
 from ..node.credentials import SyftSigningKey
 from ..node.credentials import SyftVerifyKey
 from ..serde.deserialize import _deserialize
+from ..serde.deserialize import trusted_deserialization
 from ..serde.recursive import index_syft_by_module_name
 from ..serde.serializable import serializable
 from ..serde.serialize import _serialize
 from ..serde.signature import Signature
 from ..serde.signature import signature_remove_context
 from ..serde.signature import signature_remove_self
+from ..serde.wire_format import use_serde_version
 from ..service.context import AuthedServiceContext
 from ..service.response import SyftAttributeError
 from ..service.response import SyftError
+from ..service.response import SyftException
 from ..service.response import SyftSuccess
 from ..service.service import UserLibConfigRegistry
 from ..service.service import UserServiceConfigRegistry
@@ -91,6 +99,16 @@ class LibEndpoint(SyftBaseObject):
     pre_kwargs: Optional[Dict[str, Any]]
 
 
+# a signed envelope is SIGNED_ENVELOPE_MAGIC verify_key:32 signature:64 payload,
+# where the payload is the serialized message the signature was made over
+SIGNED_ENVELOPE_MAGIC = b"\xfeSE\x01"
+SIGNED_ENVELOPE_HEADER = struct.Struct("<4s32s64s")
+
+
+def is_signed_envelope(data: Union[bytes, memoryview]) -> bool:
+    return bytes(data[: len(SIGNED_ENVELOPE_MAGIC)]) == SIGNED_ENVELOPE_MAGIC
+
+
 @serializable(attrs=["signature", "credentials", "serialized_message"])
 class SignedSyftAPICall(SyftObject):
     __canonical_name__ = "SignedSyftAPICall"
@@ -101,6 +119,18 @@ class SignedSyftAPICall(SyftObject):
     serialized_message: bytes
     cached_deseralized_message: Optional[SyftAPICall] = None
 
+    @staticmethod
+    def from_message(obj: Any, credentials: SyftSigningKey) -> SignedSyftAPICall:
+        """Serializes obj once and signs the resulting payload."""
+        payload = _serialize(obj, to_bytes=True)
+        signed_message = credentials.signing_key.sign(payload)
+
+        return SignedSyftAPICall(
+            credentials=credentials.verify_key,
+            serialized_message=payload,
+            signature=signed_message.signature,
+        )
+
     @property
     def message(self) -> SyftAPICall:
         # from deserialize we might not have this attr because __init__ is skipped
@@ -125,6 +155,45 @@ class SignedSyftAPICall(SyftObject):
 
         return SyftSuccess(message="Credentials are valid")
 
+    def envelope_parts(self) -> List[Union[bytes, memoryview]]:
+        """Header and payload of the signed envelope, see to_envelope."""
+        header = SIGNED_ENVELOPE_HEADER.pack(
+            SIGNED_ENVELOPE_MAGIC,
+            bytes(self.credentials.verify_key),
+            self.signature,
+        )
+        return [header, self.serialized_message]
+
+    def to_envelope(self) -> bytes:
+        """Frames the signed payload as it is, instead of serializing it again
+        as a field of this object."""
+        return b"".join(self.envelope_parts())
+
+    @staticmethod
+    def from_envelope(data: Union[bytes, memoryview]) -> Result[SignedSyftAPICall, str]:
+        """Reads a signed envelope, the payload is a view of data.
+
+        The envelope is only materialized once its signature checked out."""
+        if len(data) < SIGNED_ENVELOPE_HEADER.size or not is_signed_envelope(data):
+            return Err("Not a signed envelope")
+
+        _, verify_key, signature = SIGNED_ENVELOPE_HEADER.unpack_from(data)
+        serialized_message = memoryview(data)[SIGNED_ENVELOPE_HEADER.size :]
+        try:
+            verify_key = VerifyKey(verify_key)
+            verify_key.verify(serialized_message, signature)
+        except (BadSignatureError, ValueError):
+            return Err("The envelope signature is invalid")
+
+        return Ok(
+            SignedSyftAPICall.construct(
+                id=UID(),
+                credentials=SyftVerifyKey(verify_key=verify_key),
+                signature=signature,
+                serialized_message=serialized_message,
+            )
+        )
+
 
 @instrument
 @serializable()
@@ -141,13 +210,7 @@ class SyftAPICall(SyftObject):
     blocking: bool = True
 
     def sign(self, credentials: SyftSigningKey) -> SignedSyftAPICall:
-        signed_message = credentials.signing_key.sign(_serialize(self, to_bytes=True))
-
-        return SignedSyftAPICall(
-            credentials=credentials.verify_key,
-            serialized_message=signed_message.message,
-            signature=signed_message.signature,
-        )
+        return SignedSyftAPICall.from_message(self, credentials)
 
 
 @instrument
@@ -161,13 +224,7 @@ class SyftAPIData(SyftBaseObject):
     data: Any
 
     def sign(self, credentials: SyftSigningKey) -> SignedSyftAPICall:
-        signed_message = credentials.signing_key.sign(_serialize(self, to_bytes=True))
-
-        return SignedSyftAPICall(
-            credentials=credentials.verify_key,
-            serialized_message=signed_message.message,
-            signature=signed_message.signature,
-        )
+        return SignedSyftAPICall.from_message(self, credentials)
 
 
 def generate_remote_function(
@@ -319,6 +376,42 @@ class APIModule:
             return self.get_all()[key]
         raise NotImplementedError
 
+    def _paginates(self) -> bool:
+        # only some services take limit and cursor, see Page
+        signature = getattr(
+            self.get_all, "__ipython_inspector_signature_override__", None
+        )
+        return signature is not None and {"limit", "cursor"}.issubset(
+            signature.parameters
+        )
+
+    def iter_all(self, page_size: int = 100, sort_key: str = "id") -> Iterator[Any]:
+        """Yields the objects of get_all, fetching page_size of them at a time
+        when the previous ones are used up. Services which do not paginate
+        return all of them at once."""
+        if not hasattr(self, "get_all"):
+            raise SyftAttributeError(f"api{self.path} has no get_all to iterate")
+
+        if not self._paginates():
+            results = self.get_all()
+            if isinstance(results, SyftError):
+                raise SyftException(results.message)
+            yield from results
+            return
+
+        kwargs = {"limit": page_size, "sort_key": sort_key}
+        while True:
+            page = self.get_all(**kwargs)
+            if isinstance(page, SyftError):
+                raise SyftException(page.message)
+            yield from page.items
+            if page.next_cursor is None:
+                return
+            kwargs["cursor"] = page.next_cursor
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.iter_all()
+
     def _repr_html_(self) -> Any:
         if not hasattr(self, "get_all"):
             return NotImplementedError
@@ -423,7 +516,8 @@ class SyftAPI(SyftObject):
         )
 
     def make_call(self, api_call: SyftAPICall) -> Result:
-        signed_call = api_call.sign(credentials=self.signing_key)
+        with use_serde_version(self.connection.serde_version):
+            signed_call = api_call.sign(credentials=self.signing_key)
         signed_result = self.connection.make_call(signed_call)
 
         if not isinstance(signed_result, SignedSyftAPICall):
@@ -432,7 +526,13 @@ class SyftAPI(SyftObject):
         if not signed_result.is_valid:
             return SyftError(message="The result signature is invalid")  # type: ignore
 
-        result = signed_result.message.data
+        if signed_result.credentials == self.connection.get_node_verify_key():
+            # the node serialized and signed the result, so it was validated already
+            with trusted_deserialization():
+                result = signed_result.message.data
+        else:
+            # a valid signature, but not by the node this connection talks to
+            result = signed_result.message.data
 
         if isinstance(result, OkErr):
             if result.is_ok():
@@ -23,10 +23,15 @@ from typing_extensions import Self
 from .. import __version__
 from ..abstract_node import AbstractNode
 from ..node.credentials import SyftSigningKey
+from ..node.credentials import SyftVerifyKey
 from ..node.credentials import UserLoginCredentials
 from ..serde.deserialize import _deserialize
 from ..serde.serializable import serializable
 from ..serde.serialize import _serialize
+from ..serde.stream import iter_frames
+from ..serde.wire_format import SERDE_VERSION_1
+from ..serde.wire_format import SERDE_VERSION_2
+from ..serde.wire_format import get_serde_version
 from ..service.context import NodeServiceContext
 from ..service.dataset.dataset import CreateDataset
 from ..service.metadata.node_metadata import NodeMetadataJSON
@@ -46,7 +51,10 @@ from .api import APIRegistry
 from .api import SignedSyftAPICall
 from .api import SyftAPI
 from .api import SyftAPICall
+from .api import is_signed_envelope
 from .connection import NodeConnection
+from .connection import is_streaming_upload
+from .connection import preflight_upload
 
 # use to enable mitm proxy
 # from syft.grid.connections.http_connection import HTTPConnection
@@ -89,6 +97,9 @@ class HTTPConnection(NodeConnection):
     url: GridURL
     routes: Type[Routes] = Routes
     session_cache: Optional[Session]
+    verify_key_cache: Optional[SyftVerifyKey]
+    # upgraded from the node metadata, older nodes only understand v1
+    serde_version: int = SERDE_VERSION_1
 
     def __init__(
         self, url: Union[GridURL, str], proxy_target_uid: Optional[UID] = None
@@ -119,8 +130,17 @@ class HTTPConnection(NodeConnection):
             self.session_cache = session
         return self.session_cache
 
+    def get_node_verify_key(self) -> Optional[SyftVerifyKey]:
+        if self.verify_key_cache is None:
+            # the node at url, not the proxy target, signs what it sends back
+            response = self._make_get(self.routes.ROUTE_METADATA.value)
+            metadata = NodeMetadataJSON(**json.loads(response))
+            self.verify_key_cache = SyftVerifyKey.from_string(metadata.verify_key)
+        return self.verify_key_cache
+
     def _make_get(self, path: str, params: Optional[Dict] = None) -> bytes:
         url = self.url.with_path(path)
+        params = {**(params or {}), "serde_version": self.serde_version}
         response = self.session.get(
             str(url), verify=verify_tls(), proxies={}, params=params
         )
@@ -142,7 +162,12 @@ class HTTPConnection(NodeConnection):
     ) -> bytes:
         url = self.url.with_path(path)
         response = self.session.post(
-            str(url), verify=verify_tls(), json=json, proxies={}, data=data
+            str(url),
+            verify=verify_tls(),
+            json=json,
+            proxies={},
+            data=data,
+            params={"serde_version": self.serde_version},
         )
         if response.status_code != 200:
             raise requests.ConnectionError(
@@ -171,7 +196,10 @@ class HTTPConnection(NodeConnection):
         else:
             response = self._make_get(self.routes.ROUTE_METADATA.value)
             metadata_json = json.loads(response)
-            return NodeMetadataJSON(**metadata_json)
+            metadata = NodeMetadataJSON(**metadata_json)
+            self.serde_version = min(metadata.serde_version, get_serde_version())
+            self.verify_key_cache = SyftVerifyKey.from_string(metadata.verify_key)
+            return metadata
 
     def get_api(self, credentials: SyftSigningKey) -> SyftAPI:
         params = {"verify_key": str(credentials.verify_key)}
@@ -192,16 +220,28 @@ class HTTPConnection(NodeConnection):
         return None
 
     def register(self, new_user: UserCreate) -> SyftSigningKey:
-        data = _serialize(new_user, to_bytes=True)
+        data = _serialize(new_user, to_bytes=True, version=self.serde_version)
         response = self._make_post(self.routes.ROUTE_REGISTER.value, data=data)
         response = _deserialize(response, from_bytes=True)
         return response
 
     def make_call(self, signed_call: SignedSyftAPICall) -> Union[Any, SyftError]:
-        msg_bytes: bytes = _serialize(obj=signed_call, to_bytes=True)
+        if self.serde_version >= SERDE_VERSION_2:
+            # nodes speaking v2 take the signed payload framed as it is
+            parts = signed_call.envelope_parts()
+        else:
+            parts = [
+                _serialize(obj=signed_call, to_bytes=True, version=self.serde_version)
+            ]
+
+        if is_streaming_upload():
+            # sent with chunked transfer encoding, one frame at a time
+            data = iter_frames(parts)
+        else:
+            data = b"".join(parts)
         response = requests.post(  # nosec
             url=str(self.api_url),
-            data=msg_bytes,
+            data=data,
         )
 
         if response.status_code != 200:
@@ -209,6 +249,11 @@ class HTTPConnection(NodeConnection):
                 f"Failed to fetch metadata. Response returned with code {response.status_code}"
             )
 
+        if is_signed_envelope(response.content):
+            envelope = SignedSyftAPICall.from_envelope(response.content)
+            if envelope.is_err():
+                return SyftError(message=envelope.err())
+            return envelope.ok()
         result = _deserialize(response.content, from_bytes=True)
         return result
 
@@ -262,6 +307,9 @@ class PythonConnection(NodeConnection):
     def get_cache_key(self) -> str:
         return str(self.node.id)
 
+    def get_node_verify_key(self) -> Optional[SyftVerifyKey]:
+        return self.node.verify_key
+
     def exchange_credentials(
         self, email: str, password: str
     ) -> Optional[UserPrivateKey]:
@@ -366,7 +414,8 @@ class SyftClient:
                 twin = TwinObject(private_obj=asset.data, mock_obj=asset.mock)
             except Exception as e:
                 return SyftError(message=f"Failed to create twin. {e}")
-            response = self.api.services.action.set(twin)
+            with preflight_upload(twin):
+                response = self.api.services.action.set(twin)
             if isinstance(response, SyftError):
                 print(f"Failed to upload asset\n: {asset}")
                 return response
@@ -1,18 +1,61 @@
 # stdlib
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any
+from typing import Iterator
+from typing import Optional
 
 # relative
+from ..node.credentials import SyftVerifyKey
+from ..serde.parallel import MiB
+from ..serde.size import serialized_size
+from ..serde.wire_format import LATEST_SERDE_VERSION
 from ..types.syft_object import SYFT_OBJECT_VERSION_1
 from ..types.syft_object import SyftObject
 
+# uploads estimated to be larger than this are streamed, see preflight_upload
+STREAMING_UPLOAD_THRESHOLD = 64 * MiB
+
+_streaming_upload: ContextVar[bool] = ContextVar("streaming_upload", default=False)
+
+
+def is_streaming_upload() -> bool:
+    return _streaming_upload.get()
+
+
+@contextmanager
+def preflight_upload(obj: Any, threshold: Optional[int] = None) -> Iterator[int]:
+    """Estimates the serialized size of obj before it is uploaded in this block.
+
+    If the estimate exceeds threshold, STREAMING_UPLOAD_THRESHOLD by default,
+    connections send the calls made inside this block in frames instead of
+    as one request body. Yields the estimated size in bytes."""
+    if threshold is None:
+        threshold = STREAMING_UPLOAD_THRESHOLD
+
+    size = serialized_size(obj)
+    token = _streaming_upload.set(size > threshold)
+    try:
+        yield size
+    finally:
+        _streaming_upload.reset(token)
+
 
 class NodeConnection(SyftObject):
     __canonical_name__ = "NodeConnection"
     __version__ = SYFT_OBJECT_VERSION_1
 
+    # wire format used for everything sent over this connection
+    serde_version: int = LATEST_SERDE_VERSION
+
     def get_cache_key() -> str:
         raise NotImplementedError
 
+    def get_node_verify_key(self) -> Optional[SyftVerifyKey]:
+        """Verify key of the node this connection talks to, which signs the
+        results of calls made over it, also of calls it proxies."""
+        return None
+
     def __repr__(self) -> str:
         return f"<{type(self).__name__}"
 
@@ -38,6 +38,7 @@ from ..client.api import SyftAPIData
 from ..external import OBLV
 from ..serde.deserialize import _deserialize
 from ..serde.serialize import _serialize
+from ..serde.wire_format import LATEST_SERDE_VERSION
 from ..service.action.action_service import ActionService
 from ..service.action.action_store import DictActionStore
 from ..service.action.action_store import SQLiteActionStore
@@ -53,6 +54,7 @@ from ..service.message.message_service import MessageService
 from ..service.metadata.metadata_service import MetadataService
 from ..service.metadata.metadata_stash import MetadataStash
 from ..service.metadata.node_metadata import NodeMetadata
+from ..service.metadata.node_metadata import NodeMetadataV2
 from ..service.network.network_service import NetworkService
 from ..service.policy.policy_service import PolicyService
 from ..service.project.project_service import NewProjectService
@@ -264,9 +266,12 @@ class Node(AbstractNode):
                 db.commit()
                 db.close()
 
-            with contextlib.suppress(FileNotFoundError, PermissionError):
-                if os.path.exists(store_config.file_path):
-                    os.unlink(store_config.file_path)
+            # the write-ahead log and its index sit next to the database
+            for suffix in ["", "-wal", "-shm"]:
+                file_path = f"{store_config.file_path}{suffix}"
+                with contextlib.suppress(FileNotFoundError, PermissionError):
+                    if os.path.exists(file_path):
+                        os.unlink(file_path)
 
         return cls(
             name=name,
@@ -438,14 +443,15 @@ class Node(AbstractNode):
         return getattr(service_obj, method_name)
 
     @property
-    def metadata(self) -> NodeMetadata:
-        return NodeMetadata(
+    def metadata(self) -> NodeMetadataV2:
+        return NodeMetadataV2(
             name=self.name,
             id=self.id,
             verify_key=self.verify_key,
             highest_object_version=HIGHEST_SYFT_OBJECT_VERSION,
             lowest_object_version=LOWEST_SYFT_OBJECT_VERSION,
             syft_version=__version__,
+            serde_version=LATEST_SERDE_VERSION,
         )
 
     @property
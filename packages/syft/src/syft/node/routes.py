@@ -6,6 +6,7 @@ from typing import Dict
 from fastapi import APIRouter
 from fastapi import Body
 from fastapi import Depends
+from fastapi import HTTPException
 from fastapi import Request
 from fastapi import Response
 from fastapi.responses import JSONResponse
@@ -14,8 +15,14 @@ from pydantic import ValidationError
 
 # relative
 from ..abstract_node import AbstractNode
+from ..client.api import SignedSyftAPICall
+from ..client.api import is_signed_envelope
 from ..serde.deserialize import _deserialize as deserialize
 from ..serde.serialize import _serialize as serialize
+from ..serde.wire_format import SERDE_VERSION_1
+from ..serde.wire_format import SUPPORTED_SERDE_VERSIONS
+from ..serde.wire_format import serde_version_of
+from ..serde.wire_format import use_serde_version
 from ..service.context import NodeServiceContext
 from ..service.context import UnauthedServiceContext
 from ..service.metadata.metadata_service import MetadataService
@@ -41,6 +48,15 @@ def make_routes(worker: Worker) -> APIRouter:
     async def get_body(request: Request) -> bytes:
         return await request.body()
 
+    def get_serde_version(serde_version: int = SERDE_VERSION_1) -> int:
+        if serde_version not in SUPPORTED_SERDE_VERSIONS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported serde version: {serde_version}, "
+                f"supported versions are {list(SUPPORTED_SERDE_VERSIONS)}",
+            )
+        return serde_version
+
     @router.get(
         "/",
         name="healthcheck",
@@ -62,24 +78,33 @@ def make_routes(worker: Worker) -> APIRouter:
         return worker.metadata.to(NodeMetadataJSON)
 
     @router.get("/metadata_capnp")
-    def syft_metadata_capnp() -> Response:
+    def syft_metadata_capnp(
+        serde_version: int = Depends(get_serde_version),
+    ) -> Response:
         context = NodeServiceContext(node=worker)
         method = worker.get_method_with_context(MetadataService.get, context)
         result = method()
         return Response(
-            serialize(result.ok(), to_bytes=True),
+            serialize(result.ok(), to_bytes=True, version=serde_version),
             media_type="application/octet-stream",
         )
 
-    def handle_syft_new_api(user_verify_key: SyftVerifyKey) -> Response:
-        return Response(
-            serialize(worker.get_api(user_verify_key), to_bytes=True),
-            media_type="application/octet-stream",
-        )
+    def handle_syft_new_api(
+        user_verify_key: SyftVerifyKey, serde_version: int
+    ) -> Response:
+        with use_serde_version(serde_version):
+            return Response(
+                serialize(worker.get_api(user_verify_key), to_bytes=True),
+                media_type="application/octet-stream",
+            )
 
     # get the SyftAPI object
     @router.get("/api")
-    def syft_new_api(request: Request, verify_key: str) -> Response:
+    def syft_new_api(
+        request: Request,
+        verify_key: str,
+        serde_version: int = Depends(get_serde_version),
+    ) -> Response:
         user_verify_key: SyftVerifyKey = SyftVerifyKey.from_string(verify_key)
         if TRACE_MODE:
             with trace.get_tracer(syft_new_api.__module__).start_as_current_span(
@@ -87,17 +112,33 @@ def make_routes(worker: Worker) -> APIRouter:
                 context=extract(request.headers),
                 kind=trace.SpanKind.SERVER,
             ):
-                return handle_syft_new_api(user_verify_key)
+                return handle_syft_new_api(user_verify_key, serde_version)
         else:
-            return handle_syft_new_api(user_verify_key)
+            return handle_syft_new_api(user_verify_key, serde_version)
 
     def handle_new_api_call(data: bytes) -> Response:
-        obj_msg = deserialize(blob=data, from_bytes=True)
-        result = worker.handle_api_call(api_call=obj_msg)
-        return Response(
-            serialize(result, to_bytes=True),
-            media_type="application/octet-stream",
-        )
+        if is_signed_envelope(data):
+            envelope = SignedSyftAPICall.from_envelope(data)
+            if envelope.is_err():
+                error = SyftError(message=envelope.err())
+                return Response(
+                    serialize(error, to_bytes=True),
+                    media_type="application/octet-stream",
+                )
+            obj_msg = envelope.ok()
+            version = serde_version_of(obj_msg.serialized_message)
+        else:
+            obj_msg = deserialize(blob=data, from_bytes=True)
+            version = serde_version_of(data)
+
+        # answer in the wire format the client used for its request
+        with use_serde_version(version):
+            result = worker.handle_api_call(api_call=obj_msg)
+            if is_signed_envelope(data) and isinstance(result, SignedSyftAPICall):
+                content = result.to_envelope()
+            else:
+                content = serialize(result, to_bytes=True)
+            return Response(content, media_type="application/octet-stream")
 
     # make a request to the SyftAPI
     @router.post("/api_call")
@@ -114,7 +155,9 @@ def make_routes(worker: Worker) -> APIRouter:
         else:
             return handle_new_api_call(data)
 
-    def handle_login(email: str, password: str, node: AbstractNode) -> Any:
+    def handle_login(
+        email: str, password: str, node: AbstractNode, serde_version: int
+    ) -> Any:
         try:
             login_credentials = UserLoginCredentials(email=email, password=password)
         except ValidationError as e:
@@ -134,7 +177,7 @@ def make_routes(worker: Worker) -> APIRouter:
             response = user_private_key
 
         return Response(
-            serialize(response, to_bytes=True),
+            serialize(response, to_bytes=True, version=serde_version),
             media_type="application/octet-stream",
         )
 
@@ -156,7 +199,7 @@ def make_routes(worker: Worker) -> APIRouter:
             response = result
 
         return Response(
-            serialize(response, to_bytes=True),
+            serialize(response, to_bytes=True, version=serde_version_of(data)),
             media_type="application/octet-stream",
         )
 
@@ -166,6 +209,7 @@ def make_routes(worker: Worker) -> APIRouter:
         request: Request,
         email: str = Body(..., example="info@openmined.org"),
         password: str = Body(..., example="changethis"),
+        serde_version: int = Depends(get_serde_version),
     ) -> Any:
         if TRACE_MODE:
             with trace.get_tracer(login.__module__).start_as_current_span(
@@ -173,9 +217,9 @@ def make_routes(worker: Worker) -> APIRouter:
                 context=extract(request.headers),
                 kind=trace.SpanKind.SERVER,
             ):
-                return handle_login(email, password, worker)
+                return handle_login(email, password, worker, serde_version)
         else:
-            return handle_login(email, password, worker)
+            return handle_login(email, password, worker, serde_version)
 
     @router.post("/register", name="register", status_code=200)
     def register(request: Request, data: bytes = Depends(get_body)) -> Any:
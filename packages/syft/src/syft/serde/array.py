@@ -4,7 +4,7 @@ from numpy import frombuffer
 
 # relative
 from .arrow import numpy_deserialize
-from .arrow import numpy_serialize
+from .arrow import numpy_serialize_parts
 from .recursive import recursive_serde_register
 
 SUPPORTED_BOOL_TYPES = [np.bool_]
@@ -34,7 +34,7 @@ DTYPE_REFACTOR = {
 }
 
 recursive_serde_register(
-    np.ndarray, serialize=numpy_serialize, deserialize=numpy_deserialize
+    np.ndarray, serialize=numpy_serialize_parts, deserialize=numpy_deserialize
 )
 
 recursive_serde_register(
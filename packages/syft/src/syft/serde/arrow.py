@@ -1,6 +1,13 @@
 # stdlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+import io
+from pathlib import Path
+import struct
+from typing import Iterator
+from typing import List
+from typing import Tuple
 from typing import Union
-from typing import cast
 
 # third party
 import numpy as np
@@ -9,25 +16,131 @@ import pyarrow as pa
 # relative
 from ..util.experimental_flags import ApacheArrowCompression
 from ..util.experimental_flags import flags
+from .compression import CompressionCodec
+from .compression import compression_policy
+from .compression import decompress
+from .compression import is_compressed
 from .deserialize import _deserialize
-from .serialize import _serialize
 
+# a string array is STRING_ARRAY_MAGIC dtype_size:u8 ndim:u8 dtype shape:u64{ndim}
+# has_validity:u8 [validity bitmap] offsets:i64{count + 1} utf-8 blob
+STRING_ARRAY_MAGIC = b"\xfeST\x01"
+STRING_ARRAY_HEADER = struct.Struct("<4sBB")
 
-def arrow_serialize(obj: np.ndarray) -> bytes:
-    original_dtype = obj.dtype
-    apache_arrow = pa.Tensor.from_numpy(obj=obj)
-    sink = pa.BufferOutputStream()
-    pa.ipc.write_tensor(apache_arrow, sink)
-    buffer = sink.getvalue()
-    if flags.APACHE_ARROW_COMPRESSION is ApacheArrowCompression.NONE:
-        numpy_bytes = buffer.to_pybytes()
+_writable: ContextVar[bool] = ContextVar("writable_arrays", default=False)
+
+
+def is_writable_arrays() -> bool:
+    return _writable.get()
+
+
+@contextmanager
+def writable_arrays() -> Iterator[None]:
+    """Copy decoded arrays and frames out of read-only messages.
+
+    By default arrays are views over the message they were decoded from, so
+    decoding costs nothing but they are read-only whenever the message is.
+    Code which changes the decoded data in place either copies what it
+    changes (copy on write) or decodes inside this block."""
+    token = _writable.set(True)
+    try:
+        yield None
+    finally:
+        _writable.reset(token)
+
+
+def npy_header(array: np.ndarray) -> bytes:
+    fp = io.BytesIO()
+    np.lib.format.write_array_header_1_0(
+        fp, np.lib.format.header_data_from_array_1_0(array)
+    )
+    return fp.getvalue()
+
+
+def read_npy_header(
+    fp: io.IOBase,
+) -> Tuple[Tuple[int, ...], bool, np.dtype]:
+    np.lib.format.read_magic(fp)
+    return np.lib.format.read_array_header_1_0(fp)
+
+
+def raw_numpy_parts(obj: np.ndarray) -> List[Union[bytes, memoryview]]:
+    """Encodes an array as an .npy header followed by its contiguous buffer.
+
+    C and Fortran ordered arrays are returned as a view of their buffer, any
+    other layout is made C contiguous first.
+
+    Args:
+        obj (np.ndarray): array with a fixed size dtype
+
+    Returns:
+        List[Union[bytes, memoryview]]: header and data of the array in .npy format
+    """
+    if obj.dtype.hasobject:
+        raise ValueError(f"Invalid dtype:{obj.dtype} for numpy serialization")
+
+    if not obj.flags.c_contiguous and not obj.flags.f_contiguous:
+        obj = np.ascontiguousarray(obj)
+    data = obj if obj.flags.c_contiguous else obj.T
+
+    return [npy_header(obj), data.reshape(-1).view(np.uint8).data]
+
+
+def raw_numpy_serialize(obj: np.ndarray) -> bytes:
+    return b"".join(raw_numpy_parts(obj))
+
+
+def raw_numpy_deserialize(buf: Union[bytes, memoryview]) -> np.ndarray:
+    """Decodes an .npy encoded array as a view over the given buffer.
+
+    Nothing is copied, so the result is read-only whenever the buffer is.
+    Inside writable_arrays() read-only buffers are copied instead.
+
+    Args:
+        buf (Union[bytes, memoryview]): array in .npy format
+
+    Returns:
+        np.ndarray: view over the array data in buf
+    """
+    # version 1.0 headers store their length as an u16 right after the magic
+    (header_size,) = struct.unpack("<H", bytes(buf[8:10]))
+    offset = 10 + header_size
+    shape, fortran_order, dtype = read_npy_header(io.BytesIO(bytes(buf[:offset])))
+
+    array = np.frombuffer(buf, dtype=dtype, count=int(np.prod(shape)), offset=offset)
+    if fortran_order:
+        array = array.reshape(shape[::-1]).T
     else:
-        numpy_bytes = pa.compress(
-            buffer, asbytes=True, codec=flags.APACHE_ARROW_COMPRESSION.value
-        )
-    dtype = original_dtype.name
+        array = array.reshape(shape)
+    if not array.flags.writeable and is_writable_arrays():
+        # keeps the memory layout, so fortran ordered arrays stay that way
+        array = array.copy(order="K")
+    return array
+
+
+def numpy_memmap(path: Union[str, Path], offset: int = 0) -> np.memmap:
+    """Maps a serialized array stored in a file without reading its data.
 
-    return cast(bytes, _serialize((numpy_bytes, buffer.size, dtype), to_bytes=True))
+    Args:
+        path (Union[str, Path]): file containing the output of numpy_serialize
+        offset (int): position of the serialized array in the file
+
+    Returns:
+        np.memmap: read-only array backed by the file
+    """
+    with open(path, "rb") as fp:
+        fp.seek(offset)
+        shape, fortran_order, dtype = read_npy_header(fp)
+        data_offset = fp.tell()
+
+    return np.memmap(
+        path,
+        dtype=dtype,
+        mode="r",
+        offset=data_offset,
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
 
 
 def arrow_deserialize(
@@ -76,48 +189,125 @@ def numpyutf8toarray(input_index: np.ndarray) -> np.ndarray:
     return np.array(output_list).reshape(shape)
 
 
-def arraytonumpyutf8(string_list: Union[str, np.ndarray]) -> bytes:
-    """Encodes string Numpyarray  to utf-8 encoded numpy array.
+def string_array_serialize(obj: np.ndarray) -> bytes:
+    """Encodes a str or object array of strings in the Arrow string layout.
+
+    The strings are stored as one utf-8 blob plus an array of byte offsets
+    into it. Missing values in object arrays are recorded in a validity bitmap.
+
+    Args:
+        obj (np.ndarray): array of strings, object arrays may contain None
+
+    Returns:
+        bytes: header, validity bitmap, offsets and utf-8 blob
+    """
+    values = obj.ravel().tolist()
+    validity = b""
+    if obj.dtype.kind == "O":
+        value_types = set(map(type, values))
+        if not value_types <= {str, type(None)}:
+            raise ValueError(f"Invalid types:{value_types} for string serialization")
+        if type(None) in value_types:
+            mask = np.fromiter(
+                (value is not None for value in values), dtype=bool, count=len(values)
+            )
+            validity = np.packbits(mask, bitorder="little").tobytes()
+            values = [value if value is not None else "" for value in values]
+
+    lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+    blob = "".join(values).encode("utf-8")
+    if len(blob) != lengths.sum():
+        # non ascii text, character and byte lengths differ
+        lengths = np.fromiter(
+            map(len, map(str.encode, values)), dtype=np.int64, count=len(values)
+        )
+    offsets = np.zeros(len(values) + 1, dtype="<i8")
+    np.cumsum(lengths, out=offsets[1:])
+
+    dtype = obj.dtype.str.encode()
+    header = (
+        STRING_ARRAY_HEADER.pack(STRING_ARRAY_MAGIC, len(dtype), obj.ndim)
+        + dtype
+        + struct.pack(f"<{obj.ndim}Q?", *obj.shape, bool(validity))
+    )
+    return b"".join([header, validity, offsets.data, blob])
+
+
+def string_array_deserialize(buf: Union[bytes, memoryview]) -> np.ndarray:
+    """Decodes an array written by string_array_serialize.
 
     Args:
-        string_list (np.ndarray): NumpyArray to be encoded
+        buf (Union[bytes, memoryview]): encoded array
 
     Returns:
-        bytes: serialized utf-8 encoded int Numpy array
+        np.ndarray: array with the original dtype and shape
     """
-    array_shape = np.array(string_list).shape
-    string_list = np.array(string_list).flatten()
-    bytes_list = []
-    indexes = []
-    offset = 0
-
-    for item in string_list:
-        name_bytes = item.encode("utf-8")
-        offset += len(name_bytes)
-        indexes.append(offset)
-        bytes_list.append(name_bytes)
-
-    np_bytes = np.frombuffer(b"".join(bytes_list), dtype=np.uint8)
-    np_bytes = np_bytes.astype(np.uint64)
-    np_indexes = np.array(indexes, dtype=np.uint64)
-    index_length = np.array([len(np_indexes)], dtype=np.uint64)
-    shape = np.array(array_shape, dtype=np.uint64)
-    shape_length = np.array([len(shape)], dtype=np.uint64)
-    output_array = np.concatenate(
-        [np_bytes, np_indexes, index_length, shape, shape_length]
+    view = memoryview(buf)
+    _, dtype_size, ndim = STRING_ARRAY_HEADER.unpack_from(view)
+    offset = STRING_ARRAY_HEADER.size
+    dtype = np.dtype(bytes(view[offset : offset + dtype_size]).decode())
+    offset += dtype_size
+    *shape, has_validity = struct.unpack_from(f"<{ndim}Q?", view, offset)
+    offset += struct.calcsize(f"<{ndim}Q?")
+    count = int(np.prod(shape))
+
+    validity = None
+    if has_validity:
+        validity = pa.py_buffer(view[offset : offset + (count + 7) // 8])
+        offset += (count + 7) // 8
+    offsets = view[offset : offset + (count + 1) * 8]
+    offset += len(offsets)
+    (data_size,) = struct.unpack_from("<q", offsets, count * 8)
+    data = view[offset : offset + data_size]
+
+    strings = pa.Array.from_buffers(
+        pa.large_string(),
+        count,
+        [validity, pa.py_buffer(offsets), pa.py_buffer(data)],
     )
+    values = strings.to_numpy(zero_copy_only=False)
+    if dtype.kind == "U":
+        values = values.astype(dtype)
+    return values.reshape(shape)
+
 
-    return cast(bytes, _serialize(output_array, to_bytes=True))
+def numpy_serialize_parts(
+    obj: np.ndarray,
+) -> Union[bytes, List[Union[bytes, memoryview]]]:
+    """Serializes an array, uncompressed ones as a header and a data buffer.
+
+    Registered as the np.ndarray serializer so the array data is copied once,
+    straight into the message, instead of being joined with its header first.
+    """
+    if obj.dtype.kind in ("U", "O"):
+        return compression_policy.compress(string_array_serialize(obj))
+
+    parts = raw_numpy_parts(obj)
+    codec = compression_policy.choose(parts[1])
+    if codec is CompressionCodec.NONE:
+        size = len(parts[0]) + parts[1].nbytes
+        compression_policy.count(codec, size, size)
+        # the serializer joins the parts while copying them into the message
+        return parts
+    return compression_policy.compress(b"".join(parts), codec=codec)
 
 
 def numpy_serialize(obj: np.ndarray) -> bytes:
-    if obj.dtype.type != np.str_:
-        return arrow_serialize(obj)
-    else:
-        return arraytonumpyutf8(obj)
+    data = numpy_serialize_parts(obj)
+    if isinstance(data, list):
+        return b"".join(data)
+    return data
+
 
+def numpy_deserialize(buf: Union[bytes, memoryview]) -> np.ndarray:
+    if is_compressed(buf):
+        buf = decompress(buf)
+    if bytes(buf[: len(np.lib.format.MAGIC_PREFIX)]) == np.lib.format.MAGIC_PREFIX:
+        return raw_numpy_deserialize(buf)
+    if bytes(buf[: len(STRING_ARRAY_MAGIC)]) == STRING_ARRAY_MAGIC:
+        return string_array_deserialize(buf)
 
-def numpy_deserialize(buf: bytes) -> np.ndarray:
+    # arrays written as arrow tensors or utf-8 code points by older versions
     deser = _deserialize(buf, from_bytes=True)
     if isinstance(deser, tuple):
         return arrow_deserialize(*deser)
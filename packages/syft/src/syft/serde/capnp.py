@@ -1,9 +1,11 @@
 # stdlib
 import os
 from pathlib import Path
+from typing import Union
 
 # third party
 import capnp
+import numpy as np
 
 
 def get_capnp_schema(schema_file: str) -> type:
@@ -11,3 +13,16 @@ def get_capnp_schema(schema_file: str) -> type:
     root_dir = Path(here) / ".." / "capnp"
     capnp_path = os.path.abspath(root_dir / schema_file)
     return capnp.load(str(capnp_path))
+
+
+def word_aligned(blob: Union[bytes, bytearray, memoryview]) -> Union[bytes, memoryview]:
+    """capnp refuses messages which are not aligned to the machine word size.
+
+    bytes objects always are, but a view into a larger buffer (e.g. a v1 message
+    nested inside a v2 message) can start anywhere and has to be copied."""
+    if isinstance(blob, bytes):
+        return blob
+    address = np.frombuffer(blob, dtype=np.uint8).ctypes.data
+    if address % 8 != 0:
+        return bytes(blob)
+    return memoryview(blob)
@@ -0,0 +1,165 @@
+# stdlib
+from enum import Enum
+import struct
+import threading
+from typing import Dict
+from typing import Optional
+from typing import Union
+
+# third party
+import pyarrow as pa
+
+# a compressed payload is COMPRESSION_MAGIC codec:u8 size:u64 compressed bytes,
+# payloads left uncompressed are stored as they are
+COMPRESSION_MAGIC = b"\xfeCZ\x01"
+COMPRESSION_HEADER = struct.Struct("<4sBQ")
+
+KiB = 1024
+MiB = 1024 * KiB
+
+
+class CompressionCodec(Enum):
+    NONE = 0
+    LZ4 = 1
+    ZSTD = 2
+
+
+CODEC_NAMES = {
+    CompressionCodec.LZ4: "lz4",
+    CompressionCodec.ZSTD: "zstd",
+}
+
+
+class CodecCounters:
+    __slots__ = ("payloads", "bytes_in", "bytes_out")
+
+    def __init__(self) -> None:
+        self.payloads = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"CodecCounters(payloads={self.payloads}, "
+            f"bytes_in={self.bytes_in}, bytes_out={self.bytes_out})"
+        )
+
+
+def is_compressed(buf: Union[bytes, memoryview]) -> bool:
+    return bytes(buf[: len(COMPRESSION_MAGIC)]) == COMPRESSION_MAGIC
+
+
+class CompressionPolicy:
+    """Picks a compression codec for each serialized payload.
+
+    Payloads smaller than min_size are never compressed. For larger ones a few
+    evenly spaced samples are compressed with lz4 first, and payloads which do
+    not shrink below max_sample_ratio of their size are stored as they are.
+    The rest use lz4, or zstd from zstd_min_size on where the better ratio
+    outweighs the slower codec.
+
+    Args:
+        min_size (int): smallest payload worth compressing
+        zstd_min_size (int): smallest payload compressed with zstd instead of lz4
+        sample_size (int): size of each sample of the compressibility estimate
+        samples (int): number of samples of the compressibility estimate
+        max_sample_ratio (float): compressed / original size of the samples
+            above which a payload is considered incompressible
+    """
+
+    def __init__(
+        self,
+        min_size: int = 16 * KiB,
+        zstd_min_size: int = 1 * MiB,
+        sample_size: int = 4 * KiB,
+        samples: int = 4,
+        max_sample_ratio: float = 0.9,
+    ) -> None:
+        self.min_size = min_size
+        self.zstd_min_size = zstd_min_size
+        self.sample_size = sample_size
+        self.samples = samples
+        self.max_sample_ratio = max_sample_ratio
+        self._lock = threading.Lock()
+        self.reset_counters()
+
+    def sample_ratio(self, data: memoryview) -> float:
+        if len(data) <= self.sample_size * self.samples:
+            sample = data.tobytes()
+        else:
+            stride = (len(data) - self.sample_size) // (self.samples - 1)
+            sample = b"".join(
+                data[start : start + self.sample_size]
+                for start in range(0, stride * self.samples, stride)
+            )
+        compressed = pa.compress(sample, codec="lz4", asbytes=True)
+        return len(compressed) / len(sample)
+
+    def choose(self, data: Union[bytes, memoryview]) -> CompressionCodec:
+        data = memoryview(data).cast("B")
+        if len(data) < self.min_size:
+            return CompressionCodec.NONE
+        if self.sample_ratio(data) > self.max_sample_ratio:
+            return CompressionCodec.NONE
+        if len(data) < self.zstd_min_size:
+            return CompressionCodec.LZ4
+        return CompressionCodec.ZSTD
+
+    def count(self, codec: CompressionCodec, bytes_in: int, bytes_out: int) -> None:
+        with self._lock:
+            counters = self.counters[codec]
+            counters.payloads += 1
+            counters.bytes_in += bytes_in
+            counters.bytes_out += bytes_out
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.counters: Dict[CompressionCodec, CodecCounters] = {
+                codec: CodecCounters() for codec in CompressionCodec
+            }
+
+    def compress(self, data: bytes, codec: Optional[CompressionCodec] = None) -> bytes:
+        """Compresses data with the codec chosen for it.
+
+        Args:
+            data (bytes): serialized payload
+            codec (Optional[CompressionCodec]): codec already chosen for data
+
+        Returns:
+            bytes: data itself if it is not worth compressing, otherwise a
+                compressed payload recording its codec and original size
+        """
+        if codec is None:
+            codec = self.choose(data)
+        if codec is CompressionCodec.NONE:
+            self.count(codec, len(data), len(data))
+            return data
+
+        compressed = pa.compress(data, codec=CODEC_NAMES[codec], asbytes=True)
+        header = COMPRESSION_HEADER.pack(COMPRESSION_MAGIC, codec.value, len(data))
+        self.count(codec, len(data), len(header) + len(compressed))
+        return header + compressed
+
+
+def decompress(buf: Union[bytes, memoryview]) -> Union[bytes, memoryview]:
+    """Restores a payload written by CompressionPolicy.compress.
+
+    Args:
+        buf (Union[bytes, memoryview]): compressed or uncompressed payload
+
+    Returns:
+        Union[bytes, memoryview]: the original payload
+    """
+    if not is_compressed(buf):
+        return buf
+
+    _, codec_id, size = COMPRESSION_HEADER.unpack_from(buf)
+    return pa.decompress(
+        memoryview(buf)[COMPRESSION_HEADER.size :],
+        decompressed_size=size,
+        codec=CODEC_NAMES[CompressionCodec(codec_id)],
+        asbytes=True,
+    )
+
+
+compression_policy = CompressionPolicy()
@@ -1,21 +1,64 @@
 # stdlib
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any
+from typing import Iterator
 
 # third party
 from capnp.lib.capnp import _DynamicStructBuilder
 
+# relative
+from .wire_format import SERDE_VERSION_2
+from .wire_format import serde_version_of
+
+_trusted: ContextVar[bool] = ContextVar("trusted_deserialization", default=False)
+
+
+def is_trusted_deserialization() -> bool:
+    return _trusted.get()
+
+
+@contextmanager
+def trusted_deserialization() -> Iterator[None]:
+    """Deserialize SyftObjects inside this block without validating them again.
+
+    Only for messages serialized by this node or a verified peer node, e.g.
+    documents read back from the node's own store or signed node responses.
+    Payloads from anyone else must always be validated."""
+    token = _trusted.set(True)
+    try:
+        yield None
+    finally:
+        _trusted.reset(token)
+
 
 def _deserialize(
     blob: Any,
     from_proto: bool = True,
     from_bytes: bool = False,
+    lazy: bool = False,
+    trusted: bool = False,
 ) -> Any:
+    """Deserializes a proto or bytes produced by _serialize.
+
+    With lazy=True large fields of objects in a serde v2 message are only
+    decoded on first access, see LazyObject. v1 messages are always decoded
+    completely.
+
+    With trusted=True the blob is deserialized inside trusted_deserialization,
+    otherwise within whatever block the caller is in.
+    """
+    if trusted and not _trusted.get():
+        with trusted_deserialization():
+            return _deserialize(blob, from_proto, from_bytes, lazy)
+
     # relative
+    from .flat import flat_deserialize
     from .recursive import rs_bytes2object
     from .recursive import rs_proto2object
 
     if (
-        (from_bytes and not isinstance(blob, bytes))
+        (from_bytes and not isinstance(blob, (bytes, bytearray, memoryview)))
         or (
             from_proto
             and not from_bytes
@@ -26,6 +69,8 @@ def _deserialize(
         raise TypeError("Wrong deserialization format.")
 
     if from_bytes:
+        if serde_version_of(blob) == SERDE_VERSION_2:
+            return flat_deserialize(blob, lazy=lazy)
         return rs_bytes2object(blob)
 
     if from_proto:
@@ -0,0 +1,728 @@
+# stdlib
+from collections import OrderedDict
+from concurrent.futures import Future
+import struct
+import types
+from typing import Any
+from typing import Callable
+from typing import Collection
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Set
+from typing import Union
+import uuid
+
+# third party
+import numpy as np
+
+# relative
+from ..util.util import get_fully_qualified_name
+from .compression import compression_policy
+from .compression import decompress
+from .lazy import LAZY_MIN_FIELD_SIZE
+from .lazy import LazyObject
+from .parallel import leaf_size
+from .parallel import parallel_encoding
+from .passthrough import encoding_of
+from .recursive import TYPE_BANK
+from .recursive import compile_field_plan
+from .recursive import field_decoders
+from .recursive import resolve_class
+from .wire_format import MAGIC_V2
+from .wire_format import SERDE_VERSION_2
+
+# serde v2 wire format
+#
+#   message := MAGIC_V2 value
+#   value   := tag payload
+#
+#   TAG_OBJECT   fqn:str count:u32 (name:str size:u64 value){count}
+#   TAG_BLOB     fqn:str size:u64 bytes      registered serialize / deserialize
+#   TAG_REF      offset:u64                  the object or blob written at offset
+#   TAG_MESSAGE  size:u64 message            an object as a complete message of its
+#                                            own, copied from where it was read from
+#   TAG_LIST ..  count:u32 value{count}
+#   TAG_DICT ..  count:u32 (value value){count}
+#
+#   TAG_NONE, TAG_TRUE, TAG_FALSE            no payload
+#   TAG_INT      i64
+#   TAG_BIGINT   size:u32 signed big endian  ints outside of the i64 range
+#   TAG_FLOAT    f64
+#   TAG_STR      str
+#   TAG_BYTES    size:u64 bytes
+#   TAG_COMPRESSED_BYTES  size:u64 payload of compression.CompressionPolicy
+#
+#   TAG_PACKED   sequence_tag:u8 kind:u8 count:u32 payload
+#                homogeneous sequences of primitives or UIDs in a single array:
+#                PACKED_INT64 / FLOAT64 / BOOL   count fixed width numbers
+#                PACKED_STR    char lengths:i64{count} size:u64 utf-8 of the joined text
+#                PACKED_UID    16 byte uuids{count}
+#
+#   str := size:u32 utf-8 | STR_REF|offset:u32   the str written at offset
+#
+# Nested values are written inline into the same buffer, so unlike v1 a nested
+# object is never serialized to its own message and copied into its parent.
+# The size in front of every object field allows skipping it without decoding.
+#
+# Objects repeated within one message are written once and referenced after
+# that, by identity or for SHARED_BY_VALUE types by equality. The reader hands
+# out the same instance for every reference. Strings are always shared by value.
+#
+# In lazy mode object fields of at least LAZY_MIN_FIELD_SIZE bytes are left
+# encoded and the reader returns a LazyObject which decodes them on access.
+#
+# Large leaves of a container, like the arrays of a dict of model weights, may be
+# encoded ahead on the parallel_encoding pool. They are still written in order.
+
+TAG_OBJECT = 0x01
+TAG_BLOB = 0x02
+TAG_NONE = 0x03
+TAG_TRUE = 0x04
+TAG_FALSE = 0x05
+TAG_INT = 0x06
+TAG_BIGINT = 0x07
+TAG_FLOAT = 0x08
+TAG_STR = 0x09
+TAG_BYTES = 0x0A
+TAG_PACKED = 0x0B
+TAG_COMPRESSED_BYTES = 0x0C
+TAG_REF = 0x0D
+TAG_MESSAGE = 0x0E
+TAG_LIST = 0x10
+TAG_TUPLE = 0x11
+TAG_SET = 0x12
+TAG_FROZENSET = 0x13
+TAG_DICT = 0x14
+TAG_ORDERED_DICT = 0x15
+
+SEQUENCE_TAGS = {
+    list: TAG_LIST,
+    tuple: TAG_TUPLE,
+    set: TAG_SET,
+    frozenset: TAG_FROZENSET,
+}
+SEQUENCE_TYPES = {tag: sequence_type for sequence_type, tag in SEQUENCE_TAGS.items()}
+
+MAPPING_TAGS = {
+    dict: TAG_DICT,
+    OrderedDict: TAG_ORDERED_DICT,
+}
+MAPPING_TYPES = {tag: mapping_type for mapping_type, tag in MAPPING_TAGS.items()}
+
+PACKED_INT64 = 0x01
+PACKED_FLOAT64 = 0x02
+PACKED_BOOL = 0x03
+PACKED_STR = 0x04
+PACKED_UID = 0x05
+
+PACKED_KINDS = {
+    int: PACKED_INT64,
+    float: PACKED_FLOAT64,
+    bool: PACKED_BOOL,
+    str: PACKED_STR,
+}
+PACKED_DTYPES = {
+    PACKED_INT64: np.dtype("<i8"),
+    PACKED_FLOAT64: np.dtype("<f8"),
+    PACKED_BOOL: np.dtype("?"),
+}
+# shorter sequences are cheaper to write element by element
+MIN_PACKED_LENGTH = 8
+UUID_SIZE = 16
+
+# immutable types, equal instances are written once and shared
+SHARED_BY_VALUE = {
+    "syft.types.uid.UID",
+    "syft.types.uid.LineageID",
+    "syft.node.credentials.SyftVerifyKey",
+    "syft.node.credentials.SyftSigningKey",
+    "nacl.signing.VerifyKey",
+    "nacl.signing.SigningKey",
+}
+STR_REF = 0x80000000
+# primitives which are never worth encoding in parallel, unlike bytes
+SCALAR_TYPES = frozenset([type(None), bool, int, float, str])
+
+U32 = struct.Struct("<I")
+U64 = struct.Struct("<Q")
+I64 = struct.Struct("<q")
+F64 = struct.Struct("<d")
+
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+
+MISSING = object()
+
+
+def leaf_serializer(obj: Any) -> Optional[Callable]:
+    """The function encoding obj if it can be a large leaf, otherwise None."""
+    if type(obj) is bytes:
+        return compression_policy.compress
+    if not hasattr(type(obj), "nbytes"):
+        # not array like
+        return None
+    entry = TYPE_BANK.get(get_fully_qualified_name(obj), None)
+    if entry is None or not entry[0]:
+        return None
+    return entry[1]
+
+
+class FlatWriter:
+    def __init__(self) -> None:
+        self.buffer = bytearray(MAGIC_V2)
+        # offsets of the objects and strs written so far
+        self.shared: Dict[Any, int] = {}
+        self.strs: Dict[str, int] = {}
+        # keeps objects created by serialize transforms alive, so their ids
+        # can not be reused within this message
+        self.pinned: List[Any] = []
+        # payloads of large leaves being encoded on the parallel_encoding pool
+        self.encoding: Dict[int, Future] = {}
+        # containers whose leaves were already submitted
+        self.scanned: Set[int] = set()
+        self.leaf_serializers: Dict[type, Optional[Callable]] = {}
+
+    def getvalue(self) -> bytes:
+        return bytes(self.buffer)
+
+    def write_str(self, value: str) -> None:
+        offset = self.strs.get(value, None)
+        if offset is not None:
+            self.buffer += U32.pack(STR_REF | offset)
+            return
+
+        encoded = value.encode()
+        if len(encoded) >= STR_REF:
+            raise ValueError(f"Cant serialize str of {len(encoded)} bytes")
+        if len(self.buffer) < STR_REF:
+            self.strs[value] = len(self.buffer)
+        self.buffer += U32.pack(len(encoded))
+        self.buffer += encoded
+
+    def write(self, obj: Any) -> None:
+        obj_type = type(obj)
+
+        # exact type checks, subclasses like IntEnum go through the TYPE_BANK
+        primitive_writer = PRIMITIVE_WRITERS.get(obj_type, None)
+        if primitive_writer is not None:
+            primitive_writer(self, obj)
+            return
+
+        tag = SEQUENCE_TAGS.get(obj_type, None)
+        if tag is not None:
+            self.write_sequence(tag, obj)
+            return
+
+        tag = MAPPING_TAGS.get(obj_type, None)
+        if tag is not None:
+            self.write_mapping(tag, obj)
+            return
+
+        self.write_registered(obj)
+
+    def write_none(self, obj: None) -> None:
+        self.buffer.append(TAG_NONE)
+
+    def write_bool(self, obj: bool) -> None:
+        self.buffer.append(TAG_TRUE if obj else TAG_FALSE)
+
+    def write_int(self, obj: int) -> None:
+        if INT64_MIN <= obj <= INT64_MAX:
+            self.buffer.append(TAG_INT)
+            self.buffer += I64.pack(obj)
+        else:
+            encoded = obj.to_bytes((obj.bit_length() + 7) // 8 + 1, "big", signed=True)
+            self.buffer.append(TAG_BIGINT)
+            self.buffer += U32.pack(len(encoded))
+            self.buffer += encoded
+
+    def write_float(self, obj: float) -> None:
+        self.buffer.append(TAG_FLOAT)
+        self.buffer += F64.pack(obj)
+
+    def write_tagged_str(self, obj: str) -> None:
+        self.buffer.append(TAG_STR)
+        self.write_str(obj)
+
+    def encode_leaves(self, values: Collection) -> None:
+        if not parallel_encoding.enabled:
+            return
+
+        leaves: List[Any] = []
+        self.collect_leaves(values, leaves)
+        total_size = sum(size for size, _, _ in leaves)
+        if len(leaves) < 2 or total_size < parallel_encoding.min_total_size:
+            return
+
+        for _, obj, serialize in leaves:
+            if id(obj) not in self.encoding:
+                self.encoding[id(obj)] = parallel_encoding.submit(serialize, obj)
+                self.pinned.append(obj)
+
+    def collect_leaves(self, values: Collection, leaves: List[Any]) -> None:
+        if SCALAR_TYPES.issuperset(map(type, values)):
+            return
+
+        for value in values:
+            value_type = type(value)
+            if value_type in SCALAR_TYPES:
+                continue
+            if value_type in SEQUENCE_TAGS or value_type in MAPPING_TAGS:
+                # nested containers, e.g. the layers of model params
+                if id(value) not in self.scanned:
+                    self.scanned.add(id(value))
+                    self.collect_leaves(
+                        value.values() if value_type in MAPPING_TAGS else value,
+                        leaves,
+                    )
+                continue
+
+            serialize = self.leaf_serializers.get(value_type, MISSING)
+            if serialize is MISSING:
+                serialize = leaf_serializer(value)
+                self.leaf_serializers[value_type] = serialize
+            if serialize is None:
+                continue
+
+            size = leaf_size(value)
+            if size < parallel_encoding.min_leaf_size:
+                continue
+            if id(value) in self.encoding or id(value) in self.shared:
+                continue
+            leaves.append((size, value, serialize))
+
+    def write_bytes(self, obj: bytes) -> None:
+        future = self.encoding.pop(id(obj), None)
+        if future is not None:
+            payload = future.result()
+        elif len(obj) >= compression_policy.min_size:
+            payload = compression_policy.compress(obj)
+        else:
+            payload = obj
+
+        if payload is not obj:
+            self.buffer.append(TAG_COMPRESSED_BYTES)
+            self.buffer += U64.pack(len(payload))
+            self.buffer += payload
+            return
+
+        self.buffer.append(TAG_BYTES)
+        self.buffer += U64.pack(len(obj))
+        self.buffer += obj
+
+    def write_sequence(self, tag: int, values: Collection) -> None:
+        if len(values) >= MIN_PACKED_LENGTH and self.write_packed(tag, values):
+            return
+
+        if id(values) not in self.scanned:
+            self.encode_leaves(values)
+
+        self.buffer.append(tag)
+        self.buffer += U32.pack(len(values))
+        for value in values:
+            self.write(value)
+
+    def write_packed(self, tag: int, values: Collection) -> bool:
+        # relative
+        from ..types.uid import UID
+
+        element_types = set(map(type, values))
+        if len(element_types) != 1:
+            return False
+        element_type = element_types.pop()
+
+        if element_type is UID:
+            kind = PACKED_UID
+            payload = b"".join([uid.value.bytes for uid in values])
+        else:
+            kind = PACKED_KINDS.get(element_type, None)
+            if kind is None:
+                return False
+
+            if kind == PACKED_STR:
+                lengths = np.fromiter(map(len, values), dtype="<i8", count=len(values))
+                text = "".join(values).encode()
+                payload = lengths.tobytes() + U64.pack(len(text)) + text
+            else:
+                try:
+                    payload = np.fromiter(
+                        values, dtype=PACKED_DTYPES[kind], count=len(values)
+                    ).tobytes()
+                except OverflowError:
+                    # ints beyond int64 are written one by one
+                    return False
+
+        self.buffer.append(TAG_PACKED)
+        self.buffer.append(tag)
+        self.buffer.append(kind)
+        self.buffer += U32.pack(len(values))
+        self.buffer += payload
+        return True
+
+    def write_mapping(self, tag: int, mapping: Mapping) -> None:
+        if id(mapping) not in self.scanned:
+            self.encode_leaves(mapping.values())
+
+        self.buffer.append(tag)
+        self.buffer += U32.pack(len(mapping))
+        for key, value in mapping.items():
+            self.write(key)
+            self.write(value)
+
+    def write_registered(self, obj: Any) -> None:
+        if type(obj) is LazyObject:
+            obj = obj._lazy_materialize()
+
+        fqn = get_fully_qualified_name(obj)
+        entry = TYPE_BANK.get(fqn, None)
+        if entry is None:
+            raise Exception(f"{fqn} not in TYPE_BANK")
+
+        key = (fqn, obj) if fqn in SHARED_BY_VALUE else id(obj)
+        offset = self.shared.get(key, None)
+        if offset is not None:
+            self.buffer.append(TAG_REF)
+            self.buffer += U64.pack(offset)
+            return
+
+        offset = len(self.buffer)
+        (
+            nonrecursive,
+            serialize,
+            deserialize,
+            attribute_list,
+            serde_overrides,
+            cls,
+            field_plan,
+        ) = entry
+
+        message = encoding_of(obj, SERDE_VERSION_2)
+        if message is not None:
+            self.buffer.append(TAG_MESSAGE)
+            self.buffer += U64.pack(len(message))
+            self.buffer += message
+        elif nonrecursive or isinstance(obj, type):
+            if serialize is None:
+                raise Exception(
+                    f"Cant serialize {type(obj)} nonrecursive without serialize."
+                )
+            future = self.encoding.pop(id(obj), None)
+            self.write_blob(fqn, serialize(obj) if future is None else future.result())
+        else:
+            self.write_fields(fqn, obj, serde_overrides, field_plan)
+
+        self.shared[key] = offset
+        self.pinned.append(obj)
+
+    def write_fields(
+        self,
+        fqn: str,
+        obj: Any,
+        serde_overrides: Dict[str, Any],
+        field_plan: Any,
+    ) -> None:
+        if field_plan is None:
+            field_plan = compile_field_plan(obj.__dict__.keys(), serde_overrides)
+
+        fields = []
+        for attr_name, serialize_transform, _ in field_plan:
+            try:
+                field_obj = getattr(obj, attr_name)
+            except AttributeError:
+                raise ValueError(
+                    f"{attr_name} on {type(obj)} does not exist, serialization aborted!"
+                )
+
+            if serialize_transform is not None:
+                field_obj = serialize_transform(field_obj)
+
+            if isinstance(field_obj, types.FunctionType):
+                continue
+            fields.append((attr_name, field_obj))
+
+        if len(fields) > 1:
+            self.encode_leaves([field_obj for _, field_obj in fields])
+
+        buffer = self.buffer
+        buffer.append(TAG_OBJECT)
+        self.write_str(fqn)
+        buffer += U32.pack(len(fields))
+        for attr_name, field_obj in fields:
+            self.write_str(attr_name)
+            size_offset = len(buffer)
+            buffer += U64.pack(0)
+            self.write(field_obj)
+            U64.pack_into(buffer, size_offset, len(buffer) - size_offset - U64.size)
+
+    def write_blob(self, fqn: str, data: Union[bytes, List[Any]]) -> None:
+        self.buffer.append(TAG_BLOB)
+        self.write_str(fqn)
+        if type(data) is list:
+            # large payloads come in parts to be copied only once, into the message
+            self.buffer += U64.pack(sum(memoryview(part).nbytes for part in data))
+            for part in data:
+                self.buffer += part
+            return
+        self.buffer += U64.pack(len(data))
+        self.buffer += data
+
+
+PRIMITIVE_WRITERS = {
+    type(None): FlatWriter.write_none,
+    bool: FlatWriter.write_bool,
+    int: FlatWriter.write_int,
+    float: FlatWriter.write_float,
+    str: FlatWriter.write_tagged_str,
+    bytes: FlatWriter.write_bytes,
+}
+
+
+class FlatReader:
+    def __init__(
+        self,
+        blob: Union[bytes, bytearray, memoryview],
+        offset: int = len(MAGIC_V2),
+        shared: Optional[Dict[int, Any]] = None,
+        lazy: bool = False,
+    ) -> None:
+        self.view = memoryview(blob)
+        self.offset = offset
+        # objects and blobs read so far by offset, the targets of TAG_REF
+        self.shared: Dict[int, Any] = {} if shared is None else shared
+        self.lazy = lazy
+
+    def read_at(self, offset: int) -> Any:
+        return FlatReader(self.view, offset, self.shared, self.lazy).read()
+
+    def read_u32(self) -> int:
+        value = U32.unpack_from(self.view, self.offset)[0]
+        self.offset += U32.size
+        return value
+
+    def read_u64(self) -> int:
+        value = U64.unpack_from(self.view, self.offset)[0]
+        self.offset += U64.size
+        return value
+
+    def read_view(self, size: int) -> memoryview:
+        start = self.offset
+        self.offset += size
+        return self.view[start : self.offset]  # noqa: E203
+
+    def read_str(self) -> str:
+        size = self.read_u32()
+        if size & STR_REF:
+            start = (size ^ STR_REF) + U32.size
+            size = U32.unpack_from(self.view, start - U32.size)[0]
+            return str(self.view[start : start + size], "utf-8")  # noqa: E203
+        return str(self.read_view(size), "utf-8")
+
+    def read(self) -> Any:
+        tag = self.view[self.offset]
+        self.offset += 1
+
+        if tag == TAG_STR:
+            return self.read_str()
+
+        if tag == TAG_INT:
+            value = I64.unpack_from(self.view, self.offset)[0]
+            self.offset += I64.size
+            return value
+
+        if tag == TAG_OBJECT:
+            return self.read_object()
+
+        if tag == TAG_NONE:
+            return None
+
+        if tag == TAG_TRUE:
+            return True
+
+        if tag == TAG_FALSE:
+            return False
+
+        if tag == TAG_FLOAT:
+            value = F64.unpack_from(self.view, self.offset)[0]
+            self.offset += F64.size
+            return value
+
+        if tag == TAG_BYTES:
+            return self.read_view(self.read_u64()).tobytes()
+
+        if tag == TAG_BIGINT:
+            return int.from_bytes(self.read_view(self.read_u32()), "big", signed=True)
+
+        if tag == TAG_BLOB:
+            return self.read_blob()
+
+        if tag == TAG_REF:
+            return self.read_ref()
+
+        if tag == TAG_COMPRESSED_BYTES:
+            return decompress(self.read_view(self.read_u64()))
+
+        if tag == TAG_PACKED:
+            return self.read_packed()
+
+        if tag == TAG_MESSAGE:
+            return self.read_message()
+
+        sequence_type = SEQUENCE_TYPES.get(tag, None)
+        if sequence_type is not None:
+            return sequence_type([self.read() for _ in range(self.read_u32())])
+
+        mapping_type = MAPPING_TYPES.get(tag, None)
+        if mapping_type is not None:
+            return mapping_type(
+                [(self.read(), self.read()) for _ in range(self.read_u32())]
+            )
+
+        raise ValueError(f"Unknown serde tag {tag} at offset {self.offset - 1}")
+
+    def read_ref(self) -> Any:
+        target = self.read_u64()
+        if target in self.shared:
+            return self.shared[target]
+
+        # the first occurrence was skipped, read it now
+        offset = self.offset
+        self.offset = target
+        value = self.read()
+        self.offset = offset
+        return value
+
+    def read_object(self) -> Any:
+        start = self.offset - 1
+        fqn = self.read_str()
+        if start in self.shared:
+            # already read through a reference while this field was skipped
+            for _ in range(self.read_u32()):
+                self.read_str()
+                self.offset += self.read_u64()
+            return self.shared[start]
+
+        entry = TYPE_BANK.get(fqn, None)
+        if entry is None:
+            raise Exception(f"{fqn} not in TYPE_BANK")
+
+        decoders = field_decoders(entry[6], entry[4])
+        class_type, constructor = resolve_class(fqn, entry[5])
+
+        kwargs = {}
+        encoded = {}
+        for _ in range(self.read_u32()):
+            attr_name = self.read_str()
+            size = self.read_u64()
+            if self.lazy and size >= LAZY_MIN_FIELD_SIZE:
+                encoded[attr_name] = self.offset
+                self.offset += size
+                continue
+
+            attr_value = self.read()
+            deserialize_transform = decoders.get(attr_name, None)
+
+            if deserialize_transform is not None:
+                attr_value = deserialize_transform(attr_value)
+            kwargs[attr_name] = attr_value
+
+        if encoded:
+
+            def decode(attr_name: str, offset: int) -> Any:
+                attr_value = self.read_at(offset)
+                deserialize_transform = decoders.get(attr_name, None)
+                if deserialize_transform is not None:
+                    attr_value = deserialize_transform(attr_value)
+                return attr_value
+
+            def construct(kwargs: Dict[str, Any]) -> Any:
+                return constructor(class_type, fqn, kwargs)
+
+            obj = LazyObject(class_type, kwargs, encoded, decode, construct)
+        else:
+            obj = constructor(class_type, fqn, kwargs)
+        self.shared[start] = obj
+        return obj
+
+    def read_message(self) -> Any:
+        start = self.offset - 1
+        message = self.read_view(self.read_u64())
+        if start in self.shared:
+            return self.shared[start]
+
+        # offsets within the message are relative to its own start
+        obj = FlatReader(message, lazy=self.lazy).read()
+        self.shared[start] = obj
+        return obj
+
+    def read_packed(self) -> Collection:
+        sequence_type = SEQUENCE_TYPES[self.view[self.offset]]
+        kind = self.view[self.offset + 1]
+        self.offset += 2
+        count = self.read_u32()
+
+        if kind == PACKED_STR:
+            lengths = np.frombuffer(
+                self.view, dtype="<i8", count=count, offset=self.offset
+            )
+            self.offset += lengths.nbytes
+            text = str(self.read_view(self.read_u64()), "utf-8")
+            ends = np.cumsum(lengths).tolist()
+            values = [text[start:end] for start, end in zip([0] + ends, ends)]
+        elif kind == PACKED_UID:
+            # relative
+            from ..types.uid import UID
+
+            fqn = "syft.types.uid.UID"
+            class_type, constructor = resolve_class(fqn, UID)
+            data = self.read_view(count * UUID_SIZE).tobytes()
+            values = [
+                constructor(
+                    class_type,
+                    fqn,
+                    {"value": uuid.UUID(bytes=data[start : start + UUID_SIZE])},
+                )
+                for start in range(0, len(data), UUID_SIZE)
+            ]
+        else:
+            dtype = PACKED_DTYPES[kind]
+            array = np.frombuffer(
+                self.view, dtype=dtype, count=count, offset=self.offset
+            )
+            self.offset += array.nbytes
+            values = array.tolist()
+
+        return values if sequence_type is list else sequence_type(values)
+
+    def read_blob(self) -> Any:
+        start = self.offset - 1
+        fqn = self.read_str()
+        if start in self.shared:
+            self.offset += self.read_u64()
+            return self.shared[start]
+
+        entry = TYPE_BANK.get(fqn, None)
+        if entry is None:
+            raise Exception(f"{fqn} not in TYPE_BANK")
+
+        deserialize = entry[2]
+        if deserialize is None:
+            raise Exception(f"Cant deserialize {fqn} nonrecursive without deserialize.")
+        # deserializers get a view into the message, not a copy of their bytes
+        obj = deserialize(self.read_view(self.read_u64()))
+        self.shared[start] = obj
+        return obj
+
+
+def flat_serialize(obj: Any) -> bytes:
+    writer = FlatWriter()
+    writer.write(obj)
+    return writer.getvalue()
+
+
+def flat_deserialize(
+    blob: Union[bytes, bytearray, memoryview], lazy: bool = False
+) -> Any:
+    return FlatReader(blob, lazy=lazy).read()
@@ -0,0 +1,127 @@
+# stdlib
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+
+# fields encoded in fewer bytes are decoded right away
+LAZY_MIN_FIELD_SIZE = 1024
+
+
+def is_class_metadata(class_type: type, name: str) -> bool:
+    if not (name.startswith("__") and name.endswith("__")):
+        return False
+    if name in ("__dict__", "__weakref__"):
+        return False
+    return hasattr(class_type, name) and not callable(getattr(class_type, name))
+
+
+class LazyObject:
+    """Stands in for a deserialized object whose larger fields are still encoded.
+
+    Fields are decoded from the message on first access. Anything else, like
+    calling a method or setting an attribute, constructs the real object from
+    all of its fields and forwards to it from then on. isinstance checks see the
+    class of the real object.
+    """
+
+    __slots__ = (
+        "_lazy_class",
+        "_lazy_fields",
+        "_lazy_encoded",
+        "_lazy_decode",
+        "_lazy_construct",
+        "_lazy_obj",
+    )
+
+    def __init__(
+        self,
+        class_type: type,
+        fields: Dict[str, Any],
+        encoded: Dict[str, int],
+        decode: Callable[[str, int], Any],
+        construct: Callable[[Dict[str, Any]], Any],
+    ) -> None:
+        object.__setattr__(self, "_lazy_class", class_type)
+        object.__setattr__(self, "_lazy_fields", fields)
+        # offsets of the fields not decoded yet
+        object.__setattr__(self, "_lazy_encoded", encoded)
+        object.__setattr__(self, "_lazy_decode", decode)
+        object.__setattr__(self, "_lazy_construct", construct)
+        object.__setattr__(self, "_lazy_obj", None)
+
+    @property  # type: ignore
+    def __class__(self) -> type:
+        return self._lazy_class
+
+    def _lazy_field(self, name: str) -> Any:
+        value = self._lazy_decode(name, self._lazy_encoded.pop(name))
+        self._lazy_fields[name] = value
+        return value
+
+    def _lazy_materialize(self) -> Any:
+        obj = self._lazy_obj
+        if obj is None:
+            for name in list(self._lazy_encoded):
+                self._lazy_field(name)
+            obj = self._lazy_construct(self._lazy_fields)
+            object.__setattr__(self, "_lazy_obj", obj)
+        return obj
+
+    def __getattr__(self, name: str) -> Any:
+        if self._lazy_obj is None:
+            if name in self._lazy_fields:
+                return self._lazy_fields[name]
+            if name in self._lazy_encoded:
+                return self._lazy_field(name)
+            if is_class_metadata(self._lazy_class, name):
+                # e.g. __fields__, which pydantic checks in isinstance
+                return getattr(self._lazy_class, name)
+        return getattr(self._lazy_materialize(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._lazy_materialize(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._lazy_materialize(), name)
+
+    def __repr__(self) -> str:
+        return repr(self._lazy_materialize())
+
+    def __str__(self) -> str:
+        return str(self._lazy_materialize())
+
+    def __eq__(self, other: Any) -> bool:
+        return self._lazy_materialize() == materialize(other)
+
+    def __hash__(self) -> int:
+        return hash(self._lazy_materialize())
+
+    def __bool__(self) -> bool:
+        return bool(self._lazy_materialize())
+
+    def __len__(self) -> int:
+        return len(self._lazy_materialize())
+
+    def __iter__(self) -> Iterator:
+        return iter(self._lazy_materialize())
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._lazy_materialize()[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._lazy_materialize()[key] = value
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._lazy_materialize()
+
+    def __dir__(self) -> Iterable[str]:
+        return dir(self._lazy_materialize())
+
+
+def materialize(obj: Any) -> Any:
+    """Returns the real object behind a LazyObject, anything else as it is."""
+    if type(obj) is LazyObject:
+        return obj._lazy_materialize()
+    return obj
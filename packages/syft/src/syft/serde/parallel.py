@@ -0,0 +1,95 @@
+# stdlib
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import os
+import threading
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+KiB = 1024
+MiB = 1024 * KiB
+
+
+def leaf_size(obj: Any) -> int:
+    """Size of the data of an array like leaf, 0 for anything else."""
+    if type(obj) is bytes:
+        return len(obj)
+    # looked up on the class first, objects may compute missing attributes
+    if not hasattr(type(obj), "nbytes"):
+        return 0
+    nbytes = obj.nbytes
+    return nbytes if type(nbytes) is int else 0
+
+
+class ParallelEncoding:
+    """Encodes the large leaves of a container concurrently.
+
+    Arrays and other blobs serialized by a registered serialize function mostly
+    spend their time in numpy, Arrow and compression code which releases the
+    GIL. A container holding at least min_total_size bytes in leaves of
+    min_leaf_size bytes or more has those leaves encoded on a thread pool
+    before it is written. The message itself is still written in order, so it
+    is the same as when encoded sequentially.
+
+    Args:
+        max_workers (Optional[int]): threads of the pool, by default one per
+            CPU up to 8. With fewer than 2 leaves are always encoded in place.
+        min_leaf_size (int): smallest leaf encoded on the pool
+        min_total_size (int): smallest total size of the large leaves of a
+            container worth using the pool for
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        min_leaf_size: int = 1 * MiB,
+        min_total_size: int = 8 * MiB,
+    ) -> None:
+        self.max_workers = (
+            min(8, os.cpu_count() or 1) if max_workers is None else max_workers
+        )
+        self.min_leaf_size = min_leaf_size
+        self.min_total_size = min_total_size
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_workers > 1
+
+    def configure(
+        self,
+        max_workers: Optional[int] = None,
+        min_leaf_size: Optional[int] = None,
+        min_total_size: Optional[int] = None,
+    ) -> None:
+        """Changes the given settings, replacing the pool if it was resized."""
+        with self._lock:
+            if max_workers is not None and max_workers != self.max_workers:
+                self.max_workers = max_workers
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
+                    self._executor = None
+            if min_leaf_size is not None:
+                self.min_leaf_size = min_leaf_size
+            if min_total_size is not None:
+                self.min_total_size = min_total_size
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="syft-serde"
+                )
+            return self._executor
+
+    def submit(self, serialize: Callable[[Any], Any], obj: Any) -> Future:
+        # serializers nesting messages have to see the serde version of the caller
+        context = contextvars.copy_context()
+        return self.executor.submit(context.run, serialize, obj)
+
+
+parallel_encoding = ParallelEncoding()
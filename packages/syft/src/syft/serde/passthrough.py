@@ -0,0 +1,247 @@
+# stdlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from enum import Enum
+import types
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+# third party
+import numpy as np
+
+# relative
+from ..util.util import get_fully_qualified_name
+from .wire_format import serde_version_of
+
+# the slot objects keep the message they were decoded from in, see SyftObject
+ENCODING_SLOT = "_syft_encoding"
+
+# values of these types are unchanged when equal, even if replaced
+IMMUTABLE_TYPES = {
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    datetime,
+    date,
+    time,
+    timedelta,
+}
+
+# kinds of snapshots, see snapshot_of
+VALUE = 0
+SAME = 1
+SEQUENCE = 2
+MAPPING = 3
+OBJECT = 4
+
+# stands for a field an object does not have
+MISSING = object()
+
+# type -> descriptor of its encoding slot, None for types without one
+SLOTS: Dict[type, Any] = {}
+
+_reuse_encodings: ContextVar[bool] = ContextVar("reuse_encodings", default=True)
+
+
+class Untracked(Exception):
+    """Raised for values whose changes can not be detected."""
+
+
+def encoding_slot(cls: type) -> Any:
+    slot = SLOTS.get(cls, MISSING)
+    if slot is MISSING:
+        slot = getattr(cls, ENCODING_SLOT, None)
+        if not isinstance(slot, types.MemberDescriptorType):
+            slot = None
+        SLOTS[cls] = slot
+    return slot
+
+
+def is_value(value: Any) -> bool:
+    # relative
+    from .flat import SHARED_BY_VALUE
+
+    return (
+        type(value) in IMMUTABLE_TYPES
+        or isinstance(value, Enum)
+        or get_fully_qualified_name(value) in SHARED_BY_VALUE
+    )
+
+
+def is_frozen_array(value: np.ndarray) -> bool:
+    # a read only view of an immutable buffer, like the message it was decoded from
+    if value.flags.writeable:
+        return False
+    base = value
+    while isinstance(base, np.ndarray):
+        base = base.base
+    if isinstance(base, memoryview):
+        return base.readonly
+    return type(base) is bytes
+
+
+def snapshot_of(value: Any, active: Optional[Set[int]] = None) -> Tuple:
+    """What is needed to tell later if value was changed, in place or not.
+
+    Immutable values are kept as they are, containers and serializable
+    objects as the snapshots of their items and fields. Types and frozen
+    arrays can only be replaced, so they are kept by identity.
+
+    Raises:
+        Untracked: if value holds anything else, e.g. a writable array
+    """
+    # relative
+    from .recursive import TYPE_BANK
+
+    if value is MISSING or isinstance(value, (type, types.FunctionType)):
+        return (SAME, value)
+
+    value_type = type(value)
+    if is_value(value):
+        return (VALUE, value_type, value)
+    if value_type in (set, frozenset) and all(map(is_value, value)):
+        return (VALUE, value_type, frozenset(value))
+    if value_type is np.ndarray and is_frozen_array(value):
+        return (SAME, value)
+
+    active = set() if active is None else active
+    if id(value) in active:
+        # a cycle
+        raise Untracked(value_type)
+    active.add(id(value))
+    try:
+        if value_type in (list, tuple):
+            items = tuple(snapshot_of(item, active) for item in value)
+            return (SEQUENCE, value_type, items)
+        if value_type is dict:
+            items = tuple(
+                (snapshot_of(key, active), snapshot_of(item, active))
+                for key, item in value.items()
+            )
+            return (MAPPING, value_type, items)
+
+        entry = TYPE_BANK.get(get_fully_qualified_name(value), None)
+        if entry is None or entry[0]:
+            # nonrecursive types are encoded as a whole by their own serialize
+            raise Untracked(value_type)
+        field_plan = entry[6]
+        if field_plan is None:
+            names = tuple(sorted(value.__dict__))
+        else:
+            names = tuple(attr_name for attr_name, _, _ in field_plan)
+        items = tuple(
+            snapshot_of(getattr(value, attr_name, MISSING), active)
+            for attr_name in names
+        )
+        return (OBJECT, value_type, names, items, field_plan is None)
+    finally:
+        active.discard(id(value))
+
+
+def is_unchanged(value: Any, snapshot: Tuple) -> bool:
+    """Whether value still is what snapshot was taken of."""
+    kind = snapshot[0]
+    if kind == SAME:
+        return value is snapshot[1]
+    if type(value) is not snapshot[1]:
+        return False
+    if kind == VALUE:
+        return value == snapshot[2]
+
+    items = snapshot[2] if kind != OBJECT else snapshot[3]
+    if kind == SEQUENCE:
+        return len(value) == len(items) and all(map(is_unchanged, value, items))
+    if kind == MAPPING:
+        return len(value) == len(items) and all(
+            is_unchanged(key, key_snapshot) and is_unchanged(item, item_snapshot)
+            for (key, item), (key_snapshot, item_snapshot) in zip(value.items(), items)
+        )
+
+    names = snapshot[2]
+    if snapshot[4] and tuple(sorted(value.__dict__)) != names:
+        return False
+    return all(
+        is_unchanged(getattr(value, attr_name, MISSING), item)
+        for attr_name, item in zip(names, items)
+    )
+
+
+def remember_encoding(obj: Any, message: Union[bytes, memoryview]) -> None:
+    """Records the message obj was just deserialized from.
+
+    As long as obj is not changed, serializing it again with the same serde
+    version copies the message instead of encoding obj, see encoding_of. The
+    message is kept on obj itself, so it lives exactly as long as obj. Objects
+    without an encoding slot or holding values whose changes can not be
+    detected are ignored.
+
+    Args:
+        obj (Any): object deserialized from message
+        message (Union[bytes, memoryview]): serialized object, e.g. a store row
+    """
+    slot = encoding_slot(type(obj))
+    if slot is None:
+        return
+    try:
+        snapshot = snapshot_of(obj)
+    except Untracked:
+        return
+    slot.__set__(obj, (message, snapshot))
+
+
+def forget_encoding(obj: Any) -> None:
+    """Makes obj be encoded again."""
+    slot = encoding_slot(type(obj))
+    if slot is not None:
+        slot.__set__(obj, None)
+
+
+@contextmanager
+def encode_afresh() -> Iterator[None]:
+    """Encodes every object inside this block instead of copying the message
+    it was read from. Used by stores when writing, so what they persist never
+    depends on the change detection of encoding_of."""
+    token = _reuse_encodings.set(False)
+    try:
+        yield None
+    finally:
+        _reuse_encodings.reset(token)
+
+
+def encoding_of(obj: Any, version: int) -> Optional[Union[bytes, memoryview]]:
+    """The message obj was deserialized from if it is still valid for version.
+
+    The message is valid as long as obj is equal to the snapshot taken when
+    it was decoded: fields replaced by equal immutable values keep it, any
+    other change, also in place like appending to a list field, drops it.
+    """
+    slot = encoding_slot(type(obj))
+    if slot is None or not _reuse_encodings.get():
+        return None
+    try:
+        entry = slot.__get__(obj, type(obj))
+    except AttributeError:
+        return None
+    if entry is None:
+        return None
+
+    message, snapshot = entry
+    if serde_version_of(message) != version:
+        return None
+    if not is_unchanged(obj, snapshot):
+        forget_encoding(obj)
+        return None
+    return message
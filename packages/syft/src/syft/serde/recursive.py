@@ -5,9 +5,13 @@ import threading
 import types
 from typing import Any
 from typing import Callable
+from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Sequence
 from typing import Set
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -22,9 +26,22 @@ import syft as sy
 from ..util.util import get_fully_qualified_name
 from ..util.util import index_syft_by_module_name
 from .capnp import get_capnp_schema
+from .capnp import word_aligned
+from .deserialize import is_trusted_deserialization
 
 TYPE_BANK = {}
 
+# fqn -> (resolved class, constructor) for rs_proto2object
+RESOLVED_CLASSES: Dict[str, Tuple[Type, Callable]] = {}
+
+
+class FieldPlan(tuple):
+    """Ordered (name, serialize transform, deserialize transform) per field,
+    `decoders` holds the deserialize transforms by field name."""
+
+    decoders: Dict[str, Callable]
+
+
 recursive_scheme = get_capnp_schema("recursive_serde.capnp").RecursiveSerde  # type: ignore
 
 
@@ -85,6 +102,11 @@ def recursive_serde_register(
 
     attributes = set(list(attribute_list)) if attribute_list else None
     serde_overrides = getattr(cls, "__serde_overrides__", {})
+    field_plan = (
+        compile_field_plan(attributes, serde_overrides)
+        if attributes is not None
+        else None
+    )
 
     # without fqn duplicate class names overwrite
     TYPE_BANK[fqn] = (
@@ -94,15 +116,64 @@ def recursive_serde_register(
         attributes,
         serde_overrides,
         cls,
+        field_plan,
     )
+    # a re-registered class (e.g. after a module reload) must be resolved again
+    RESOLVED_CLASSES.pop(fqn, None)
+
+
+def compile_field_plan(
+    attributes: Iterable[str], serde_overrides: Dict[str, Sequence[Callable]]
+) -> FieldPlan:
+    """Ordered (name, serialize transform, deserialize transform) per field.
+
+    Computed once per class so the hot path does not need to sort the
+    attributes or look up `__serde_overrides__` for every object."""
+    fields = []
+    for attr_name in sorted(attributes):
+        transforms = serde_overrides.get(attr_name, None)
+        if transforms is None:
+            fields.append((attr_name, None, None))
+        else:
+            fields.append((attr_name, transforms[0], transforms[1]))
+    plan = FieldPlan(fields)
+    plan.decoders = {
+        attr_name: deserialize_transform
+        for attr_name, _, deserialize_transform in fields
+        if deserialize_transform is not None
+    }
+    return plan
+
+
+def field_decoders(
+    field_plan: Optional[FieldPlan], serde_overrides: Dict[str, Sequence[Callable]]
+) -> Dict[str, Callable]:
+    """Deserialize transforms by field name for the decoders."""
+    if field_plan is not None:
+        return field_plan.decoders
+    # classes without a list of attributes have no plan, see recursive_serde_register
+    return {
+        attr_name: transforms[1] for attr_name, transforms in serde_overrides.items()
+    }
 
 
 def chunk_bytes(
-    data: bytes, field_name: Union[str, int], builder: _DynamicStructBuilder
+    data: Union[bytes, List[Any]],
+    field_name: Union[str, int],
+    builder: _DynamicStructBuilder,
 ) -> None:
     CHUNK_SIZE = int(5.12e8)  # capnp max for a List(Data) field
+    # nonrecursive serializers may return a list of buffers to be concatenated
+    if isinstance(data, list):
+        data = b"".join(data)
+    # capnp only accepts bytes for Data fields
+    if not isinstance(data, bytes):
+        data = bytes(data)
     list_size = len(data) // CHUNK_SIZE + 1
     data_lst = builder.init(field_name, list_size)
+    if list_size == 1:
+        data_lst[0] = data
+        return
     END_INDEX = CHUNK_SIZE
     for idx in range(list_size):
         START_INDEX = idx * CHUNK_SIZE
@@ -110,13 +181,18 @@ def chunk_bytes(
         data_lst[idx] = data[START_INDEX:END_INDEX]
 
 
-def combine_bytes(capnp_list: List[bytes]) -> bytes:
-    # TODO: make sure this doesn't copy, perhaps allocate a fixed size buffer
-    # and move the bytes into it as we go
-    bytes_value = b""
-    for value in capnp_list:
-        bytes_value += value
-    return bytes_value
+def combine_bytes(capnp_list: List[bytes]) -> Union[bytes, memoryview]:
+    # almost every field fits into a single chunk, which is returned as is
+    if len(capnp_list) == 1:
+        return capnp_list[0]
+
+    chunks = list(capnp_list)
+    buffer = memoryview(bytearray(sum(len(chunk) for chunk in chunks)))
+    offset = 0
+    for chunk in chunks:
+        buffer[offset : offset + len(chunk)] = chunk  # noqa: E203
+        offset += len(chunk)
+    return buffer
 
 
 def rs_object2proto(self: Any) -> _DynamicStructBuilder:
@@ -126,7 +202,8 @@ def rs_object2proto(self: Any) -> _DynamicStructBuilder:
 
     msg = recursive_scheme.new_message()
     fqn = get_fully_qualified_name(self)
-    if fqn not in TYPE_BANK:
+    entry = TYPE_BANK.get(fqn, None)
+    if entry is None:
         # third party
         raise Exception(f"{fqn} not in TYPE_BANK")
 
@@ -138,7 +215,8 @@ def rs_object2proto(self: Any) -> _DynamicStructBuilder:
         attribute_list,
         serde_overrides,
         cls,
-    ) = TYPE_BANK[fqn]
+        field_plan,
+    ) = entry
 
     if nonrecursive or is_type:
         if serialize is None:
@@ -148,23 +226,22 @@ def rs_object2proto(self: Any) -> _DynamicStructBuilder:
         chunk_bytes(serialize(self), "nonrecursiveBlob", msg)
         return msg
 
-    if attribute_list is None:
-        attribute_list = self.__dict__.keys()
+    if field_plan is None:
+        field_plan = compile_field_plan(self.__dict__.keys(), serde_overrides)
 
-    msg.init("fieldsName", len(attribute_list))
-    msg.init("fieldsData", len(attribute_list))
+    msg.init("fieldsName", len(field_plan))
+    msg.init("fieldsData", len(field_plan))
 
-    for idx, attr_name in enumerate(sorted(attribute_list)):
-        if not hasattr(self, attr_name):
+    for idx, (attr_name, serialize_transform, _) in enumerate(field_plan):
+        try:
+            field_obj = getattr(self, attr_name)
+        except AttributeError:
             raise ValueError(
                 f"{attr_name} on {type(self)} does not exist, serialization aborted!"
             )
 
-        field_obj = getattr(self, attr_name)
-        transforms = serde_overrides.get(attr_name, None)
-
-        if transforms is not None:
-            field_obj = transforms[0](field_obj)
+        if serialize_transform is not None:
+            field_obj = serialize_transform(field_obj)
 
         if isinstance(field_obj, types.FunctionType):
             continue
@@ -180,28 +257,81 @@ def rs_bytes2object(blob: bytes) -> Any:
     MAX_TRAVERSAL_LIMIT = 2**64 - 1
 
     with recursive_scheme.from_bytes(  # type: ignore
-        blob, traversal_limit_in_words=MAX_TRAVERSAL_LIMIT
+        word_aligned(blob), traversal_limit_in_words=MAX_TRAVERSAL_LIMIT
     ) as msg:
         return rs_proto2object(msg)
 
 
-def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
-    # relative
-    from .deserialize import _deserialize
+def construct_serde_constructor(
+    class_type: Type, fqn: str, kwargs: Dict[str, Any]
+) -> Any:
+    return getattr(class_type, "serde_constructor")(kwargs)
+
+
+def construct_enum(class_type: Type, fqn: str, kwargs: Dict[str, Any]) -> Any:
+    if "value" not in kwargs:
+        return construct_setattr(class_type, fqn, kwargs)
+    return class_type.__new__(class_type, kwargs["value"])  # type: ignore
+
+
+def construct_pydantic(class_type: Type, fqn: str, kwargs: Dict[str, Any]) -> Any:
+    # if we skip the __new__ flow of BaseModel we get the error
+    # AttributeError: object has no attribute '__fields_set__'
+    return class_type(**kwargs)
 
-    # clean this mess, Tudor
-    module_parts = proto.fullyQualifiedName.split(".")
+
+def construct_trusted_pydantic(
+    class_type: Type, fqn: str, kwargs: Dict[str, Any]
+) -> Any:
+    if is_trusted_deserialization():
+        return class_type._syft_construct_trusted(kwargs)
+    return class_type(**kwargs)
+
+
+def construct_user_pydantic(class_type: Type, fqn: str, kwargs: Dict[str, Any]) -> Any:
+    # weird issues with pydantic and ForwardRef on user classes being inited
+    # with custom state args / kwargs
+    obj = class_type()
+    for attr_name, attr_value in kwargs.items():
+        setattr(obj, attr_name, attr_value)
+    return obj
+
+
+def construct_setattr(class_type: Type, fqn: str, kwargs: Dict[str, Any]) -> Any:
+    obj = class_type.__new__(class_type)  # type: ignore
+    for attr_name, attr_value in kwargs.items():
+        setattr(obj, attr_name, attr_value)
+    return obj
+
+
+def constructor_for(class_type: Type, fqn: str) -> Callable:
+    """Pick how rs_proto2object builds an instance of class_type from kwargs."""
+    if hasattr(class_type, "serde_constructor"):
+        return construct_serde_constructor
+    if issubclass(class_type, Enum):
+        return construct_enum
+    if issubclass(class_type, BaseModel):
+        if "syft.user" in fqn:
+            return construct_user_pydantic
+        if getattr(class_type, "_syft_can_construct_trusted", lambda: False)():
+            return construct_trusted_pydantic
+        return construct_pydantic
+    return construct_setattr
+
+
+def lookup_class(fqn: str) -> Type:
+    module_parts = fqn.split(".")
     klass = module_parts.pop()
     class_type: Type = type(None)
 
     if klass != "NoneType":
         try:
-            class_type = index_syft_by_module_name(proto.fullyQualifiedName)  # type: ignore
+            class_type = index_syft_by_module_name(fqn)  # type: ignore
         except Exception:  # nosec
             try:
                 class_type = getattr(sys.modules[".".join(module_parts)], klass)
             except Exception:  # nosec
-                if "syft.user" in proto.fullyQualifiedName:
+                if "syft.user" in fqn:
                     # relative
                     from ..node.node import CODE_RELOADER
 
@@ -211,15 +341,52 @@ def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
                     class_type = getattr(sys.modules[".".join(module_parts)], klass)
                 except Exception:  # nosec
                     pass
+    return class_type
+
 
-    if proto.fullyQualifiedName not in TYPE_BANK:
-        raise Exception(f"{proto.fullyQualifiedName} not in TYPE_BANK")
+def resolve_class(fqn: str, cls: Type) -> Tuple[Type, Callable]:
+    resolved = RESOLVED_CLASSES.get(fqn, None)
+    if resolved is not None:
+        return resolved
 
     # TODO: 🐉 sort this out, basically sometimes the syft.user classes are not in the
     # module name space in sub-processes or threads even though they are loaded on start
     # its possible that the uvicorn awsgi server is preloading a bunch of threads
     # however simply getting the class from the TYPE_BANK doesn't always work and
     # causes some errors so it seems like we want to get the local one where possible
+    class_type = lookup_class(fqn)
+    found = class_type != type(None)
+    if not found:
+        # yes this looks stupid but it works and the opposite breaks
+        class_type = cls
+
+    resolved = (class_type, constructor_for(class_type, fqn))
+    # user code classes missing now may be loaded later, so only found ones are kept
+    if found or "syft.user" not in fqn:
+        RESOLVED_CLASSES[fqn] = resolved
+    return resolved
+
+
+def invalidate_resolved_classes(fqn_prefix: str = "") -> None:
+    """Forget the classes resolved for fqns starting with fqn_prefix, all by default.
+
+    Needed whenever a class is replaced without being registered again, e.g. when
+    user code is loaded into syft.user.
+    """
+    for fqn in list(RESOLVED_CLASSES):
+        if fqn.startswith(fqn_prefix):
+            RESOLVED_CLASSES.pop(fqn, None)
+
+
+def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
+    # relative
+    from .deserialize import _deserialize
+
+    fqn = proto.fullyQualifiedName
+    entry = TYPE_BANK.get(fqn, None)
+    if entry is None:
+        raise Exception(f"{fqn} not in TYPE_BANK")
+
     (
         nonrecursive,
         serialize,
@@ -227,11 +394,8 @@ def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
         attribute_list,
         serde_overrides,
         cls,
-    ) = TYPE_BANK[proto.fullyQualifiedName]
-
-    if class_type == type(None):
-        # yes this looks stupid but it works and the opposite breaks
-        class_type = cls
+        field_plan,
+    ) = entry
 
     if nonrecursive:
         if deserialize is None:
@@ -241,41 +405,21 @@ def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
 
         return deserialize(combine_bytes(proto.nonrecursiveBlob))
 
+    class_type, constructor = resolve_class(fqn, cls)
+
     kwargs = {}
+    decoders = field_decoders(field_plan, serde_overrides)
 
     for attr_name, attr_bytes_list in zip(proto.fieldsName, proto.fieldsData):
         attr_bytes = combine_bytes(attr_bytes_list)
         attr_value = _deserialize(attr_bytes, from_bytes=True)
-        transforms = serde_overrides.get(attr_name, None)
+        deserialize_transform = decoders.get(attr_name, None)
 
-        if transforms is not None:
-            attr_value = transforms[1](attr_value)
+        if deserialize_transform is not None:
+            attr_value = deserialize_transform(attr_value)
         kwargs[attr_name] = attr_value
 
-    if hasattr(class_type, "serde_constructor"):
-        return getattr(class_type, "serde_constructor")(kwargs)
-
-    if issubclass(class_type, Enum) and "value" in kwargs:
-        obj = class_type.__new__(class_type, kwargs["value"])  # type: ignore
-    elif issubclass(class_type, BaseModel):
-        # if we skip the __new__ flow of BaseModel we get the error
-        # AttributeError: object has no attribute '__fields_set__'
-
-        if "syft.user" in proto.fullyQualifiedName:
-            # weird issues with pydantic and ForwardRef on user classes being inited
-            # with custom state args / kwargs
-            obj = class_type()
-            for attr_name, attr_value in kwargs.items():
-                setattr(obj, attr_name, attr_value)
-        else:
-            obj = class_type(**kwargs)
-
-    else:
-        obj = class_type.__new__(class_type)  # type: ignore
-        for attr_name, attr_value in kwargs.items():
-            setattr(obj, attr_name, attr_value)
-
-    return obj
+    return constructor(class_type, fqn, kwargs)
 
 
 # how else do you import a relative file to execute it?
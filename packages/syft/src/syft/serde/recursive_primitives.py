@@ -20,6 +20,7 @@ from typing import cast
 
 # relative
 from .capnp import get_capnp_schema
+from .capnp import word_aligned
 from .recursive import chunk_bytes
 from .recursive import combine_bytes
 from .recursive import recursive_serde_register
@@ -58,7 +59,7 @@ def deserialize_iterable(iterable_type: type, blob: bytes) -> Collection:
     values = []
 
     with iterable_schema.from_bytes(  # type: ignore
-        blob, traversal_limit_in_words=MAX_TRAVERSAL_LIMIT
+        word_aligned(blob), traversal_limit_in_words=MAX_TRAVERSAL_LIMIT
     ) as msg:
         for element in msg.values:
             values.append(_deserialize(combine_bytes(element), from_bytes=True))
@@ -91,7 +92,7 @@ def get_deserialized_kv_pairs(blob: bytes) -> List[Any]:
     pairs = []
 
     with kv_iterable_schema.from_bytes(  # type: ignore
-        blob, traversal_limit_in_words=MAX_TRAVERSAL_LIMIT
+        word_aligned(blob), traversal_limit_in_words=MAX_TRAVERSAL_LIMIT
     ) as msg:
         for key, value in zip(msg.keys, msg.values):
             pairs.append(
@@ -157,7 +158,7 @@ def serialize_type(serialized_type: type) -> bytes:
 
 
 def deserialize_type(type_blob: bytes) -> type:
-    deserialized_type = type_blob.decode()
+    deserialized_type = str(type_blob, "utf-8")
     module_parts = deserialized_type.split(".")
     klass = module_parts.pop()
     klass = "None" if klass == "NoneType" else klass
@@ -175,13 +176,14 @@ recursive_serde_register(
 recursive_serde_register(
     float,
     serialize=lambda x: x.hex().encode(),
-    deserialize=lambda x: float.fromhex(x.decode()),
+    deserialize=lambda x: float.fromhex(str(x, "utf-8")),
 )
 
-recursive_serde_register(bytes, serialize=lambda x: x, deserialize=lambda x: x)
+# deserializers receive any bytes-like object, often a memoryview into the message
+recursive_serde_register(bytes, serialize=lambda x: x, deserialize=bytes)
 
 recursive_serde_register(
-    str, serialize=lambda x: x.encode(), deserialize=lambda x: x.decode()
+    str, serialize=lambda x: x.encode(), deserialize=lambda x: str(x, "utf-8")
 )
 
 recursive_serde_register(
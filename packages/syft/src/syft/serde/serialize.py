@@ -1,16 +1,37 @@
 # stdlib
 from typing import Any
+from typing import Optional
 
 
 def _serialize(
     obj: object,
     to_proto: bool = True,
     to_bytes: bool = False,
+    version: Optional[int] = None,
 ) -> Any:
     # relative
+    from .flat import flat_serialize
+    from .passthrough import encoding_of
     from .recursive import rs_object2proto
+    from .wire_format import SERDE_VERSION_1
+    from .wire_format import get_serde_version
+    from .wire_format import use_serde_version
 
-    proto = rs_object2proto(obj)
+    if version is None:
+        version = get_serde_version()
+
+    if to_bytes and version != SERDE_VERSION_1:
+        return flat_serialize(obj)
+
+    if to_bytes:
+        # v1 nests the message of every field, so it can be reused as it is
+        message = encoding_of(obj, SERDE_VERSION_1)
+        if message is not None:
+            return bytes(message)
+
+    # capnp protos always nest v1 messages
+    with use_serde_version(SERDE_VERSION_1):
+        proto = rs_object2proto(obj)
 
     if to_bytes:
         return proto.to_bytes()
@@ -0,0 +1,119 @@
+# stdlib
+import types
+from typing import Any
+from typing import Collection
+from typing import Dict
+from typing import Mapping
+
+# relative
+from ..util.util import get_fully_qualified_name
+from .flat import MAPPING_TAGS
+from .flat import SEQUENCE_TAGS
+from .lazy import LazyObject
+from .parallel import leaf_size
+from .recursive import TYPE_BANK
+from .recursive import compile_field_plan
+
+# tag plus size of a value, e.g. TAG_BYTES size:u64
+VALUE_HEADER_SIZE = 9
+# upper bound of the .npy header of an array
+ARRAY_HEADER_SIZE = 128
+FIXED_SIZES = {type(None): 1, bool: 1, int: 9, float: 9}
+
+
+class SizeEstimator:
+    """Walks an object like the serde v2 FlatWriter without encoding it.
+
+    Objects are followed along their TYPE_BANK plans. The registered
+    serialize function of a leaf is only called if its size can not be told
+    from its buffers, like the nbytes of arrays or the memory usage of frames.
+    Compression is not taken into account, so the estimate of compressible
+    payloads is an upper bound.
+    """
+
+    def __init__(self) -> None:
+        # ids of the objects counted so far, written as a reference after that
+        self.seen: Dict[int, Any] = {}
+
+    def size(self, obj: Any) -> int:
+        obj_type = type(obj)
+        fixed_size = FIXED_SIZES.get(obj_type, None)
+        if fixed_size is not None:
+            return fixed_size
+        if obj_type is str:
+            return 5 + len(obj)
+        if obj_type is bytes:
+            return VALUE_HEADER_SIZE + len(obj)
+        if obj_type in SEQUENCE_TAGS:
+            return self.size_of_sequence(obj)
+        if obj_type in MAPPING_TAGS:
+            return self.size_of_mapping(obj)
+        return self.size_of_registered(obj)
+
+    def size_of_sequence(self, values: Collection) -> int:
+        return 5 + sum(map(self.size, values))
+
+    def size_of_mapping(self, mapping: Mapping) -> int:
+        return 5 + sum(self.size(k) + self.size(v) for k, v in mapping.items())
+
+    def size_of_registered(self, obj: Any) -> int:
+        if type(obj) is LazyObject:
+            obj = obj._lazy_materialize()
+
+        if id(obj) in self.seen:
+            return VALUE_HEADER_SIZE
+        self.seen[id(obj)] = obj
+
+        fqn = get_fully_qualified_name(obj)
+        entry = TYPE_BANK.get(fqn, None)
+        if entry is None:
+            raise Exception(f"{fqn} not in TYPE_BANK")
+        nonrecursive, serialize, _, _, serde_overrides, _, field_plan = entry
+
+        header_size = 5 + len(fqn) + VALUE_HEADER_SIZE
+        if nonrecursive or isinstance(obj, type):
+            return header_size + self.size_of_leaf(obj, serialize)
+
+        if field_plan is None:
+            field_plan = compile_field_plan(obj.__dict__.keys(), serde_overrides)
+
+        size = header_size
+        for attr_name, serialize_transform, _ in field_plan:
+            field_obj = getattr(obj, attr_name, None)
+            if serialize_transform is not None:
+                field_obj = serialize_transform(field_obj)
+            if isinstance(field_obj, types.FunctionType):
+                continue
+            size += 5 + len(attr_name) + 8 + self.size(field_obj)
+        return size
+
+    def size_of_leaf(self, obj: Any, serialize: Any) -> int:
+        nbytes = leaf_size(obj)
+        if nbytes:
+            return ARRAY_HEADER_SIZE + nbytes
+
+        memory_usage = getattr(obj, "memory_usage", None)
+        if callable(memory_usage):
+            # pandas frames return the usage per column, series a single number.
+            # object columns count a pointer per value, about the size of a str
+            usage = memory_usage(index=True, deep=False)
+            return int(usage.sum() if hasattr(usage, "sum") else usage)
+
+        return len(serialize(obj))
+
+
+def serialized_size(obj: Any) -> int:
+    """Estimates the size of the serde v2 message of obj without serializing it.
+
+    Meant for deciding how to send an object before paying for encoding it.
+    Array and frame data is counted from its buffers, other leaves are
+    serialized on their own. v1 messages are somewhat larger, because every
+    nested object is a capnp message of its own.
+
+    Args:
+        obj (Any): object to estimate
+
+    Returns:
+        int: estimated number of bytes
+    """
+    return SizeEstimator().size(obj)
@@ -0,0 +1,138 @@
+# stdlib
+import struct
+from typing import Any
+from typing import BinaryIO
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Union
+
+# a stream is STREAM_MAGIC size:u64 followed by the serialized message in
+# frames of size:u32 bytes, ended by an empty frame
+STREAM_MAGIC = b"\xfeSS\x01"
+STREAM_HEADER = struct.Struct("<4sQ")
+FRAME_HEADER = struct.Struct("<I")
+DEFAULT_FRAME_SIZE = 4 * 1024 * 1024
+
+
+def serialize_buffer(
+    obj: Any, version: Optional[int] = None
+) -> Union[bytes, memoryview]:
+    """Same message as _serialize(obj, to_bytes=True), without copying it.
+
+    A serde v2 message is returned as a view into the buffer it was written to
+    instead of being copied into a new bytes object.
+    """
+    # relative
+    from .flat import FlatWriter
+    from .serialize import _serialize
+    from .wire_format import SERDE_VERSION_1
+    from .wire_format import get_serde_version
+
+    if version is None:
+        version = get_serde_version()
+
+    if version == SERDE_VERSION_1:
+        return _serialize(obj, to_bytes=True, version=version)
+
+    writer = FlatWriter()
+    writer.write(obj)
+    return memoryview(writer.buffer)
+
+
+def serialize_to(
+    obj: Any,
+    stream: BinaryIO,
+    frame_size: int = DEFAULT_FRAME_SIZE,
+    version: Optional[int] = None,
+) -> int:
+    """Serializes obj into a binary stream like a file or socket.makefile("wb").
+
+    Args:
+        obj (Any): object to serialize
+        stream (BinaryIO): destination, only its write method is used
+        frame_size (int): largest number of bytes written at once
+        version (Optional[int]): serde version, the active one by default
+
+    Returns:
+        int: number of bytes written
+    """
+    message = memoryview(serialize_buffer(obj, version=version))
+    stream.write(STREAM_HEADER.pack(STREAM_MAGIC, len(message)))
+    for start in range(0, len(message), frame_size):
+        frame = message[start : start + frame_size]  # noqa: E203
+        stream.write(FRAME_HEADER.pack(len(frame)))
+        stream.write(frame)
+    stream.write(FRAME_HEADER.pack(0))
+
+    frames = -(-len(message) // frame_size) + 1
+    return STREAM_HEADER.size + frames * FRAME_HEADER.size + len(message)
+
+
+def iter_frames(
+    parts: List[Union[bytes, memoryview]], frame_size: int = DEFAULT_FRAME_SIZE
+) -> Iterator[bytes]:
+    """Yields the concatenated parts in frames of at most frame_size bytes.
+
+    Meant as the body of a chunked HTTP request, only the frame being sent is
+    copied instead of joining all parts into a single body first.
+    """
+    for part in parts:
+        view = memoryview(part).cast("B")
+        for start in range(0, len(view), frame_size):
+            yield bytes(view[start : start + frame_size])  # noqa: E203
+
+
+def read_into(stream: BinaryIO, view: memoryview) -> None:
+    readinto = getattr(stream, "readinto", None)
+    position = 0
+    while position < len(view):
+        if readinto is not None:
+            size = readinto(view[position:])
+        else:
+            data = stream.read(len(view) - position)
+            size = len(data)
+            view[position : position + size] = data  # noqa: E203
+        if not size:
+            raise EOFError(f"Stream ended after {position} of {len(view)} bytes")
+        position += size
+
+
+def deserialize_from(stream: BinaryIO, lazy: bool = False) -> Any:
+    """Deserializes an object written by serialize_to.
+
+    The message is read into a single buffer allocated up front, which the
+    deserialized object may keep views into, e.g. for numpy arrays.
+
+    Args:
+        stream (BinaryIO): source, read with readinto when available
+        lazy (bool): decode large fields on first access, see _deserialize
+
+    Returns:
+        Any: the deserialized object
+    """
+    # relative
+    from .deserialize import _deserialize
+
+    header = bytearray(STREAM_HEADER.size)
+    read_into(stream, memoryview(header))
+    magic, size = STREAM_HEADER.unpack(header)
+    if magic != STREAM_MAGIC:
+        raise ValueError("Not a serialized syft stream")
+
+    message = memoryview(bytearray(size))
+    frame_header = memoryview(bytearray(FRAME_HEADER.size))
+    position = 0
+    while True:
+        read_into(stream, frame_header)
+        (frame_size,) = FRAME_HEADER.unpack(frame_header)
+        if frame_size == 0:
+            break
+        if position + frame_size > size:
+            raise ValueError(f"Stream frames exceed the message size of {size}")
+        read_into(stream, message[position : position + frame_size])  # noqa: E203
+        position += frame_size
+
+    if position != size:
+        raise EOFError(f"Stream ended after {position} of {size} bytes")
+    return _deserialize(message, from_bytes=True, lazy=lazy)
@@ -2,7 +2,15 @@
 from datetime import date
 from datetime import datetime
 from datetime import time
+from datetime import timedelta
+from datetime import timezone
 from io import BytesIO
+import struct
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
 
 # third party
 from dateutil import parser
@@ -14,6 +22,7 @@ from nacl.signing import SigningKey
 from nacl.signing import VerifyKey
 import numpy as np
 from pandas import DataFrame
+from pandas import RangeIndex
 from pandas import Series
 from pandas._libs.tslibs.timestamps import Timestamp
 import pyarrow as pa
@@ -25,21 +34,42 @@ from result import Ok
 from result import Result
 
 # relative
+from .arrow import is_writable_arrays
+from .compression import CODEC_NAMES
+from .compression import CompressionCodec
+from .compression import compression_policy
+from .compression import decompress
 from .deserialize import _deserialize as deserialize
 from .recursive_primitives import recursive_serde_register
 from .recursive_primitives import recursive_serde_register_type
 from .serialize import _serialize as serialize
 
+# DataFrames and Series are written as Arrow IPC files (Feather v2)
+ARROW_IPC_MAGIC = b"ARROW1"
+# rows per record batch, the unit read by row range projections
+ARROW_IPC_BATCH_ROWS = 64 * 1024
+SERIES_METADATA_KEY = b"syft.series_name"
+
+# datetime, time and Timestamp are written as TIME_MARKER, microseconds (nanoseconds
+# for Timestamp) since the epoch or midnight, whether they are timezone aware and
+# their utc offset in microseconds. date is TIME_MARKER and its proleptic ordinal.
+TIME_MARKER = 0xFD
+TIMESTAMP_LAYOUT = struct.Struct("<Bq?q")
+DATE_LAYOUT = struct.Struct("<Bi")
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+ZERO = timedelta(0)
+
 recursive_serde_register(
     SigningKey,
     serialize=lambda x: bytes(x),
-    deserialize=lambda x: SigningKey(x),
+    deserialize=lambda x: SigningKey(bytes(x)),
 )
 
 recursive_serde_register(
     VerifyKey,
     serialize=lambda x: bytes(x),
-    deserialize=lambda x: VerifyKey(x),
+    deserialize=lambda x: VerifyKey(bytes(x)),
 )
 
 
@@ -57,25 +87,141 @@ recursive_serde_register(cls=TypeError)
 recursive_serde_register_type(Collection)
 
 
-def serialize_dataframe(df: DataFrame) -> bytes:
-    table = pa.Table.from_pandas(df)
-    sink = pa.BufferOutputStream()
-    # 🟡 TODO 37: Should we warn about this?
-    parquet_args = {
-        "coerce_timestamps": "us",
-        "allow_truncated_timestamps": True,
-    }
-    pq.write_table(table, sink, **parquet_args)
-    buffer = sink.getvalue()
-    numpy_bytes = buffer.to_pybytes()
-    return numpy_bytes
+def write_arrow_ipc(table: pa.Table) -> bytes:
+    def write(compression: Optional[str]) -> pa.Buffer:
+        sink = pa.BufferOutputStream()
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+        with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+            writer.write_table(table, max_chunksize=ARROW_IPC_BATCH_ROWS)
+        return sink.getvalue()
+
+    # the policy decides on the uncompressed file, the codec is then applied
+    # per buffer so that projections only decompress the columns they read
+    buffer = write(None)
+    codec = compression_policy.choose(buffer)
+    if codec is not CompressionCodec.NONE:
+        compressed = write(CODEC_NAMES[codec])
+        compression_policy.count(codec, buffer.size, compressed.size)
+        buffer = compressed
+    else:
+        compression_policy.count(codec, buffer.size, buffer.size)
+    return buffer.to_pybytes()
+
+
+def read_arrow_ipc(
+    buf: Union[bytes, memoryview],
+    columns: Optional[List[Any]] = None,
+    rows: Optional[Tuple[int, int]] = None,
+) -> pa.Table:
+    source = pa.py_buffer(buf)
+    reader = pa.ipc.open_file(source)
+
+    if columns is not None:
+        pandas_metadata = reader.schema.pandas_metadata or {}
+        field_names = {
+            column["name"]: column["field_name"]
+            for column in pandas_metadata.get("columns", [])
+        }
+        index_columns = [
+            name
+            for name in pandas_metadata.get("index_columns", [])
+            if isinstance(name, str)
+        ]
+        fields = [field_names.get(str(name), str(name)) for name in columns]
+        included_fields = [
+            reader.schema.get_field_index(name) for name in fields + index_columns
+        ]
+        if -1 in included_fields[: len(fields)]:
+            missing = [
+                name for name, index in zip(columns, included_fields) if index == -1
+            ]
+            raise KeyError(f"Columns not found: {missing}")
+        options = pa.ipc.IpcReadOptions(included_fields=included_fields)
+        reader = pa.ipc.open_file(source, options=options)
+
+    if rows is None:
+        return reader.read_all()
+
+    # only read the record batches overlapping the requested rows
+    start, stop = rows
+    batches = []
+    first_row = 0
+    batch_start = 0
+    for i in range(reader.num_record_batches):
+        if batch_start >= stop:
+            break
+        batch = reader.get_batch(i)
+        batch_stop = batch_start + batch.num_rows
+        if batch_stop <= start:
+            first_row = batch_stop
+        else:
+            batches.append(batch)
+        batch_start = batch_stop
+    table = pa.Table.from_batches(batches, schema=reader.schema)
+    return table.slice(start - first_row, stop - start)
+
+
+def arrow_ipc_to_pandas(
+    table: pa.Table, rows: Optional[Tuple[int, int]] = None
+) -> DataFrame:
+    """Converts a decoded table without copying its columns where possible.
+
+    Numeric columns stay read-only views over the message, split blocks keeps
+    pandas from consolidating (copying) them into 2D blocks. Writing to such
+    a frame in place raises, so callers which do either copy the frame or
+    decode inside writable_arrays(), which pays for one copy here instead.
+    """
+    df = table.to_pandas(split_blocks=True)
+    if is_writable_arrays():
+        df = df.copy()
+
+    index_columns = (table.schema.pandas_metadata or {}).get("index_columns", [])
+    if rows is not None and len(index_columns) == 1:
+        # a sliced RangeIndex is not restored by arrow
+        index = index_columns[0]
+        if isinstance(index, dict) and index["kind"] == "range":
+            start = index["start"] + rows[0] * index["step"]
+            df.index = RangeIndex(
+                start,
+                start + len(df) * index["step"],
+                index["step"],
+                name=index["name"],
+            )
+    return df
 
 
-def deserialize_dataframe(buf: bytes) -> DataFrame:
+def serialize_dataframe(df: DataFrame) -> bytes:
+    return write_arrow_ipc(pa.Table.from_pandas(df))
+
+
+def deserialize_dataframe(
+    buf: Union[bytes, memoryview],
+    columns: Optional[List[Any]] = None,
+    rows: Optional[Tuple[int, int]] = None,
+) -> DataFrame:
+    """Decodes a DataFrame, optionally only some of its columns and rows.
+
+    Args:
+        buf (Union[bytes, memoryview]): output of serialize_dataframe
+        columns (Optional[List[Any]]): columns to read, all by default
+        rows (Optional[Tuple[int, int]]): start and stop of the rows to read,
+            all by default. Only the record batches holding them are decoded.
+
+    Returns:
+        DataFrame: the selected part of the DataFrame
+    """
+    buf = decompress(buf)
+    if bytes(buf[: len(ARROW_IPC_MAGIC)]) == ARROW_IPC_MAGIC:
+        table = read_arrow_ipc(buf, columns=columns, rows=rows)
+        return arrow_ipc_to_pandas(table, rows=rows)
+
+    # DataFrames written as parquet by older versions
     reader = pa.BufferReader(buf)
     numpy_bytes = reader.read_buffer()
-    result = pq.read_table(numpy_bytes)
+    result = pq.read_table(numpy_bytes, columns=columns)
     df = result.to_pandas()
+    if rows is not None:
+        df = df.iloc[rows[0] : rows[1]]
     return df
 
 
@@ -87,40 +233,160 @@ recursive_serde_register(
 )
 
 
-def deserialize_series(blob: bytes) -> Series:
+def serialize_series(series: Series) -> bytes:
+    try:
+        table = pa.Table.from_pandas(series.to_frame())
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # e.g. object Series mixing types, which only the older dict encoding
+        # handles, see deserialize_series
+        return serialize(DataFrame(series).to_dict(), to_bytes=True)
+    metadata = {
+        **table.schema.metadata,
+        SERIES_METADATA_KEY: b"unnamed" if series.name is None else b"named",
+    }
+    return write_arrow_ipc(table.replace_schema_metadata(metadata))
+
+
+def deserialize_series(
+    blob: Union[bytes, memoryview], rows: Optional[Tuple[int, int]] = None
+) -> Series:
+    """Decodes a Series, optionally only some of its rows.
+
+    Args:
+        blob (Union[bytes, memoryview]): output of serialize_series
+        rows (Optional[Tuple[int, int]]): start and stop of the rows to read,
+            all by default
+
+    Returns:
+        Series: the selected part of the Series
+    """
+    blob = decompress(blob)
+    if bytes(blob[: len(ARROW_IPC_MAGIC)]) == ARROW_IPC_MAGIC:
+        table = read_arrow_ipc(blob, rows=rows)
+        series = arrow_ipc_to_pandas(table, rows=rows).iloc[:, 0]
+        if table.schema.metadata[SERIES_METADATA_KEY] == b"unnamed":
+            series.name = None
+        return series
+
+    # Series written as a dict by older versions
     df = DataFrame.from_dict(deserialize(blob, from_bytes=True))
-    return df[df.columns[0]]
+    series = df[df.columns[0]]
+    if rows is not None:
+        series = series.iloc[rows[0] : rows[1]]
+    return series
 
 
 recursive_serde_register(
     Series,
-    serialize=lambda x: serialize(DataFrame(x).to_dict(), to_bytes=True),
+    serialize=serialize_series,
     deserialize=deserialize_series,
 )
 
 
+def is_binary_time(blob: Union[bytes, memoryview], layout: struct.Struct) -> bool:
+    # older versions wrote a serialized str or int here, which either starts
+    # with the v2 magic or is a multiple of 8 bytes long as a capnp message
+    return len(blob) == layout.size and blob[0] == TIME_MARKER
+
+
+def offset_timezone(offset: int) -> timezone:
+    return timezone(timedelta(microseconds=offset)) if offset else timezone.utc
+
+
+def serialize_datetime(dt: datetime) -> bytes:
+    offset = dt.utcoffset()
+    if offset is None:
+        micros = (dt - EPOCH) // MICROSECOND
+    else:
+        micros = (dt - EPOCH.replace(tzinfo=timezone.utc)) // MICROSECOND
+    return TIMESTAMP_LAYOUT.pack(
+        TIME_MARKER, micros, offset is not None, (offset or ZERO) // MICROSECOND
+    )
+
+
+def deserialize_datetime(blob: Union[bytes, memoryview]) -> datetime:
+    if not is_binary_time(blob, TIMESTAMP_LAYOUT):
+        return parser.isoparse(deserialize(blob, from_bytes=True))
+
+    _, micros, aware, offset = TIMESTAMP_LAYOUT.unpack(blob)
+    dt = EPOCH + timedelta(microseconds=micros)
+    if not aware:
+        return dt
+    tz = offset_timezone(offset)
+    return dt.replace(tzinfo=timezone.utc).astimezone(tz)
+
+
 recursive_serde_register(
     datetime,
-    serialize=lambda x: serialize(x.isoformat(), to_bytes=True),
-    deserialize=lambda x: parser.isoparse(deserialize(x, from_bytes=True)),
+    serialize=serialize_datetime,
+    deserialize=deserialize_datetime,
 )
 
+
+def serialize_time(t: time) -> bytes:
+    micros = ((t.hour * 60 + t.minute) * 60 + t.second) * 1_000_000 + t.microsecond
+    offset = t.utcoffset()
+    return TIMESTAMP_LAYOUT.pack(
+        TIME_MARKER, micros, offset is not None, (offset or ZERO) // MICROSECOND
+    )
+
+
+def deserialize_time(blob: Union[bytes, memoryview]) -> time:
+    if not is_binary_time(blob, TIMESTAMP_LAYOUT):
+        return parser.parse(deserialize(blob, from_bytes=True)).time()
+
+    _, micros, aware, offset = TIMESTAMP_LAYOUT.unpack(blob)
+    seconds, microsecond = divmod(micros, 1_000_000)
+    minutes, second = divmod(seconds, 60)
+    hour, minute = divmod(minutes, 60)
+    tz = None
+    if aware:
+        tz = offset_timezone(offset)
+    return time(hour, minute, second, microsecond, tzinfo=tz)
+
+
 recursive_serde_register(
     time,
-    serialize=lambda x: serialize(x.isoformat(), to_bytes=True),
-    deserialize=lambda x: parser.parse(deserialize(x, from_bytes=True)).time(),
+    serialize=serialize_time,
+    deserialize=deserialize_time,
 )
 
+
+def deserialize_date(blob: Union[bytes, memoryview]) -> date:
+    if not is_binary_time(blob, DATE_LAYOUT):
+        return parser.parse(deserialize(blob, from_bytes=True)).date()
+    return date.fromordinal(DATE_LAYOUT.unpack(blob)[1])
+
+
 recursive_serde_register(
     date,
-    serialize=lambda x: serialize(x.isoformat(), to_bytes=True),
-    deserialize=lambda x: parser.parse(deserialize(x, from_bytes=True)).date(),
+    serialize=lambda x: DATE_LAYOUT.pack(TIME_MARKER, x.toordinal()),
+    deserialize=deserialize_date,
 )
 
+
+def serialize_pandas_timestamp(ts: Timestamp) -> bytes:
+    offset = ts.utcoffset()
+    return TIMESTAMP_LAYOUT.pack(
+        TIME_MARKER, ts.value, offset is not None, (offset or ZERO) // MICROSECOND
+    )
+
+
+def deserialize_pandas_timestamp(blob: Union[bytes, memoryview]) -> Timestamp:
+    if not is_binary_time(blob, TIMESTAMP_LAYOUT):
+        return Timestamp(deserialize(blob, from_bytes=True))
+
+    _, nanos, aware, offset = TIMESTAMP_LAYOUT.unpack(blob)
+    if not aware:
+        return Timestamp(nanos)
+    tz = offset_timezone(offset)
+    return Timestamp(nanos, tz=tz)
+
+
 recursive_serde_register(
     Timestamp,
-    serialize=lambda x: serialize(x.value, to_bytes=True),
-    deserialize=lambda x: Timestamp(deserialize(x, from_bytes=True)),
+    serialize=serialize_pandas_timestamp,
+    deserialize=deserialize_pandas_timestamp,
 )
 
 
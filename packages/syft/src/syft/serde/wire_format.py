@@ -0,0 +1,45 @@
+# stdlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+from typing import Union
+
+# serde v1: one recursive_serde.capnp message per object, nested as byte blobs
+SERDE_VERSION_1 = 1
+# serde v2: the whole object graph flattened into a single buffer, see flat.py
+SERDE_VERSION_2 = 2
+
+LATEST_SERDE_VERSION = SERDE_VERSION_2
+SUPPORTED_SERDE_VERSIONS = (SERDE_VERSION_1, SERDE_VERSION_2)
+
+# a capnp message starts with its segment count, which can never match this prefix
+MAGIC_V2 = b"\xfeSY\x02"
+
+_serde_version: ContextVar[int] = ContextVar(
+    "serde_version", default=LATEST_SERDE_VERSION
+)
+
+
+def get_serde_version() -> int:
+    return _serde_version.get()
+
+
+@contextmanager
+def use_serde_version(version: int) -> Iterator[None]:
+    """Serialize with the given wire format version inside this block.
+
+    Used to answer a peer in the format it spoke to us, e.g. an older client
+    that only understands SERDE_VERSION_1."""
+    if version not in SUPPORTED_SERDE_VERSIONS:
+        raise ValueError(f"Unsupported serde version: {version}")
+    token = _serde_version.set(version)
+    try:
+        yield None
+    finally:
+        _serde_version.reset(token)
+
+
+def serde_version_of(blob: Union[bytes, bytearray, memoryview]) -> int:
+    if bytes(blob[: len(MAGIC_V2)]) == MAGIC_V2:
+        return SERDE_VERSION_2
+    return SERDE_VERSION_1
@@ -27,6 +27,7 @@ from typing_extensions import Self
 # relative
 from ...client.api import SyftAPI
 from ...client.client import SyftClient
+from ...client.connection import preflight_upload
 from ...serde.serializable import serializable
 from ...store.linked_obj import LinkedObject
 from ...types.syft_object import SYFT_OBJECT_VERSION_1
@@ -703,8 +704,8 @@ class ActionObject(SyftObject):
 
     def send(self, client: SyftClient) -> Self:
         """Send the object to a Syft Client"""
-
-        return client.api.services.action.set(self)
+        with preflight_upload(self):
+            return client.api.services.action.set(self)
 
     def get_from(self, client: SyftClient) -> Any:
         """Get the object from a Syft Client"""
@@ -115,21 +115,46 @@ class ActionService(AbstractService):
             uid=uid, credentials=context.credentials, has_permission=has_permission
         )
         if result.is_ok():
-            obj = result.ok()
-            if isinstance(obj, TwinObject):
-                if twin_mode == TwinMode.PRIVATE:
-                    obj = obj.private
-                    obj.syft_point_to(context.node.id)
-                elif twin_mode == TwinMode.MOCK:
-                    obj = obj.mock
-                    obj.syft_point_to(context.node.id)
-                else:
-                    obj.mock.syft_point_to(context.node.id)
-                    obj.private.syft_point_to(context.node.id)
-            return Ok(obj)
+            return Ok(self._resolve_twin(context, result.ok(), twin_mode))
         else:
             return result
 
+    def get_many(
+        self,
+        context: AuthedServiceContext,
+        uids: List[UID],
+        twin_mode: TwinMode = TwinMode.PRIVATE,
+        has_permission=False,
+    ) -> Result[List[ActionObject], str]:
+        """Get objects from the action store, checking their permissions at once"""
+        result = self.store.get_many(
+            uids=uids, credentials=context.credentials, has_permission=has_permission
+        )
+        if result.is_ok():
+            return Ok(
+                [self._resolve_twin(context, obj, twin_mode) for obj in result.ok()]
+            )
+        else:
+            return result
+
+    def _resolve_twin(
+        self,
+        context: AuthedServiceContext,
+        obj: Union[ActionObject, TwinObject],
+        twin_mode: TwinMode,
+    ) -> Union[ActionObject, TwinObject]:
+        if isinstance(obj, TwinObject):
+            if twin_mode == TwinMode.PRIVATE:
+                obj = obj.private
+                obj.syft_point_to(context.node.id)
+            elif twin_mode == TwinMode.MOCK:
+                obj = obj.mock
+                obj.syft_point_to(context.node.id)
+            else:
+                obj.mock.syft_point_to(context.node.id)
+                obj.private.syft_point_to(context.node.id)
+        return obj
+
     @service_method(
         path="action.get_pointer", name="get_pointer", roles=GUEST_ROLE_LEVEL
     )
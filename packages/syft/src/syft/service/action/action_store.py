@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 # stdlib
+from typing import Any
+from typing import Callable
 from typing import List
 from typing import Optional
 
@@ -17,6 +19,9 @@ from ...serde.serializable import serializable
 from ...store.dict_document_store import DictStoreConfig
 from ...store.document_store import BasePartitionSettings
 from ...store.document_store import StoreConfig
+from ...store.kv_document_store import KeyValueBackingStore
+from ...store.sqlite_document_store import SQLiteBackingStore
+from ...store.sqlite_document_store import SQLiteConnection
 from ...types.syft_object import SyftObject
 from ...types.twin_object import TwinObject
 from ...types.uid import LineageID
@@ -51,16 +56,22 @@ class KeyValueActionStore(ActionStore):
     ) -> None:
         self.store_config = store_config
         self.settings = BasePartitionSettings(name="Action")
-        self.data = self.store_config.backing_store(
-            "data", self.settings, self.store_config
-        )
-        self.permissions = self.store_config.backing_store(
-            "permissions", self.settings, self.store_config, ddtype=set
-        )
+        self.data = self._backing_store("data")
+        self.permissions = self._backing_store("permissions", ddtype=set)
         if root_verify_key is None:
             root_verify_key = SyftSigningKey.generate().verify_key
         self.root_verify_key = root_verify_key
 
+    def _backing_store(self, index_name: str, **kwargs: Any) -> KeyValueBackingStore:
+        return self.store_config.backing_store(
+            index_name, self.settings, self.store_config, **kwargs
+        )
+
+    def _unit_of_work(self, cbk: Callable, *args: Any, **kwargs: Any) -> Result:
+        """Calls cbk. Stores with transactions commit its writes to data and
+        permissions at once, or none of them if it returns an Err or raises."""
+        return cbk(*args, **kwargs)
+
     def get(
         self, uid: UID, credentials: SyftVerifyKey, has_permission=False
     ) -> Result[SyftObject, str]:
@@ -230,6 +241,125 @@ class KeyValueActionStore(ActionStore):
         for permission in permissions:
             results.append(self.add_permission(permission))
 
+    def _missing_permissions(
+        self, permissions: List[ActionObjectPermission]
+    ) -> List[ActionObjectPermission]:
+        """has_permission for many permissions, reading the stored ones at once."""
+        permissions = [
+            permission
+            for permission in permissions
+            if self.root_verify_key.verify != permission.credentials.verify
+        ]
+        if len(permissions) == 0:
+            return []
+
+        stored = self.permissions.get_many({p.uid for p in permissions})
+        return [
+            permission
+            for permission in permissions
+            if permission.permission_string not in stored.get(permission.uid, set())
+        ]
+
+    def get_many(
+        self, uids: List[UID], credentials: SyftVerifyKey, has_permission=False
+    ) -> Result[List[SyftObject], str]:
+        uids = [uid.id for uid in uids]  # We only need the UID from LineageID or UID
+
+        if not has_permission:
+            missing = self._missing_permissions(
+                [ActionObjectREAD(uid=uid, credentials=credentials) for uid in uids]
+            )
+            if len(missing) > 0:
+                return Err(f"Permission: {missing[0]} denied")
+
+        syft_objects = self.data.get_many(uids)
+        for uid in uids:
+            if uid not in syft_objects:
+                return Err(f"Could not find item with uid {uid}")
+        return Ok([syft_objects[uid] for uid in uids])
+
+    def set_many(
+        self,
+        credentials: SyftVerifyKey,
+        syft_objects: List[SyftObject],
+        has_result_read_permission: bool = False,
+    ) -> Result[SyftSuccess, str]:
+        return self._unit_of_work(
+            self._set_many, credentials, syft_objects, has_result_read_permission
+        )
+
+    def _set_many(
+        self,
+        credentials: SyftVerifyKey,
+        syft_objects: List[SyftObject],
+        has_result_read_permission: bool = False,
+    ) -> Result[SyftSuccess, str]:
+        # same checks as set, nothing is written until every object passed them
+        uids = [syft_object.id.id for syft_object in syft_objects]
+        existing = self.data.existing_keys(uids)
+        stored = self.permissions.get_many(uids)
+        owner = credentials if has_result_read_permission else self.root_verify_key
+
+        permissions = {}
+        for uid in uids:
+            uid_permissions = set(stored.get(uid, set()))
+            write_permission = ActionObjectWRITE(uid=uid, credentials=credentials)
+            if uid not in existing:
+                # first person using this UID can claim ownership
+                can_write = uid not in stored
+                uid_permissions.update(
+                    [
+                        ActionObjectOWNER(uid=uid, credentials=owner).permission_string,
+                        ActionObjectWRITE(uid=uid, credentials=owner).permission_string,
+                        ActionObjectREAD(uid=uid, credentials=owner).permission_string,
+                        ActionObjectEXECUTE(
+                            uid=uid, credentials=owner
+                        ).permission_string,
+                    ]
+                )
+            else:
+                can_write = (
+                    self.root_verify_key.verify == credentials.verify
+                    or write_permission.permission_string in uid_permissions
+                )
+            if not can_write:
+                return Err(f"Permission: {write_permission} denied")
+
+            if has_result_read_permission:
+                granted = [ActionObjectREAD(uid=uid, credentials=credentials)]
+            else:
+                granted = [
+                    ActionObjectWRITE(uid=uid, credentials=credentials),
+                    ActionObjectEXECUTE(uid=uid, credentials=credentials),
+                ]
+            uid_permissions.update([x.permission_string for x in granted])
+            permissions[uid] = uid_permissions
+
+        self.data.set_many(dict(zip(uids, syft_objects)))
+        self.permissions.set_many(permissions)
+        return Ok(SyftSuccess(message=f"Set {len(uids)} objects"))
+
+    def delete_many(
+        self, uids: List[UID], credentials: SyftVerifyKey
+    ) -> Result[SyftSuccess, str]:
+        return self._unit_of_work(self._delete_many, uids, credentials)
+
+    def _delete_many(
+        self, uids: List[UID], credentials: SyftVerifyKey
+    ) -> Result[SyftSuccess, str]:
+        uids = [uid.id for uid in uids]  # We only need the UID from LineageID or UID
+
+        # if you delete something you need OWNER permission
+        missing = self._missing_permissions(
+            [ActionObjectOWNER(uid=uid, credentials=credentials) for uid in uids]
+        )
+        if len(missing) > 0:
+            return Err(f"Permission: {missing[0]} denied")
+
+        self.data.delete_many(uids)
+        self.permissions.delete_many(uids)
+        return Ok(SyftSuccess(message=f"{len(uids)} IDs deleted"))
+
 
 @serializable()
 class DictActionStore(KeyValueActionStore):
@@ -262,4 +392,16 @@ class SQLiteActionStore(KeyValueActionStore):
             Signature verification key, used for checking access permissions.
     """
 
-    pass
+    def __init__(
+        self, store_config: StoreConfig, root_verify_key: Optional[SyftVerifyKey] = None
+    ) -> None:
+        # data and permissions share the connections, so a single transaction
+        # covers both of them
+        self.connection = SQLiteConnection(store_config.client_config)
+        super().__init__(store_config=store_config, root_verify_key=root_verify_key)
+
+    def _backing_store(self, index_name: str, **kwargs: Any) -> SQLiteBackingStore:
+        return super()._backing_store(index_name, connection=self.connection, **kwargs)
+
+    def _unit_of_work(self, cbk: Callable, *args: Any, **kwargs: Any) -> Result:
+        return self.connection.unit_of_work(cbk, *args, **kwargs)
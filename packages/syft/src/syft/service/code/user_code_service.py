@@ -4,10 +4,8 @@ from typing import Dict
 from typing import List
 from typing import Union
 
-# third party
-from result import OkErr
-
 # relative
+from ...serde.recursive import invalidate_resolved_classes
 from ...serde.serializable import serializable
 from ...store.document_store import DocumentStore
 from ...store.linked_obj import LinkedObject
@@ -134,6 +132,7 @@ class UserCodeService(AbstractService):
         return SyftError(message="Unable to Update Code State")
 
     def load_user_code(self, context: AuthedServiceContext) -> None:
+        invalidate_resolved_classes("syft.user.")
         result = self.stash.get_all(credentials=context.credentials)
         if result.is_ok():
             user_code_items = result.ok()
@@ -213,15 +212,13 @@ def get_outputs(context: AuthedServiceContext, output_history: OutputHistory) ->
     if isinstance(output_history.outputs, list):
         if len(output_history.outputs) == 0:
             return None
-        outputs = []
-        for output_id in output_history.outputs:
-            action_service = context.node.get_service("actionservice")
-            result = action_service.get(
-                context, uid=output_id, twin_mode=TwinMode.PRIVATE
-            )
-            if isinstance(result, OkErr):
-                result = result.value
-            outputs.append(result)
+        action_service = context.node.get_service("actionservice")
+        result = action_service.get_many(
+            context, uids=output_history.outputs, twin_mode=TwinMode.PRIVATE
+        )
+        if result.is_err():
+            return result.value
+        outputs = result.ok()
         if len(outputs) == 1:
             return outputs[0]
         return outputs
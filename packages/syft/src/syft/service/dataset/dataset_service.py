@@ -1,10 +1,13 @@
 # stdlib
 from typing import List
+from typing import Optional
 from typing import Union
 
 # relative
 from ...serde.serializable import serializable
 from ...store.document_store import DocumentStore
+from ...store.pagination import Page
+from ...store.pagination import PageCursor
 from ...types.uid import UID
 from ...util.telemetry import instrument
 from ..action.action_permissions import ActionObjectPermission
@@ -54,16 +57,25 @@ class DatasetService(AbstractService):
         return SyftSuccess(message="Dataset Added")
 
     @service_method(path="dataset.get_all", name="get_all", roles=GUEST_ROLE_LEVEL)
-    def get_all(self, context: AuthedServiceContext) -> Union[List[Dataset], SyftError]:
-        """Get a Dataset"""
-        result = self.stash.get_all(context.credentials)
+    def get_all(
+        self,
+        context: AuthedServiceContext,
+        limit: Optional[int] = None,
+        cursor: Optional[PageCursor] = None,
+        sort_key: str = "id",
+    ) -> Union[List[Dataset], Page, SyftError]:
+        """Get all Datasets, or a Page of at most limit of them"""
+        if limit is None:
+            result = self.stash.get_all(context.credentials)
+        else:
+            result = self.stash.get_page(
+                context.credentials, limit=limit, cursor=cursor, sort_key=sort_key
+            )
         if result.is_ok():
             datasets = result.ok()
-            results = []
             for dataset in datasets:
                 dataset.node_uid = context.node.id
-                results.append(dataset)
-            return results
+            return datasets
         return SyftError(message=result.err())
 
     @service_method(path="dataset.search", name="search")
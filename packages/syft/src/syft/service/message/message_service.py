@@ -1,10 +1,13 @@
 # stdlib
 from typing import List
+from typing import Optional
 from typing import Union
 
 # relative
 from ...serde.serializable import serializable
 from ...store.document_store import DocumentStore
+from ...store.pagination import Page
+from ...store.pagination import PageCursor
 from ...types.uid import UID
 from ...util.telemetry import instrument
 from ..context import AuthedServiceContext
@@ -44,10 +47,26 @@ class MessageService(AbstractService):
         return result.ok()
 
     @service_method(path="messages.get_all", name="get_all")
-    def get_all(self, context: AuthedServiceContext) -> Union[List[Message], SyftError]:
-        result = self.stash.get_all_inbox_for_verify_key(
-            context.credentials, verify_key=context.credentials
-        )
+    def get_all(
+        self,
+        context: AuthedServiceContext,
+        limit: Optional[int] = None,
+        cursor: Optional[PageCursor] = None,
+        sort_key: str = "id",
+    ) -> Union[List[Message], Page, SyftError]:
+        """Get all your Messages, or a Page of at most limit of them"""
+        if limit is None:
+            result = self.stash.get_all_inbox_for_verify_key(
+                context.credentials, verify_key=context.credentials
+            )
+        else:
+            result = self.stash.get_page_inbox_for_verify_key(
+                context.credentials,
+                verify_key=context.credentials,
+                limit=limit,
+                cursor=cursor,
+                sort_key=sort_key,
+            )
         if result.err():
             return SyftError(message=str(result.err()))
         messages = result.ok()
@@ -1,5 +1,6 @@
 # stdlib
 from typing import List
+from typing import Optional
 
 # third party
 from result import Err
@@ -13,6 +14,8 @@ from ...store.document_store import BaseUIDStoreStash
 from ...store.document_store import PartitionKey
 from ...store.document_store import PartitionSettings
 from ...store.document_store import QueryKeys
+from ...store.pagination import Page
+from ...store.pagination import PageCursor
 from ...types.uid import UID
 from ...util.telemetry import instrument
 from .messages import Message
@@ -48,6 +51,25 @@ class MessageStash(BaseUIDStoreStash):
             credentials=credentials, verify_key=verify_key, qks=qks
         )
 
+    def get_page_inbox_for_verify_key(
+        self,
+        credentials: SyftVerifyKey,
+        verify_key: SyftVerifyKey,
+        limit: int,
+        cursor: Optional[PageCursor] = None,
+        sort_key: str = "id",
+    ) -> Result[Page, str]:
+        if isinstance(verify_key, str):
+            verify_key = SyftVerifyKey.from_string(verify_key)
+        qks = QueryKeys(
+            qks=[
+                ToUserVerifyKeyPartitionKey.with_obj(verify_key),
+            ]
+        )
+        return self.query_page(
+            credentials, qks=qks, limit=limit, cursor=cursor, sort_key=sort_key
+        )
+
     def get_all_sent_for_verify_key(
         self, credentials: SyftVerifyKey, verify_key: SyftVerifyKey
     ) -> Result[List[Message], str]:
@@ -13,11 +13,14 @@ from pydantic import BaseModel
 # relative
 from ...node.credentials import SyftVerifyKey
 from ...serde.serializable import serializable
+from ...serde.wire_format import SERDE_VERSION_1
 from ...types.syft_object import SYFT_OBJECT_VERSION_1
+from ...types.syft_object import SYFT_OBJECT_VERSION_2
 from ...types.syft_object import StorableObjectType
 from ...types.syft_object import SyftObject
 from ...types.transforms import convert_types
 from ...types.transforms import drop
+from ...types.transforms import make_set_default
 from ...types.transforms import rename
 from ...types.transforms import transform
 from ...types.uid import UID
@@ -97,6 +100,58 @@ class NodeMetadata(SyftObject):
         return hashes
 
 
+@serializable()
+class NodeMetadataV2(SyftObject):
+    __canonical_name__ = "NodeMetadata"
+    __version__ = SYFT_OBJECT_VERSION_2
+
+    name: str
+    id: UID
+    verify_key: SyftVerifyKey
+    highest_object_version: int
+    lowest_object_version: int
+    syft_version: str
+    node_type: str = "Domain"
+    deployed_on: str = "Date"
+    organization: str = "OpenMined"
+    on_board: bool = False
+    description: str = "Text"
+    serde_version: int = SERDE_VERSION_1
+
+    def check_version(self, client_version: str) -> None:
+        return check_version(
+            client_version=client_version,
+            server_version=self.syft_version,
+            server_name=self.name,
+        )
+
+    def __hash__(self) -> int:
+        hashes = 0
+        hashes += recursive_hash(self.id)
+        hashes += recursive_hash(self.name)
+        hashes += recursive_hash(self.verify_key)
+        hashes += recursive_hash(self.highest_object_version)
+        hashes += recursive_hash(self.lowest_object_version)
+        hashes += recursive_hash(self.node_type)
+        hashes += recursive_hash(self.deployed_on)
+        hashes += recursive_hash(self.organization)
+        hashes += recursive_hash(self.on_board)
+        hashes += recursive_hash(self.description)
+        hashes += recursive_hash(self.serde_version)
+        return hashes
+
+
+@transform(NodeMetadata, NodeMetadataV2)
+def upgrade_metadata_v1_to_v2() -> List[Callable]:
+    # v1 nodes only speak serde v1
+    return [make_set_default("serde_version", SERDE_VERSION_1)]
+
+
+@transform(NodeMetadataV2, NodeMetadata)
+def downgrade_metadata_v2_to_v1() -> List[Callable]:
+    return [drop(["serde_version"])]
+
+
 @serializable()
 class NodeMetadataJSON(BaseModel, StorableObjectType):
     metadata_version: int
@@ -111,6 +166,8 @@ class NodeMetadataJSON(BaseModel, StorableObjectType):
     organization: str = "OpenMined"
     on_board: bool = False
     description: str = "My cool domain"
+    # nodes which predate serde v2 don't send this field
+    serde_version: int = SERDE_VERSION_1
 
     def check_version(self, client_version: str) -> bool:
         return check_version(
@@ -131,6 +188,23 @@ def metadata_to_json() -> List[Callable]:
 
 @transform(NodeMetadataJSON, NodeMetadata)
 def json_to_metadata() -> List[Callable]:
+    return [
+        drop(["metadata_version", "serde_version"]),
+        convert_types(["id", "verify_key"], [UID, SyftVerifyKey]),
+    ]
+
+
+@transform(NodeMetadataV2, NodeMetadataJSON)
+def metadata_v2_to_json() -> List[Callable]:
+    return [
+        drop("__canonical_name__"),
+        rename("__version__", "metadata_version"),
+        convert_types(["id", "verify_key"], str),
+    ]
+
+
+@transform(NodeMetadataJSON, NodeMetadataV2)
+def json_to_metadata_v2() -> List[Callable]:
     return [
         drop(["metadata_version"]),
         convert_types(["id", "verify_key"], [UID, SyftVerifyKey]),
@@ -38,6 +38,7 @@ from ..context import AuthedServiceContext
 from ..context import NodeServiceContext
 from ..data_subject.data_subject import NamePartitionKey
 from ..metadata.node_metadata import NodeMetadata
+from ..metadata.node_metadata import NodeMetadataV2
 from ..response import SyftError
 from ..response import SyftSuccess
 from ..service import AbstractService
@@ -248,6 +249,13 @@ def metadata_to_peer() -> List[Callable]:
     ]
 
 
+@transform(NodeMetadataV2, NodePeer)
+def metadata_v2_to_peer() -> List[Callable]:
+    return [
+        keep(["id", "name", "verify_key"]),
+    ]
+
+
 @instrument
 @serializable()
 class NetworkStash(BaseUIDStoreStash):
@@ -354,7 +362,7 @@ class NetworkService(AbstractService):
     @service_method(path="network.add_peer", name="add_peer", roles=GUEST_ROLE_LEVEL)
     def add_peer(
         self, context: AuthedServiceContext, peer: NodePeer
-    ) -> Union[NodeMetadata, SyftError]:
+    ) -> Union[NodeMetadataV2, SyftError]:
         """Add a Network Node Peer"""
         # save the peer and verify the key matches the message signer
         if peer.verify_key != context.credentials:
@@ -27,6 +27,7 @@ from result import Ok
 from ...abstract_node import NodeType
 from ...client.api import NodeView
 from ...node.credentials import SyftVerifyKey
+from ...serde.recursive import invalidate_resolved_classes
 from ...serde.serializable import serializable
 from ...store.document_store import PartitionKey
 from ...types.datetime import DateTime
@@ -199,13 +200,12 @@ def retrieve_from_db(
     code_inputs = {}
 
     if context.node.node_type == NodeType.DOMAIN:
-        for var_name, arg_id in allowed_inputs.items():
-            kwarg_value = action_service.get(
-                context=context, uid=arg_id, twin_mode=TwinMode.NONE
-            )
-            if kwarg_value.is_err():
-                return kwarg_value
-            code_inputs[var_name] = kwarg_value.ok()
+        kwarg_values = action_service.get_many(
+            context=context, uids=list(allowed_inputs.values()), twin_mode=TwinMode.NONE
+        )
+        if kwarg_values.is_err():
+            return kwarg_values
+        code_inputs = dict(zip(allowed_inputs.keys(), kwarg_values.ok()))
 
     elif context.node.node_type == NodeType.ENCLAVE:
         # TODO 🟣 Temporarily added skip permission arguments for enclave
@@ -664,6 +664,8 @@ def add_class_to_user_module(klass: type, unique_name: str) -> type:
     user_module = sy.user
     setattr(user_module, unique_name, klass)
     setattr(sys.modules["syft"], "user", user_module)
+    # deserialization has to pick up the new class instead of a cached one
+    invalidate_resolved_classes(f"syft.user.{unique_name}")
     return klass
 
 
@@ -25,6 +25,7 @@ from ...node.credentials import SyftSigningKey
 from ...node.credentials import SyftVerifyKey
 from ...serde.serializable import serializable
 from ...serde.serialize import _serialize
+from ...serde.wire_format import SERDE_VERSION_1
 from ...service.metadata.node_metadata import NodeMetadata
 from ...store.linked_obj import LinkedObject
 from ...types.datetime import DateTime
@@ -125,7 +126,7 @@ class ProjectEvent(SyftObject):
         try:
             signature = self.signature
             self.signature = None
-            signed_bytes = _serialize(self, to_bytes=True)
+            signed_bytes = _serialize(self, to_bytes=True, version=SERDE_VERSION_1)
             self.creator_verify_key.verify_key.verify(signed_bytes, signature)
             self.signature = signature
             return SyftSuccess(message="Event signature is valid")
@@ -166,7 +167,7 @@ class ProjectEvent(SyftObject):
                 f"{signing_key.verify_key}"
             )
         self.signature = None
-        signed_bytes = _serialize(self, to_bytes=True)
+        signed_bytes = _serialize(self, to_bytes=True, version=SERDE_VERSION_1)
         signed_obj = signing_key.signing_key.sign(signed_bytes)
         self.signature = signed_obj._signature
 
@@ -21,6 +21,7 @@ from ...external import OBLV
 from ...node.credentials import SyftVerifyKey
 from ...serde.serializable import serializable
 from ...serde.serialize import _serialize
+from ...serde.wire_format import SERDE_VERSION_1
 from ...store.linked_obj import LinkedObject
 from ...types.datetime import DateTime
 from ...types.syft_object import SYFT_OBJECT_VERSION_1
@@ -239,11 +240,14 @@ def hash_changes(context: TransformContext) -> TransformContext:
     key = context.output["requesting_user_verify_key"]
     changes = context.output["changes"]
 
+    # hashes are compared across nodes and releases so they use the canonical v1 format
     time_hash = hashlib.sha256(
-        _serialize(request_time.utc_timestamp, to_bytes=True)
+        _serialize(request_time.utc_timestamp, to_bytes=True, version=SERDE_VERSION_1)
     ).digest()
     key_hash = hashlib.sha256(bytes(key.verify_key)).digest()
-    changes_hash = hashlib.sha256(_serialize(changes, to_bytes=True)).digest()
+    changes_hash = hashlib.sha256(
+        _serialize(changes, to_bytes=True, version=SERDE_VERSION_1)
+    ).digest()
     final_hash = hashlib.sha256((time_hash + key_hash + changes_hash)).hexdigest()
 
     context.output["request_hash"] = final_hash
@@ -1,5 +1,6 @@
 # stdlib
 from typing import List
+from typing import Optional
 from typing import Union
 
 # third party
@@ -10,6 +11,8 @@ from result import Ok
 from ...serde.serializable import serializable
 from ...store.document_store import DocumentStore
 from ...store.linked_obj import LinkedObject
+from ...store.pagination import Page
+from ...store.pagination import PageCursor
 from ...types.uid import UID
 from ...util.telemetry import instrument
 from ..action.action_permissions import ActionObjectPermission
@@ -93,8 +96,20 @@ class RequestService(AbstractService):
             raise e
 
     @service_method(path="request.get_all", name="get_all")
-    def get_all(self, context: AuthedServiceContext) -> Union[List[Request], SyftError]:
-        result = self.stash.get_all(context.credentials)
+    def get_all(
+        self,
+        context: AuthedServiceContext,
+        limit: Optional[int] = None,
+        cursor: Optional[PageCursor] = None,
+        sort_key: str = "id",
+    ) -> Union[List[Request], Page, SyftError]:
+        """Get all Requests, or a Page of at most limit of them"""
+        if limit is None:
+            result = self.stash.get_all(context.credentials)
+        else:
+            result = self.stash.get_page(
+                context.credentials, limit=limit, cursor=cursor, sort_key=sort_key
+            )
         if result.is_err():
             return SyftError(message=str(result.err()))
         requests = result.ok()
@@ -9,6 +9,8 @@ from ...node.credentials import SyftVerifyKey
 from ...node.credentials import UserLoginCredentials
 from ...serde.serializable import serializable
 from ...store.document_store import DocumentStore
+from ...store.pagination import Page
+from ...store.pagination import PageCursor
 from ...types.syft_metaclass import Empty
 from ...types.uid import UID
 from ...util.telemetry import instrument
@@ -93,14 +95,28 @@ class UserService(AbstractService):
 
     @service_method(path="user.get_all", name="get_all", roles=DATA_OWNER_ROLE_LEVEL)
     def get_all(
-        self, context: AuthedServiceContext
-    ) -> Union[Optional[UserView], SyftError]:
-        result = self.stash.get_all(context.credentials)
-        if result.is_ok():
-            return [user.to(UserView) for user in result.ok()]
+        self,
+        context: AuthedServiceContext,
+        limit: Optional[int] = None,
+        cursor: Optional[PageCursor] = None,
+        sort_key: str = "id",
+    ) -> Union[List[UserView], Page, SyftError]:
+        """Get all Users, or a Page of at most limit of them"""
+        if limit is None:
+            result = self.stash.get_all(context.credentials)
+        else:
+            result = self.stash.get_page(
+                context.credentials, limit=limit, cursor=cursor, sort_key=sort_key
+            )
+        if result.is_err():
+            # 🟡 TODO: No user exists will happen when result.ok() is empty list
+            return SyftError(message="No users exists")
 
-        # 🟡 TODO: No user exists will happen when result.ok() is empty list
-        return SyftError(message="No users exists")
+        if limit is None:
+            return [user.to(UserView) for user in result.ok()]
+        page = result.ok()
+        page.items = [user.to(UserView) for user in page.items]
+        return page
 
     def get_role_for_credentials(
         self, credentials: SyftVerifyKey
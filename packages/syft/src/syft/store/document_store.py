@@ -2,17 +2,20 @@
 from __future__ import annotations
 
 # stdlib
+from contextlib import contextmanager
 import sys
 import types
 import typing
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Tuple
 from typing import Type
 from typing import Union
+import warnings
 
 # third party
 from pydantic import BaseModel
@@ -36,6 +39,11 @@ from ..util.telemetry import instrument
 from .locks import LockingConfig
 from .locks import NoLockingConfig
 from .locks import SyftLock
+from .pagination import FullScanWarning
+from .pagination import Page
+from .pagination import PageCursor
+from .pagination import check_page_args
+from .pagination import paginate
 
 
 @serializable()
@@ -350,6 +358,20 @@ class StorePartition:
     def store_query_keys(self, objs: Any) -> QueryKeys:
         return QueryKeys(qks=[self.store_query_key(obj) for obj in objs])
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Groups the writes of the block into a single unit of work.
+
+        Partitions with transactions commit them together when the block exits
+        and drop them if it raises. The others write them one by one.
+        """
+        yield
+
+    def _unit_of_work(self, cbk: Callable, *args: Any, **kwargs: Any) -> Result:
+        """Calls cbk. Partitions with transactions commit its writes at once,
+        or none of them if it returns an Err or raises."""
+        return cbk(*args, **kwargs)
+
     # Thread-safe methods
     def _thread_safe_cbk(self, cbk: Callable, *args, **kwargs):
         locked = self.lock.acquire(blocking=True)
@@ -443,6 +465,85 @@ class StorePartition:
     ) -> Result[List[BaseStash.object_type], str]:
         return self._thread_safe_cbk(self._all, credentials)
 
+    def page(
+        self,
+        credentials: SyftVerifyKey,
+        limit: int,
+        cursor: Optional[PageCursor] = None,
+        sort_key: str = "id",
+        index_qks: Optional[QueryKeys] = None,
+        search_qks: Optional[QueryKeys] = None,
+    ) -> Result[Page, str]:
+        """Up to limit objects after cursor, ordered by sort_key and then id.
+
+        Only objects matching index_qks and search_qks are included if either
+        is given, like in find_index_or_search_keys.
+
+        Stores order and limit the objects themselves where they can, e.g. by
+        id. Otherwise every matching object is loaded to cut out the page,
+        which emits a FullScanWarning.
+        """
+        error = check_page_args(limit, cursor, sort_key)
+        if error is not None:
+            return Err(error)
+        return self._thread_safe_cbk(
+            self._page,
+            credentials=credentials,
+            limit=limit,
+            cursor=cursor,
+            sort_key=sort_key,
+            index_qks=index_qks,
+            search_qks=search_qks,
+        )
+
+    # Batch methods take the lock once and write in a single transaction.
+    # Writes stop at the first failing object, see _each for the fallbacks.
+
+    def set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[SyftObject],
+        add_permissions: Optional[List[ActionObjectPermission]] = None,
+        ignore_duplicates: bool = False,
+    ) -> Result[List[SyftObject], str]:
+        return self._thread_safe_cbk(
+            self._set_many,
+            credentials=credentials,
+            objs=objs,
+            add_permissions=add_permissions,
+            ignore_duplicates=ignore_duplicates,
+        )
+
+    def get_many(
+        self, credentials: SyftVerifyKey, uids: List[UID]
+    ) -> Result[List[SyftObject], str]:
+        return self._thread_safe_cbk(self._get_many, credentials=credentials, uids=uids)
+
+    def update_many(
+        self,
+        credentials: SyftVerifyKey,
+        qks: List[QueryKey],
+        objs: List[SyftObject],
+        has_permission=False,
+    ) -> Result[List[SyftObject], str]:
+        return self._thread_safe_cbk(
+            self._update_many,
+            credentials=credentials,
+            qks=qks,
+            objs=objs,
+            has_permission=has_permission,
+        )
+
+    def delete_many(
+        self, credentials: SyftVerifyKey, qks: List[QueryKey], has_permission=False
+    ) -> Result[SyftSuccess, str]:
+        return self._thread_safe_cbk(
+            self._delete_many,
+            credentials=credentials,
+            qks=qks,
+            has_permission=has_permission,
+        )
+
     # Potentially thread-unsafe methods.
     # CAUTION:
     #       * Don't use self.lock here.
@@ -469,6 +570,103 @@ class StorePartition:
     def _all(self) -> Result[List[BaseStash.object_type], str]:
         raise NotImplementedError
 
+    def _page(
+        self,
+        credentials: SyftVerifyKey,
+        limit: int,
+        cursor: Optional[PageCursor],
+        sort_key: str,
+        index_qks: Optional[QueryKeys],
+        search_qks: Optional[QueryKeys],
+    ) -> Result[Page, str]:
+        # loads every object found, stores which can avoid that override it
+        warnings.warn(
+            f"{type(self).__name__} loads every object to page them by {sort_key}",
+            FullScanWarning,
+        )
+        if index_qks is None and search_qks is None:
+            result = self._all(credentials)
+        else:
+            result = self._find_index_or_search_keys(
+                credentials,
+                index_qks=index_qks or QueryKeys(qks=[]),
+                search_qks=search_qks or QueryKeys(qks=[]),
+            )
+        return result.map(lambda objs: paginate(objs, limit, cursor, sort_key))
+
+    # Fallbacks for the batch methods, one object at a time
+
+    def _each(self, cbk: Callable, calls: List[Dict[str, Any]]) -> Result[List, str]:
+        """Calls cbk for every kwargs of calls, stopping at the first Err.
+
+        Partitions with transactions drop the writes of the calls before it.
+        The others keep them, so for those the fallbacks are best-effort.
+        """
+        return self._unit_of_work(self._each_call, cbk, calls)
+
+    @staticmethod
+    def _each_call(cbk: Callable, calls: List[Dict[str, Any]]) -> Result[List, str]:
+        results = []
+        for kwargs in calls:
+            result = cbk(**kwargs)
+            if result.is_err():
+                return result
+            results.append(result.ok())
+        return Ok(results)
+
+    def _set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[SyftObject],
+        add_permissions: Optional[List[ActionObjectPermission]] = None,
+        ignore_duplicates: bool = False,
+    ) -> Result[List[SyftObject], str]:
+        calls = [
+            {
+                "credentials": credentials,
+                "obj": obj,
+                "add_permissions": add_permissions,
+                "ignore_duplicates": ignore_duplicates,
+            }
+            for obj in objs
+        ]
+        return self._each(self._set, calls)
+
+    def _get_many(
+        self, credentials: SyftVerifyKey, uids: List[UID]
+    ) -> Result[List[SyftObject], str]:
+        qks = QueryKeys(qks=[self.settings.store_key.with_obj(uid) for uid in uids])
+        return self._get_all_from_store(credentials, qks)
+
+    def _update_many(
+        self,
+        credentials: SyftVerifyKey,
+        qks: List[QueryKey],
+        objs: List[SyftObject],
+        has_permission: bool = False,
+    ) -> Result[List[SyftObject], str]:
+        calls = [
+            {
+                "credentials": credentials,
+                "qk": qk,
+                "obj": obj,
+                "has_permission": has_permission,
+            }
+            for qk, obj in zip(qks, objs)
+        ]
+        return self._each(self._update, calls)
+
+    def _delete_many(
+        self, credentials: SyftVerifyKey, qks: List[QueryKey], has_permission=False
+    ) -> Result[SyftSuccess, str]:
+        calls = [
+            {"credentials": credentials, "qk": qk, "has_permission": has_permission}
+            for qk in qks
+        ]
+        return self._each(self._delete, calls).and_then(
+            lambda _: Ok(SyftSuccess(message=f"Deleted {len(qks)} objects"))
+        )
+
 
 @instrument
 @serializable()
@@ -524,6 +722,17 @@ class BaseStash:
     ) -> Result[List[BaseStash.object_type], str]:
         return self.partition.all(credentials)
 
+    def get_page(
+        self,
+        credentials: SyftVerifyKey,
+        limit: int,
+        cursor: Optional[PageCursor] = None,
+        sort_key: str = "id",
+    ) -> Result[Page, str]:
+        return self.partition.page(
+            credentials, limit=limit, cursor=cursor, sort_key=sort_key
+        )
+
     def __len__(self) -> int:
         return len(self.partition)
 
@@ -541,9 +750,9 @@ class BaseStash:
             add_permissions=add_permissions,
         )
 
-    def query_all(
-        self, credentials: SyftVerifyKey, qks: Union[QueryKey, QueryKeys]
-    ) -> Result[List[BaseStash.object_type], str]:
+    def _split_query_keys(
+        self, qks: Union[QueryKey, QueryKeys]
+    ) -> Result[Tuple[QueryKeys, QueryKeys], str]:
         if isinstance(qks, QueryKey):
             qks = QueryKeys(qks=qks)
 
@@ -561,13 +770,42 @@ class BaseStash:
                     f"{qk} not in {type(self.partition)} unique or searchable keys"
                 )
 
-        index_qks = QueryKeys(qks=unique_keys)
-        search_qks = QueryKeys(qks=searchable_keys)
+        return Ok((QueryKeys(qks=unique_keys), QueryKeys(qks=searchable_keys)))
+
+    def query_all(
+        self, credentials: SyftVerifyKey, qks: Union[QueryKey, QueryKeys]
+    ) -> Result[List[BaseStash.object_type], str]:
+        split = self._split_query_keys(qks)
+        if split.is_err():
+            return split
+        index_qks, search_qks = split.ok()
 
         return self.partition.find_index_or_search_keys(
             credentials=credentials, index_qks=index_qks, search_qks=search_qks
         )
 
+    def query_page(
+        self,
+        credentials: SyftVerifyKey,
+        qks: Union[QueryKey, QueryKeys],
+        limit: int,
+        cursor: Optional[PageCursor] = None,
+        sort_key: str = "id",
+    ) -> Result[Page, str]:
+        split = self._split_query_keys(qks)
+        if split.is_err():
+            return split
+        index_qks, search_qks = split.ok()
+
+        return self.partition.page(
+            credentials,
+            limit=limit,
+            cursor=cursor,
+            sort_key=sort_key,
+            index_qks=index_qks,
+            search_qks=search_qks,
+        )
+
     def query_all_kwargs(
         self, credentials: SyftVerifyKey, **kwargs: Dict[str, Any]
     ) -> Result[List[BaseStash.object_type], str]:
@@ -628,6 +866,38 @@ class BaseStash:
             credentials=credentials, qk=qk, obj=obj, has_permission=has_permission
         )
 
+    def set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[BaseStash.object_type],
+        add_permissions: Optional[List[ActionObjectPermission]] = None,
+        ignore_duplicates: bool = False,
+    ) -> Result[List[BaseStash.object_type], str]:
+        return self.partition.set_many(
+            credentials=credentials,
+            objs=objs,
+            ignore_duplicates=ignore_duplicates,
+            add_permissions=add_permissions,
+        )
+
+    def delete_many(
+        self, credentials: SyftVerifyKey, qks: List[QueryKey], has_permission=False
+    ) -> Result[SyftSuccess, str]:
+        return self.partition.delete_many(
+            credentials=credentials, qks=qks, has_permission=has_permission
+        )
+
+    def update_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[BaseStash.object_type],
+        has_permission=False,
+    ) -> Result[List[BaseStash.object_type], str]:
+        qks = [self.partition.store_query_key(obj) for obj in objs]
+        return self.partition.update_many(
+            credentials=credentials, qks=qks, objs=objs, has_permission=has_permission
+        )
+
 
 @instrument
 class BaseUIDStoreStash(BaseStash):
@@ -664,6 +934,35 @@ class BaseUIDStoreStash(BaseStash):
             add_permissions=add_permissions,
         )
 
+    def get_many_by_uid(
+        self, credentials: SyftVerifyKey, uids: List[UID]
+    ) -> Result[List[BaseUIDStoreStash.object_type], str]:
+        return self.partition.get_many(credentials=credentials, uids=uids)
+
+    def delete_many_by_uid(
+        self, credentials: SyftVerifyKey, uids: List[UID]
+    ) -> Result[SyftSuccess, str]:
+        qks = [UIDPartitionKey.with_obj(uid) for uid in uids]
+        return super().delete_many(credentials=credentials, qks=qks)
+
+    def set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[BaseUIDStoreStash.object_type],
+        add_permissions: Optional[List[ActionObjectPermission]] = None,
+        ignore_duplicates: bool = False,
+    ) -> Result[List[BaseUIDStoreStash.object_type], str]:
+        for obj in objs:
+            res = self.check_type(obj, self.object_type)
+            if res.is_err():
+                return res
+        return super().set_many(
+            credentials=credentials,
+            objs=objs,
+            ignore_duplicates=ignore_duplicates,
+            add_permissions=add_permissions,
+        )
+
 
 @serializable()
 class StoreConfig(SyftBaseObject):
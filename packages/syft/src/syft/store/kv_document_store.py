@@ -4,10 +4,14 @@ from __future__ import annotations
 # stdlib
 from collections import defaultdict
 from enum import Enum
+import heapq
 from typing import Any
+from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 
 # third party
 from result import Err
@@ -33,6 +37,8 @@ from .document_store import QueryKey
 from .document_store import QueryKeys
 from .document_store import StoreConfig
 from .document_store import StorePartition
+from .pagination import Page
+from .pagination import PageCursor
 
 
 @serializable()
@@ -87,6 +93,23 @@ class KeyValueBackingStore:
     def __iter__(self) -> Any:
         raise NotImplementedError
 
+    # Bulk operations, backends override them to use a single round trip
+
+    def get_many(self, keys: Iterable[Any]) -> Dict[Any, Any]:
+        return {key: self[key] for key in keys if key in self}
+
+    def existing_keys(self, keys: Iterable[Any]) -> Set[Any]:
+        return {key for key in keys if key in self}
+
+    def set_many(self, items: Dict[Any, Any]) -> None:
+        for key, value in items.items():
+            self[key] = value
+
+    def delete_many(self, keys: Iterable[Any]) -> None:
+        for key in keys:
+            if key in self:
+                del self[key]
+
 
 class KeyValueStorePartition(StorePartition):
     """Key-Value StorePartition
@@ -112,33 +135,33 @@ class KeyValueStorePartition(StorePartition):
             return store_status
 
         try:
-            self.data = self.store_config.backing_store(
-                "data", self.settings, self.store_config
-            )
-            self.unique_keys = self.store_config.backing_store(
-                "unique_keys", self.settings, self.store_config
-            )
-            self.searchable_keys = self.store_config.backing_store(
-                "searchable_keys", self.settings, self.store_config
-            )
-            self.permissions = self.store_config.backing_store(
-                "permissions", self.settings, self.store_config, ddtype=set
-            )
-
-            for partition_key in self.unique_cks:
-                pk_key = partition_key.key
-                if pk_key not in self.unique_keys:
-                    self.unique_keys[pk_key] = {}
-
-            for partition_key in self.searchable_cks:
-                pk_key = partition_key.key
-                if pk_key not in self.searchable_keys:
-                    self.searchable_keys[pk_key] = defaultdict(list)
+            self.data = self._backing_store("data")
+            self.permissions = self._backing_store("permissions", ddtype=set)
+            self._init_keys()
         except BaseException as e:
             return Err(str(e))
 
         return Ok()
 
+    def _backing_store(self, index_name: str, **kwargs: Any) -> KeyValueBackingStore:
+        return self.store_config.backing_store(
+            index_name, self.settings, self.store_config, **kwargs
+        )
+
+    def _init_keys(self) -> None:
+        self.unique_keys = self._backing_store("unique_keys")
+        self.searchable_keys = self._backing_store("searchable_keys")
+
+        for partition_key in self.unique_cks:
+            pk_key = partition_key.key
+            if pk_key not in self.unique_keys:
+                self.unique_keys[pk_key] = {}
+
+        for partition_key in self.searchable_cks:
+            pk_key = partition_key.key
+            if pk_key not in self.searchable_keys:
+                self.searchable_keys[pk_key] = defaultdict(list)
+
     def __len__(self) -> int:
         return len(self.data)
 
@@ -202,11 +225,8 @@ class KeyValueStorePartition(StorePartition):
                     searchable_query_keys=searchable_query_keys,
                     obj=obj,
                 )
-                self.data[uid] = obj
-                if uid not in self.permissions:
-                    # create default permissions
-                    self.permissions[uid] = set()
                 permission = f"{credentials.verify}_READ"
+                # missing permissions default to an empty set
                 permissions = self.permissions[uid]
                 permissions.add(permission)
                 if add_permissions is not None:
@@ -282,12 +302,53 @@ class KeyValueStorePartition(StorePartition):
 
         return False
 
+    def _missing_permissions(
+        self, permissions: List[ActionObjectPermission]
+    ) -> List[ActionObjectPermission]:
+        """has_permission for many permissions, reading the stored ones at once."""
+        # TODO: fix for other admins
+        permissions = [
+            permission
+            for permission in permissions
+            if self.root_verify_key.verify != permission.credentials.verify
+        ]
+        if len(permissions) == 0:
+            return []
+
+        stored = self.permissions.get_many({p.uid for p in permissions})
+        missing = []
+        for permission in permissions:
+            granted = stored.get(permission.uid, set())
+            if permission.permission_string in granted:
+                continue
+            all_read = ActionObjectPermission(permission.uid, ActionPermission.ALL_READ)
+            if (
+                permission.permission == ActionPermission.READ
+                and all_read.permission_string in granted
+            ):
+                continue
+            missing.append(permission)
+        return missing
+
     def _all(
         self, credentials: SyftVerifyKey
     ) -> Result[List[BaseStash.object_type], str]:
         # this checks permissions
-        res = [self._get(uid, credentials) for uid in self.data.keys()]
-        return Ok([x.ok() for x in res if x.is_ok()])
+        return self._get_many(credentials, self.data.keys())
+
+    def _get_many(
+        self, credentials: SyftVerifyKey, uids: List[UID]
+    ) -> Result[List[SyftObject], str]:
+        # readable objects in the order of uids, others are left out
+        uids = list(uids)
+        denied = {
+            permission.uid
+            for permission in self._missing_permissions(
+                [ActionObjectREAD(uid=uid, credentials=credentials) for uid in uids]
+            )
+        }
+        objs = self.data.get_many([uid for uid in set(uids) if uid not in denied])
+        return Ok([objs[uid] for uid in uids if uid in objs])
 
     def _remove_keys(
         self,
@@ -309,6 +370,14 @@ class KeyValueStorePartition(StorePartition):
     def _find_index_or_search_keys(
         self, credentials: SyftVerifyKey, index_qks: QueryKeys, search_qks: QueryKeys
     ) -> Result[List[SyftObject], str]:
+        ids = self._find_uids(index_qks, search_qks)
+        if ids.is_err():
+            return ids
+        return self._get_many(credentials, list(ids.ok()))
+
+    def _find_uids(
+        self, index_qks: QueryKeys, search_qks: QueryKeys
+    ) -> Result[Set[UID], str]:
         ids: Optional[Set] = None
         errors = []
         # third party
@@ -336,10 +405,62 @@ class KeyValueStorePartition(StorePartition):
             return Err(" ".join(errors))
 
         if ids is None:
-            return Ok([])
+            return Ok(set())
+
+        return Ok(ids)
+
+    def _page(
+        self,
+        credentials: SyftVerifyKey,
+        limit: int,
+        cursor: Optional[PageCursor],
+        sort_key: str,
+        index_qks: Optional[QueryKeys],
+        search_qks: Optional[QueryKeys],
+    ) -> Result[Page, str]:
+        if sort_key != "id":
+            return super()._page(
+                credentials, limit, cursor, sort_key, index_qks, search_qks
+            )
 
-        qks: QueryKeys = self.store_query_keys(ids)
-        return self._get_all_from_store(credentials=credentials, qks=qks)
+        # ordered by id just the uids of a page are looked up and only its
+        # objects loaded. Unreadable objects are left out, so more uids are
+        # looked up until there is one more than limit or none are left.
+        items: List[SyftObject] = []
+        after = None if cursor is None else cursor.uid
+        while len(items) <= limit:
+            count = limit + 1 - len(items)
+            uids = self._uids_after(after, count, index_qks, search_qks)
+            if uids.is_err():
+                return uids
+            uids = uids.ok()
+            items.extend(self._get_many(credentials, uids).ok())
+            if len(uids) < count:
+                break
+            after = uids[-1]
+        return Ok(Page.from_items(items, limit, sort_key))
+
+    def _uids_after(
+        self,
+        after: Optional[UID],
+        count: int,
+        index_qks: Optional[QueryKeys],
+        search_qks: Optional[QueryKeys],
+    ) -> Result[List[UID], str]:
+        """The first count uids greater than after, out of the objects matching
+        index_qks and search_qks if either is given."""
+        if index_qks is None and search_qks is None:
+            uids = self.data.keys()
+        else:
+            found = self._find_uids(
+                index_qks or QueryKeys(qks=[]), search_qks or QueryKeys(qks=[])
+            )
+            if found.is_err():
+                return found
+            uids = found.ok()
+        if after is not None:
+            uids = (uid for uid in uids if uid > after)
+        return Ok(heapq.nsmallest(count, uids))
 
     def remove_keys(
         self,
@@ -423,14 +544,7 @@ class KeyValueStorePartition(StorePartition):
     def _get_all_from_store(
         self, credentials: SyftVerifyKey, qks: QueryKeys
     ) -> Result[List[SyftObject], str]:
-        matches = []
-        for qk in qks.all:
-            if qk.value in self.data:
-                if self.has_permission(
-                    ActionObjectREAD(uid=qk.value, credentials=credentials)
-                ):
-                    matches.append(self.data[qk.value])
-        return Ok(matches)
+        return self._get_many(credentials, [qk.value for qk in qks.all])
 
     def create(self, obj: SyftObject) -> Result[SyftObject, str]:
         pass
@@ -453,6 +567,157 @@ class KeyValueStorePartition(StorePartition):
         except Exception as e:
             return Err(f"Failed to delete with query key {qk} with error: {e}")
 
+    def _set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[SyftObject],
+        add_permissions: Optional[List[ActionObjectPermission]] = None,
+        ignore_duplicates: bool = False,
+    ) -> Result[List[SyftObject], str]:
+        # same checks as _set, but existing objects and permissions are read
+        # at once and nothing is written until every object passed them
+        for obj in objs:
+            if obj.id is None:
+                obj.id = UID()
+        store_query_keys = [self.settings.store_key.with_obj(obj) for obj in objs]
+        uids = [qk.value for qk in store_query_keys]
+        existing = self.data.existing_keys(uids)
+        stored = self.permissions.get_many(uids)
+        claimed = set()
+
+        entries = []
+        permissions = {}
+        for obj, store_query_key in zip(objs, store_query_keys):
+            uid = store_query_key.value
+            unique_query_keys = self.settings.unique_keys.with_obj(obj)
+            ck_check = self._check_partition_keys_unique(
+                unique_query_keys=unique_query_keys
+            )
+            unique_values = {(qk.key, str(qk.value)) for qk in unique_query_keys.all}
+            if (
+                uid in existing
+                or ck_check != UniqueKeyCheck.EMPTY
+                or not claimed.isdisjoint(unique_values)
+            ):
+                if not ignore_duplicates:
+                    return Err(f"Duplication Key Error: {obj}")
+                continue
+            claimed.update(unique_values)
+
+            # first person using this UID can claim ownership
+            if uid in stored:
+                write_permission = ActionObjectWRITE(uid=uid, credentials=credentials)
+                return Err(f"Permission: {write_permission} denied")
+            owner_permissions = [
+                ActionObjectOWNER(uid=uid, credentials=credentials),
+                ActionObjectWRITE(uid=uid, credentials=credentials),
+                ActionObjectREAD(uid=uid, credentials=credentials),
+                ActionObjectEXECUTE(uid=uid, credentials=credentials),
+            ]
+            permissions[uid] = {x.permission_string for x in owner_permissions}
+            permissions[uid].add(f"{credentials.verify}_READ")
+            if add_permissions is not None:
+                permissions[uid].update([x.permission_string for x in add_permissions])
+
+            entries.append(
+                (
+                    store_query_key,
+                    unique_query_keys,
+                    self.settings.searchable_keys.with_obj(obj),
+                    obj,
+                )
+            )
+
+        with self.transaction():
+            self._set_many_data_and_keys(entries)
+            self.permissions.set_many(permissions)
+        return Ok(objs)
+
+    def _update_many(
+        self,
+        credentials: SyftVerifyKey,
+        qks: List[QueryKey],
+        objs: List[SyftObject],
+        has_permission: bool = False,
+    ) -> Result[List[SyftObject], str]:
+        uids = [qk.value for qk in qks]
+        originals = self.data.get_many(uids)
+        for qk in qks:
+            if qk.value not in originals:
+                return Err(f"No object exists for query key: {qk}")
+        if not has_permission:
+            missing = self._missing_permissions(
+                [ActionObjectWRITE(uid=uid, credentials=credentials) for uid in uids]
+            )
+            if len(missing) > 0:
+                return Err(
+                    f"Failed to update obj {missing[0].uid}, you have no permission"
+                )
+
+        entries = []
+        with self.transaction():
+            for qk, obj in zip(qks, objs):
+                original = originals[qk.value]
+                self._remove_keys(
+                    unique_query_keys=self.settings.unique_keys.with_obj(original),
+                    searchable_query_keys=self.settings.searchable_keys.with_obj(
+                        original
+                    ),
+                )
+                for key, value in obj.to_dict(exclude_none=True).items():
+                    if key == "id":
+                        # protected field
+                        continue
+                    setattr(original, key, value)
+                entries.append(
+                    (
+                        qk,
+                        self.settings.unique_keys.with_obj(original),
+                        self.settings.searchable_keys.with_obj(original),
+                        original,
+                    )
+                )
+            self._set_many_data_and_keys(entries)
+        return Ok([originals[uid] for uid in uids])
+
+    def _delete_many(
+        self, credentials: SyftVerifyKey, qks: List[QueryKey], has_permission=False
+    ) -> Result[SyftSuccess, str]:
+        uids = [qk.value for qk in qks]
+        if not has_permission:
+            missing = self._missing_permissions(
+                [ActionObjectWRITE(uid=uid, credentials=credentials) for uid in uids]
+            )
+            if len(missing) > 0:
+                return Err(
+                    f"Failed to delete with query key {missing[0].uid}, "
+                    + "you have no permission"
+                )
+
+        objs = self.data.get_many(uids)
+        for uid in uids:
+            if uid not in objs:
+                return Err(f"Failed to delete with query key {uid}, not found")
+
+        with self.transaction():
+            self.data.delete_many(objs.keys())
+            for obj in objs.values():
+                self._delete_unique_keys_for(obj)
+                self._delete_search_keys_for(obj)
+        return Ok(SyftSuccess(message=f"Deleted {len(objs)} objects"))
+
+    def _set_many_data_and_keys(
+        self, entries: List[Tuple[QueryKey, QueryKeys, QueryKeys, SyftObject]]
+    ) -> None:
+        # (store_query_key, unique_query_keys, searchable_query_keys, obj)
+        for store_query_key, unique_query_keys, searchable_query_keys, obj in entries:
+            self._set_data_and_keys(
+                store_query_key=store_query_key,
+                unique_query_keys=unique_query_keys,
+                searchable_query_keys=searchable_query_keys,
+                obj=obj,
+            )
+
     def _delete_unique_keys_for(self, obj: SyftObject) -> Result[SyftSuccess, str]:
         for _unique_ck in self.unique_cks:
             qk = _unique_ck.with_obj(obj)
@@ -1,14 +1,17 @@
 # stdlib
 from typing import Any
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Type
 
 # third party
 from pymongo import ASCENDING
+from pymongo import UpdateOne
 from pymongo import WriteConcern
 from pymongo.collection import Collection as MongoCollection
+from pymongo.errors import BulkWriteError
 from pymongo.errors import DuplicateKeyError
 from result import Err
 from result import Ok
@@ -29,6 +32,7 @@ from ..types.syft_object import SyftObjectRegistry
 from ..types.transforms import TransformContext
 from ..types.transforms import transform
 from ..types.transforms import transform_method
+from ..types.uid import UID
 from .document_store import DocumentStore
 from .document_store import QueryKey
 from .document_store import QueryKeys
@@ -38,6 +42,8 @@ from .locks import LockingConfig
 from .locks import NoLockingConfig
 from .mongo_client import MongoClient
 from .mongo_client import MongoStoreClientConfig
+from .pagination import Page
+from .pagination import PageCursor
 
 
 @serializable()
@@ -309,6 +315,11 @@ class MongoStorePartition(StorePartition):
         collection = collection_status.ok()
 
         storage_objs = collection.find(filter=qks.as_dict_mongo)
+        return Ok(self._readable(credentials, storage_objs))
+
+    def _readable(
+        self, credentials: SyftVerifyKey, storage_objs: Iterable[Dict]
+    ) -> List[SyftObject]:
         syft_objs = []
         for storage_obj in storage_objs:
             obj = self.storage_type(storage_obj)
@@ -320,7 +331,44 @@ class MongoStorePartition(StorePartition):
         for s in syft_objs:
             if self.has_permission(ActionObjectREAD(uid=s.id, credentials=credentials)):
                 res.append(s)
-        return Ok(res)
+        return res
+
+    def _page(
+        self,
+        credentials: SyftVerifyKey,
+        limit: int,
+        cursor: Optional[PageCursor],
+        sort_key: str,
+        index_qks: Optional[QueryKeys],
+        search_qks: Optional[QueryKeys],
+    ) -> Result[Page, str]:
+        if sort_key != "id":
+            return super()._page(
+                credentials, limit, cursor, sort_key, index_qks, search_qks
+            )
+
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection = collection_status.ok()
+
+        # ordered by id Mongo sorts and limits the objects, one more than
+        # limit tells if there is a next page. Ids are stored serialized,
+        # which sorts them like UIDs.
+        qks = QueryKeys(qks=[])
+        if index_qks is not None or search_qks is not None:
+            qks = QueryKeys(
+                qks=(index_qks or qks).all + (search_qks or qks).all  # type: ignore
+            )
+        query_filter = qks.as_dict_mongo
+        if cursor is not None:
+            query_filter = {"$and": [query_filter, {"_id": {"$gt": cursor.uid}}]}
+        storage_objs = (
+            collection.find(filter=query_filter).sort("_id", ASCENDING).limit(limit + 1)
+        )
+        return Ok(
+            Page.from_items(self._readable(credentials, storage_objs), limit, sort_key)
+        )
 
     def _delete(
         self, credentials: SyftVerifyKey, qk: QueryKey, has_permission: bool = False
@@ -341,6 +389,105 @@ class MongoStorePartition(StorePartition):
 
         return Err(f"Failed to delete object with qk: {qk}")
 
+    def _set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[SyftObject],
+        add_permissions: Optional[List[ActionObjectPermission]] = None,
+        ignore_duplicates: bool = False,
+    ) -> Result[List[SyftObject], str]:
+        for obj in objs:
+            write_permission = ActionObjectWRITE(uid=obj.id, credentials=credentials)
+            if not self.has_permission(write_permission):
+                return Err(f"No permission to write object with id {obj.id}")
+
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection = collection_status.ok()
+
+        storage_objs = [obj.to(self.storage_type) for obj in objs]
+        if ignore_duplicates:
+            # unordered, so the inserts go on after a duplicate
+            collection = collection.with_options(write_concern=WriteConcern(w=0))
+        try:
+            collection.insert_many(storage_objs, ordered=not ignore_duplicates)
+        except BulkWriteError as e:
+            return Err(f"Duplicate Key Error for {objs}: {e}")
+        if add_permissions is not None:
+            pass
+            # TODO: update permissions
+        return Ok(objs)
+
+    def _get_many(
+        self, credentials: SyftVerifyKey, uids: List[UID]
+    ) -> Result[List[SyftObject], str]:
+        qk = QueryKey(key="id", type_=List[UID], value=list(uids))
+        res = self._get_all_from_store(credentials, QueryKeys(qks=[qk]))
+        if res.is_err():
+            return res
+        objs = {obj.id: obj for obj in res.ok()}
+        return Ok([objs[uid] for uid in uids if uid in objs])
+
+    def _update_many(
+        self,
+        credentials: SyftVerifyKey,
+        qks: List[QueryKey],
+        objs: List[SyftObject],
+        has_permission: bool = False,
+    ) -> Result[List[SyftObject], str]:
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection = collection_status.ok()
+
+        operations = []
+        for qk, obj in zip(qks, objs):
+            prev_obj_status = self._get_all_from_store(credentials, QueryKeys(qks=[qk]))
+            if prev_obj_status.is_err() or len(prev_obj_status.ok()) == 0:
+                return Err(f"No object found with query key: {qk}")
+            prev_obj = prev_obj_status.ok()[0]
+            if not has_permission and not self.has_permission(
+                ActionObjectWRITE(uid=prev_obj.id, credentials=credentials)
+            ):
+                return Err(f"Failed to update obj {obj}, you have no permission")
+
+            # we don't want to overwrite Mongo's "id_" or Syft's "id" on update
+            obj_id = obj["id"]
+            setattr(obj, "id", prev_obj["id"])
+            storage_obj = obj.to(self.storage_type)
+            setattr(obj, "id", obj_id)
+            operations.append(
+                UpdateOne(filter=qk.as_dict_mongo, update={"$set": storage_obj})
+            )
+
+        try:
+            collection.bulk_write(operations)
+        except Exception as e:
+            return Err(f"Failed to update objs with qks: {qks}. Error: {e}")
+        return Ok(objs)
+
+    def _delete_many(
+        self, credentials: SyftVerifyKey, qks: List[QueryKey], has_permission=False
+    ) -> Result[SyftSuccess, str]:
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection = collection_status.ok()
+
+        for qk in qks:
+            if not has_permission and not self.has_permission(
+                ActionObjectWRITE(uid=qk.value, credentials=credentials)
+            ):
+                return Err(f"Failed to delete object with qk: {qk}")
+
+        result = collection.delete_many(
+            filter={"$or": [QueryKeys(qks=qk).as_dict_mongo for qk in qks]}
+        )
+        if result.deleted_count == len(qks):
+            return Ok(SyftSuccess(message=f"Deleted {len(qks)} objects"))
+        return Err(f"Deleted {result.deleted_count} of {len(qks)} objects")
+
     def has_permission(self, permission: ActionObjectPermission) -> bool:
         # TODO: implement
         return True
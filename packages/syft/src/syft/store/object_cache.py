@@ -0,0 +1,100 @@
+# stdlib
+from collections import OrderedDict
+import threading
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Tuple
+
+
+class ObjectCache:
+    """Least recently used values of a store, bounded by count and by size.
+
+    Stores put the messages they read from disk, `size` is what the value
+    took there. Every invalidation starts a new generation, `put` ignores
+    values loaded in an older one, so a value read while it was being
+    written does not replace the newer one in the cache.
+
+    Parameters:
+        `max_items`: int
+            Maximum number of values, 0 disables the cache
+        `max_bytes`: int
+            Maximum total size of the values, 0 disables the cache
+    """
+
+    def __init__(self, max_items: int, max_bytes: int) -> None:
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Any, Tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_items > 0 and self.max_bytes > 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Any, value: Any, size: int, generation: int) -> None:
+        if not self.enabled or size > self.max_bytes:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._pop(key)
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_items or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def _pop(self, key: Any) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def invalidate(self, keys: Iterable[Any]) -> None:
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "items": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._entries
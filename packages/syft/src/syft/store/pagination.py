@@ -0,0 +1,114 @@
+# future
+from __future__ import annotations
+
+# stdlib
+import heapq
+from typing import Any
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# relative
+from ..serde.serializable import serializable
+from ..types.datetime import DateTime
+from ..types.syft_object import SYFT_OBJECT_VERSION_1
+from ..types.syft_object import SyftObject
+from ..types.uid import UID
+
+
+class FullScanWarning(UserWarning):
+    """A page was cut out of every object found instead of by the store."""
+
+
+def sort_key_of(value: Any, uid: UID) -> Tuple[bool, Any, UID]:
+    # None sorts first and is never compared with other values
+    if isinstance(value, DateTime):
+        value = value.utc_timestamp
+    return (value is not None, value, uid)
+
+
+@serializable()
+class PageCursor(SyftObject):
+    """Position after the last object of a page, objects are ordered by the
+    value of sort_key and then by id."""
+
+    __canonical_name__ = "PageCursor"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    sort_key: str
+    value: Any
+    uid: UID
+
+    @staticmethod
+    def after(obj: SyftObject, sort_key: str) -> PageCursor:
+        return PageCursor(
+            sort_key=sort_key, value=getattr(obj, sort_key, None), uid=obj.id
+        )
+
+    @property
+    def key(self) -> Tuple[bool, Any, UID]:
+        return sort_key_of(self.value, self.uid)
+
+
+@serializable()
+class Page(SyftObject):
+    """Objects of a paginated query, next_cursor gets the next page or is None
+    for the last one."""
+
+    __canonical_name__ = "Page"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    items: List[Any]
+    sort_key: str
+    next_cursor: Optional[PageCursor]
+
+    @staticmethod
+    def from_items(items: List[SyftObject], limit: int, sort_key: str) -> Page:
+        """items holds up to limit + 1 objects, the extra one tells that there
+        is a next page."""
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = PageCursor.after(items[-1], sort_key)
+        return Page(items=items, sort_key=sort_key, next_cursor=next_cursor)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.items)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.items[index]
+
+    def _repr_html_(self) -> str:
+        more = "" if self.next_cursor is None else " (more pages)"
+        return self.items._repr_html_() + more
+
+
+def check_page_args(
+    limit: int, cursor: Optional[PageCursor], sort_key: str
+) -> Optional[str]:
+    if limit < 1:
+        return f"Page limit must be at least 1, not {limit}"
+    if cursor is not None and cursor.sort_key != sort_key:
+        return (
+            f"Cursor of a page sorted by {cursor.sort_key} used to sort by {sort_key}"
+        )
+    return None
+
+
+def paginate(
+    objs: Iterable[SyftObject],
+    limit: int,
+    cursor: Optional[PageCursor],
+    sort_key: str,
+) -> Page:
+    """The page of limit objects after cursor, out of all the objects found."""
+    keyed = [(sort_key_of(getattr(obj, sort_key, None), obj.id), obj) for obj in objs]
+    if cursor is not None:
+        keyed = [(key, obj) for key, obj in keyed if key > cursor.key]
+    first = heapq.nsmallest(limit + 1, keyed, key=lambda entry: entry[0])
+    return Page.from_items([obj for _, obj in first], limit, sort_key)
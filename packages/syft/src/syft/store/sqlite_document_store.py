@@ -2,15 +2,21 @@
 from __future__ import annotations
 
 # stdlib
+from contextlib import contextmanager
 from copy import deepcopy
 from pathlib import Path
 import sqlite3
 import tempfile
 import threading
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Set
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -22,17 +28,25 @@ from typing_extensions import Self
 
 # relative
 from ..serde.deserialize import _deserialize
+from ..serde.passthrough import encode_afresh
+from ..serde.passthrough import remember_encoding
 from ..serde.serializable import serializable
-from ..serde.serialize import _serialize
+from ..serde.stream import serialize_buffer
+from ..service.response import SyftSuccess
+from ..types.syft_object import SyftObject
 from ..types.uid import UID
 from .document_store import DocumentStore
 from .document_store import PartitionSettings
+from .document_store import QueryKey
+from .document_store import QueryKeys
 from .document_store import StoreClientConfig
 from .document_store import StoreConfig
 from .kv_document_store import KeyValueBackingStore
 from .kv_document_store import KeyValueStorePartition
+from .kv_document_store import UniqueKeyCheck
 from .locks import FileLockingConfig
 from .locks import LockingConfig
+from .object_cache import ObjectCache
 
 
 def _repr_debug_(value: Any) -> str:
@@ -45,6 +59,148 @@ def thread_ident() -> int:
     return threading.current_thread().ident
 
 
+# stay below the SQLite limit of variables per statement
+SQLITE_MAX_VARIABLES = 500
+
+
+def chunked(values: List[Any], size: int = SQLITE_MAX_VARIABLES) -> Iterator[List[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]  # noqa: E203
+
+
+def placeholders(values: List[Any]) -> str:
+    return ", ".join(["?"] * len(values))
+
+
+class SQLiteConnection:
+    """Connections to a SQLite database, one per thread.
+
+    The stores of a partition share them, so a single transaction can span its
+    data, permissions and keys. The connections are in autocommit mode: a
+    statement outside of a transaction commits on its own, and reads never
+    open a write transaction. `transaction` takes the write lock up front with
+    BEGIN IMMEDIATE and nests as savepoints. Listeners are told when a
+    transaction commits and when one is rolled back, including savepoints.
+
+    Parameters:
+        `client_config`: SQLiteStoreClientConfig
+            Connection Configuration
+    """
+
+    def __init__(self, client_config: SQLiteStoreClientConfig) -> None:
+        self.client_config = client_config
+        self._db: Dict[int, sqlite3.Connection] = {}
+        self._depth: Dict[int, int] = {}
+        self._listeners: List[Callable[[bool], None]] = []
+
+    def _connect(self) -> None:
+        # SQLite is not thread safe by default so we ensure that each connection
+        # comes from a different thread. In cases of Uvicorn and other AWSGI servers
+        # there will be many threads handling incoming requests so we need to ensure
+        # that different connections are used in each thread. By using a dict for the
+        # _db we can ensure they are never shared
+        config = self.client_config
+        db = sqlite3.connect(
+            config.file_path,
+            timeout=config.timeout,
+            check_same_thread=config.check_same_thread,
+            cached_statements=config.cached_statements,
+            isolation_level=None,
+        )
+        if config.journal_mode is not None:
+            db.execute(f"pragma journal_mode={config.journal_mode}")  # nosec
+        if config.synchronous is not None:
+            db.execute(f"pragma synchronous={config.synchronous}")  # nosec
+        self._db[thread_ident()] = db
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        if thread_ident() not in self._db:
+            self._connect()
+        return self._db[thread_ident()]
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._depth.get(thread_ident(), 0) > 0
+
+    def data_version(self) -> int:
+        # changes when any other connection, in any process, commits to the file
+        return self.db.execute("pragma data_version").fetchone()[0]
+
+    def add_listener(self, listener: Callable[[bool], None]) -> None:
+        """listener(True) runs after a commit, listener(False) after a rollback."""
+        self._listeners.append(listener)
+
+    def _notify(self, committed: bool) -> None:
+        for listener in self._listeners:
+            listener(committed)
+
+    def begin(self) -> None:
+        depth = self._depth.get(thread_ident(), 0)
+        if depth == 0:
+            self.db.execute("begin immediate")
+        else:
+            self.db.execute(f"savepoint syft_{depth}")
+        self._depth[thread_ident()] = depth + 1
+
+    def commit(self) -> None:
+        depth = self._depth[thread_ident()] - 1
+        try:
+            if depth == 0:
+                self.db.execute("commit")
+            else:
+                self.db.execute(f"release syft_{depth}")
+        except BaseException:
+            self.rollback()
+            raise
+        self._depth[thread_ident()] = depth
+        if depth == 0:
+            self._notify(True)
+
+    def rollback(self) -> None:
+        depth = self._depth[thread_ident()] - 1
+        self._depth[thread_ident()] = depth
+        try:
+            if depth > 0:
+                self.db.execute(f"rollback to syft_{depth}")
+                self.db.execute(f"release syft_{depth}")
+            elif self.db.in_transaction:
+                self.db.execute("rollback")
+        finally:
+            self._notify(False)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        self.begin()
+        try:
+            yield
+        except BaseException:
+            self.rollback()
+            raise
+        self.commit()
+
+    def unit_of_work(self, cbk: Callable, *args: Any, **kwargs: Any) -> Result:
+        """Calls cbk in a transaction, which is rolled back if cbk returns an Err
+        or raises."""
+        self.begin()
+        try:
+            result = cbk(*args, **kwargs)
+        except BaseException:
+            self.rollback()
+            raise
+        if isinstance(result, Err):
+            self.rollback()
+        else:
+            self.commit()
+        return result
+
+    def close(self) -> None:
+        self._depth.pop(thread_ident(), None)
+        db = self._db.pop(thread_ident(), None)
+        if db is not None:
+            db.close()
+
+
 @serializable(attrs=["index_name", "settings", "store_config"])
 class SQLiteBackingStore(KeyValueBackingStore):
     """Core Store logic for the SQLite stores.
@@ -58,6 +214,10 @@ class SQLiteBackingStore(KeyValueBackingStore):
             Connection Configuration
         `ddtype`: Type
             Class used as fallback on `get` errors
+        `connection`: SQLiteConnection
+            Connections shared with other stores, a new one if None
+        `cache`: ObjectCache
+            Stored messages kept in memory, none are kept if None
     """
 
     def __init__(
@@ -66,119 +226,238 @@ class SQLiteBackingStore(KeyValueBackingStore):
         settings: PartitionSettings,
         store_config: StoreConfig,
         ddtype: Optional[type] = None,
+        connection: Optional[SQLiteConnection] = None,
+        cache: Optional[ObjectCache] = None,
     ) -> None:
         self.index_name = index_name
         self.settings = settings
         self.store_config = store_config
         self._ddtype = ddtype
-        self._db: Dict[int, sqlite3.Connection] = {}
-        self._cur: Dict[int, sqlite3.Cursor] = {}
+        self._owns_connection = connection is None
+        if connection is None:
+            connection = SQLiteConnection(store_config.client_config)
+        self.connection = connection
+        self.cache = cache if cache is not None and cache.enabled else None
+        self.sql = self._prepare_statements()
         self.create_table()
+        if self.cache is not None:
+            self._init_cache()
 
     @property
     def table_name(self) -> str:
         return f"{self.settings.name}_{self.index_name}"
 
-    def _connect(self) -> None:
-        # SQLite is not thread safe by default so we ensure that each connection
-        # comes from a different thread. In cases of Uvicorn and other AWSGI servers
-        # there will be many threads handling incoming requests so we need to ensure
-        # that different connections are used in each thread. By using a dict for the
-        # _db and _cur we can ensure they are never shared
-        self.file_path = self.store_config.client_config.file_path
-        self._db[thread_ident()] = sqlite3.connect(
-            self.file_path,
-            timeout=self.store_config.client_config.timeout,
-            check_same_thread=self.store_config.client_config.check_same_thread,
-        )
-
-        # TODO: Review OSX compatibility.
-        # Set journal mode to WAL.
-        # self._db[thread_ident()].execute("pragma journal_mode=wal")
+    def _prepare_statements(self) -> Dict[str, str]:
+        # formatted once, every call hits the statement cache of the connection
+        table = self.table_name
+        return {
+            "upsert": f"insert into {table} (uid, repr, value) VALUES (?, ?, ?) "  # nosec
+            + "on conflict (uid) do update set repr = excluded.repr, value = excluded.value",
+            "update": f"update {table} set repr = ?, value = ? where uid = ?",  # nosec
+            "get": f"select value from {table} where uid = ?",  # nosec
+            "exists": f"select 1 from {table} where uid = ?",  # nosec
+            "get_all": f"select uid, value from {table}",  # nosec
+            "get_all_keys": f"select uid from {table}",  # nosec
+            "delete": f"delete from {table} where uid = ?",  # nosec
+            "delete_all": f"delete from {table}",  # nosec
+            "len": f"select count(*) from {table}",  # nosec
+            "get_version": "select version from syft_versions where name = ?",
+            "bump_version": "insert into syft_versions (name, version) VALUES (?, 1) "
+            + "on conflict (name) do update set version = version + 1",
+        }
 
     def create_table(self):
         try:
-            self.cur.execute(
+            self.db.execute(
                 f"create table {self.table_name} (uid VARCHAR(32) NOT NULL PRIMARY KEY, "  # nosec
                 + "repr TEXT NOT NULL, value BLOB NOT NULL)"  # nosec
             )
-            self.db.commit()
         except sqlite3.OperationalError as e:
             if f"table {self.table_name} already exists" not in str(e):
                 raise e
 
     @property
     def db(self) -> sqlite3.Connection:
-        if thread_ident() not in self._db:
-            self._connect()
-        return self._db[thread_ident()]
-
-    @property
-    def cur(self) -> sqlite3.Cursor:
-        if thread_ident() not in self._cur:
-            self._cur[thread_ident()] = self.db.cursor()
-
-        return self._cur[thread_ident()]
+        return self.connection.db
 
     def _close(self) -> None:
-        self._commit()
-        self.db.close()
+        self.connection.close()
 
     def _commit(self) -> None:
-        self.db.commit()
+        # statements outside of a transaction are already committed
+        if not self.connection.in_transaction:
+            self.db.commit()
 
     def _execute(
         self, sql: str, *args: Optional[List[Any]]
     ) -> Result[Ok[sqlite3.Cursor], Err[str]]:
-        cursor: Optional[sqlite3.Cursor] = None
-        err = None
+        # outside of a transaction the statement commits on its own, or is
+        # undone by SQLite if it fails
         try:
-            cursor = self.cur.execute(sql, *args)
+            cursor = self.db.execute(sql, *args)
         except BaseException as e:
-            self.db.rollback()  # Roll back all changes if an exception occurs.
-            err = Err(str(e))
-        else:
-            self.db.commit()  # Commit if everything went ok
-
-        if err is not None:
-            return err
+            return Err(str(e))
+        return Ok(cursor)
 
+    def _executemany(
+        self, sql: str, rows: Iterable[Any]
+    ) -> Result[Ok[sqlite3.Cursor], Err[str]]:
+        try:
+            with self.connection.transaction():
+                cursor = self.db.executemany(sql, rows)
+        except BaseException as e:
+            return Err(str(e))
         return Ok(cursor)
 
-    def _set(self, key: UID, value: Any) -> None:
-        if self._exists(key):
-            self._update(key, value)
+    # The cache keeps the stored message of recently read objects, so reading
+    # them again skips the query but still decodes them. Every write
+    # bumps the version of the table in syft_versions, a different version
+    # than the last one seen means another process wrote to the table and the
+    # cache is dropped. data_version tells if anything was committed at all,
+    # so reads only look up the version after a commit of another connection.
+
+    def _init_cache(self) -> None:
+        self._version: Optional[int] = None
+        self._data_versions: Dict[int, int] = {}
+        # keys written by the open transaction of a thread, None for all
+        self._dirty: Dict[int, Optional[Set[UID]]] = {}
+        self.db.execute(
+            "create table if not exists syft_versions ("
+            + "name TEXT NOT NULL PRIMARY KEY, version INTEGER NOT NULL)"
+        )
+        self.connection.add_listener(self._transaction_ended)
+
+    def _read_version(self) -> int:
+        row = self.db.execute(self.sql["get_version"], [self.table_name]).fetchone()
+        return 0 if row is None else row[0]
+
+    def _sync_cache(self) -> None:
+        data_version = self.connection.data_version()
+        if self._data_versions.get(thread_ident(), None) == data_version:
+            return
+        self._data_versions[thread_ident()] = data_version
+        version = self._read_version()
+        if version != self._version:
+            self.cache.clear()
+            self._version = version
+
+    def _bump_version(self) -> None:
+        with self.connection.transaction():
+            self.db.execute(self.sql["bump_version"], [self.table_name])
+            version = self._read_version()
+        if self._version != version - 1:
+            # missed a write of another process
+            self.cache.clear()
+        self._version = version
+
+    def _evict(self, keys: Optional[List[UID]]) -> None:
+        if keys is None:
+            self.cache.clear()
         else:
-            insert_sql = f"insert into {self.table_name} (uid, repr, value) VALUES (?, ?, ?)"  # nosec
-            data = _serialize(value, to_bytes=True)
-            res = self._execute(insert_sql, [str(key), _repr_debug_(value), data])
-            if res.is_err():
-                raise ValueError(res.err())
+            self.cache.invalidate(keys)
+
+    @contextmanager
+    def _invalidating(self, keys: Optional[Iterable[UID]]) -> Iterator[None]:
+        # keys None stands for every object in the table
+        if self.cache is None:
+            yield
+            return
+        keys = None if keys is None else list(keys)
+        self._evict(keys)
+        yield
+        self._bump_version()
+        # evicted again after the write, and after the commit of its transaction,
+        # so an object another thread read before either is not left behind
+        self._evict(keys)
+        if self.connection.in_transaction:
+            dirty = self._dirty.get(thread_ident(), set())
+            if keys is None or dirty is None:
+                self._dirty[thread_ident()] = None
+            else:
+                self._dirty[thread_ident()] = dirty | set(keys)
+
+    def _transaction_ended(self, committed: bool) -> None:
+        if thread_ident() not in self._dirty:
+            # nothing written to this table
+            return
+        if not committed:
+            # the rolled back writes bumped a version which is gone now
+            self.cache.clear()
+            self._version = None
+            self._data_versions.clear()
+        if not self.connection.in_transaction:
+            self._evict(self._dirty.pop(thread_ident()))
+
+    def _generation(self) -> int:
+        return 0 if self.cache is None else self.cache.generation
+
+    def _from_cache(self, key: UID) -> Optional[Any]:
+        if self.cache is None:
+            return None
+        self._sync_cache()
+        data = self.cache.get(key)
+        if data is None:
+            return None
+        # every reader decodes its own objects, so none of them is shared
+        return self._deserialize(data)
+
+    def _load(self, key: UID, data: bytes, generation: int) -> Any:
+        # generation is read before the row, see ObjectCache.put
+        if self.cache is not None:
+            self.cache.put(key, data, len(data), generation)
+        return self._deserialize(data)
+
+    def _encode(self, value: Any) -> Union[bytes, memoryview]:
+        with encode_afresh():
+            return serialize_buffer(value)
+
+    def _set(self, key: UID, value: Any) -> None:
+        data = self._encode(value)
+        with self._invalidating([key]):
+            res = self._execute(
+                self.sql["upsert"], [str(key), _repr_debug_(value), data]
+            )
+        if res.is_err():
+            raise ValueError(res.err())
 
     def _update(self, key: UID, value: Any) -> None:
-        insert_sql = f"update {self.table_name} set uid = ?, repr = ?, value = ? where uid = ?"  # nosec
-        data = _serialize(value, to_bytes=True)
-        res = self._execute(insert_sql, [str(key), _repr_debug_(value), data, str(key)])
+        data = self._encode(value)
+        with self._invalidating([key]):
+            res = self._execute(
+                self.sql["update"], [_repr_debug_(value), data, str(key)]
+            )
         if res.is_err():
             raise ValueError(res.err())
 
+    def _deserialize(self, data: bytes) -> Any:
+        obj = _deserialize(data, from_bytes=True, trusted=True)
+        # responses with the unchanged object copy data instead of encoding it
+        remember_encoding(obj, data)
+        return obj
+
     def _get(self, key: UID) -> Any:
-        select_sql = f"select * from {self.table_name} where uid = ?"  # nosec
-        res = self._execute(select_sql, [str(key)])
+        cached = self._from_cache(key)
+        if cached is not None:
+            return cached
+
+        generation = self._generation()
+        res = self._execute(self.sql["get"], [str(key)])
         if res.is_err():
-            raise KeyError(f"Query {select_sql} failed")
+            raise KeyError(f"Query {self.sql['get']} failed")
         cursor = res.ok()
 
         row = cursor.fetchone()
         if row is None or len(row) == 0:
             raise KeyError(f"{key} not in {type(self)}")
-        data = row[2]
-        return _deserialize(data, from_bytes=True)
+        return self._load(key, row[0], generation)
 
     def _exists(self, key: UID) -> bool:
-        select_sql = f"select uid from {self.table_name} where uid = ?"  # nosec
+        if self.cache is not None:
+            self._sync_cache()
+            if key in self.cache:
+                return True
 
-        res = self._execute(select_sql, [str(key)])
+        res = self._execute(self.sql["exists"], [str(key)])
         if res.is_err():
             return False
         cursor = res.ok()
@@ -190,11 +469,10 @@ class SQLiteBackingStore(KeyValueBackingStore):
         return bool(row)
 
     def _get_all(self) -> Any:
-        select_sql = f"select * from {self.table_name}"  # nosec
         keys = []
         data = []
 
-        res = self._execute(select_sql)
+        res = self._execute(self.sql["get_all"])
         if res.is_err():
             return {}
         cursor = res.ok()
@@ -205,14 +483,13 @@ class SQLiteBackingStore(KeyValueBackingStore):
 
         for row in rows:
             keys.append(UID(row[0]))
-            data.append(_deserialize(row[2], from_bytes=True))
+            data.append(self._deserialize(row[1]))
         return dict(zip(keys, data))
 
     def _get_all_keys(self) -> Any:
-        select_sql = f"select uid from {self.table_name}"  # nosec
         keys = []
 
-        res = self._execute(select_sql)
+        res = self._execute(self.sql["get_all_keys"])
         if res.is_err():
             return []
         cursor = res.ok()
@@ -226,26 +503,77 @@ class SQLiteBackingStore(KeyValueBackingStore):
         return keys
 
     def _delete(self, key: UID) -> None:
-        select_sql = f"delete from {self.table_name} where uid = ?"  # nosec
-        res = self._execute(select_sql, [str(key)])
+        with self._invalidating([key]):
+            res = self._execute(self.sql["delete"], [str(key)])
         if res.is_err():
             raise ValueError(res.err())
 
     def _delete_all(self) -> None:
-        select_sql = f"delete from {self.table_name}"  # nosec
-        res = self._execute(select_sql)
+        with self._invalidating(None):
+            res = self._execute(self.sql["delete_all"])
         if res.is_err():
             raise ValueError(res.err())
 
     def _len(self) -> int:
-        select_sql = f"select count(uid) from {self.table_name}"  # nosec
-        res = self._execute(select_sql)
+        res = self._execute(self.sql["len"])
         if res.is_err():
             raise ValueError(res.err())
         cursor = res.ok()
         cnt = cursor.fetchone()[0]
         return cnt
 
+    def _select_in(self, columns: str, keys: Iterable[UID]) -> List[Tuple]:
+        rows = []
+        for chunk in chunked([str(key) for key in keys]):
+            select_sql = (
+                f"select {columns} from {self.table_name} "  # nosec
+                + f"where uid in ({placeholders(chunk)})"
+            )
+            res = self._execute(select_sql, chunk)
+            if res.is_err():
+                raise ValueError(res.err())
+            rows.extend(res.ok().fetchall())
+        return rows
+
+    def get_many(self, keys: Iterable[UID]) -> Dict[UID, Any]:
+        found = {}
+        missing = list(keys)
+        if self.cache is not None:
+            self._sync_cache()
+            keys, missing = missing, []
+            for key in keys:
+                data = self.cache.get(key)
+                if data is None:
+                    missing.append(key)
+                else:
+                    found[key] = self._deserialize(data)
+
+        generation = self._generation()
+        for uid, data in self._select_in("uid, value", missing):
+            key = UID(uid)
+            found[key] = self._load(key, data, generation)
+        return found
+
+    def existing_keys(self, keys: Iterable[UID]) -> Set[UID]:
+        return {UID(row[0]) for row in self._select_in("uid", keys)}
+
+    def set_many(self, items: Dict[UID, Any]) -> None:
+        rows = [
+            (str(key), _repr_debug_(value), self._encode(value))
+            for key, value in items.items()
+        ]
+        with self._invalidating(items.keys()):
+            res = self._executemany(self.sql["upsert"], rows)
+        if res.is_err():
+            raise ValueError(res.err())
+
+    def delete_many(self, keys: Iterable[UID]) -> None:
+        keys = list(keys)
+        with self._invalidating(keys):
+            res = self._executemany(self.sql["delete"], [(str(key),) for key in keys])
+        if res.is_err():
+            raise ValueError(res.err())
+
     def __setitem__(self, key: Any, value: Any) -> None:
         self._set(key, value)
 
@@ -294,12 +622,112 @@ class SQLiteBackingStore(KeyValueBackingStore):
         return iter(self.keys())
 
     def __del__(self):
+        # shared connections are closed by the partition
+        if not getattr(self, "_owns_connection", False):
+            return
         try:
             self._close()
         except BaseException:
             pass
 
 
+def index_value(value: Any) -> str:
+    return str(value)
+
+
+def index_rows(query_keys: QueryKeys, uid: str) -> List[Tuple[str, str, str]]:
+    rows = []
+    for qk in query_keys.all:
+        # one row for each item of a list, e.g. every UID of a List[UID] key
+        values = qk.value if qk.type_list else [qk.value]
+        rows.extend((qk.key, index_value(value), uid) for value in values)
+    return rows
+
+
+@serializable(attrs=["index_name", "settings", "store_config"])
+class SQLiteIndexStore(SQLiteBackingStore):
+    """Partition keys of a SQLiteStorePartition, one row per indexed value.
+
+    Rows are (key, value, uid) with key the name of the partition key and value
+    its value as text. The unique index allows a single uid per key and value,
+    the search index any number. Both are indexed by uid as well, so the keys
+    of an object are removed without looking them up first.
+
+    Parameters:
+        `index_name`: str
+            "unique_index" or "search_index"
+        `settings`: PartitionSettings
+            Syft specific settings
+        `store_config`: SQLiteStoreConfig
+            Connection Configuration
+    """
+
+    @property
+    def unique(self) -> bool:
+        return self.index_name == "unique_index"
+
+    def _prepare_statements(self) -> Dict[str, str]:
+        table = self.table_name
+        # a unique value moves to the latest uid, like assigning it in a dict
+        on_conflict = (
+            "on conflict (key, value) do update set uid = excluded.uid"
+            if self.unique
+            else "on conflict do nothing"
+        )
+        return {
+            "set_keys": f"insert into {table} (key, value, uid) VALUES (?, ?, ?) "  # nosec
+            + on_conflict,
+            "delete_uid": f"delete from {table} where uid = ?",  # nosec
+            "find_uid": f"select uid from {table} where key = ? and value = ?",  # nosec
+            "len": f"select count(*) from {table}",  # nosec
+        }
+
+    def create_table(self) -> None:
+        primary_key = "key, value" if self.unique else "key, value, uid"
+        self.db.execute(
+            f"create table if not exists {self.table_name} ("  # nosec
+            + "key TEXT NOT NULL, value TEXT NOT NULL, uid VARCHAR(32) NOT NULL, "
+            + f"PRIMARY KEY ({primary_key}))"
+        )
+        self.db.execute(
+            f"create index if not exists {self.table_name}_uid "  # nosec
+            + f"on {self.table_name} (uid)"
+        )
+
+    def set_keys(self, rows: List[Tuple[str, str, str]]) -> None:
+        if len(rows) == 0:
+            return
+        res = self._executemany(self.sql["set_keys"], rows)
+        if res.is_err():
+            raise ValueError(res.err())
+
+    def delete_uid(self, uid: UID) -> None:
+        res = self._execute(self.sql["delete_uid"], [str(uid)])
+        if res.is_err():
+            raise ValueError(res.err())
+
+    def delete_uids(self, uids: Iterable[UID]) -> None:
+        res = self._executemany(self.sql["delete_uid"], [(str(uid),) for uid in uids])
+        if res.is_err():
+            raise ValueError(res.err())
+
+    def find_uids(self, key: str, values: List[Any]) -> Set[UID]:
+        uids = set()
+        for chunk in chunked([index_value(value) for value in values]):
+            if len(chunk) == 1:
+                select_sql = self.sql["find_uid"]
+            else:
+                select_sql = (
+                    f"select uid from {self.table_name} "  # nosec
+                    + f"where key = ? and value in ({placeholders(chunk)})"
+                )
+            res = self._execute(select_sql, [key, *chunk])
+            if res.is_err():
+                raise ValueError(res.err())
+            uids.update(UID(row[0]) for row in res.ok().fetchall())
+        return uids
+
+
 @serializable()
 class SQLiteStorePartition(KeyValueStorePartition):
     """SQLite StorePartition
@@ -311,12 +739,32 @@ class SQLiteStorePartition(KeyValueStorePartition):
             SQLite specific configuration
     """
 
+    def init_store(self) -> Result[Ok, Err]:
+        # data, permissions and keys share the connections, so a single
+        # transaction covers all of them
+        self.connection = SQLiteConnection(self.store_config.client_config)
+        return super().init_store()
+
+    def _backing_store(self, index_name: str, **kwargs: Any) -> SQLiteBackingStore:
+        # the data and permissions stores, each with its own cache
+        client_config = self.store_config.client_config
+        cache = ObjectCache(client_config.cache_size, client_config.cache_bytes)
+        return super()._backing_store(
+            index_name, connection=self.connection, cache=cache, **kwargs
+        )
+
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        stores = {"data": self.data, "permissions": self.permissions}
+        return {
+            name: store.cache.stats()
+            for name, store in stores.items()
+            if store.cache is not None
+        }
+
     def close(self) -> None:
         self.lock.acquire()
         try:
-            self.data._close()
-            self.unique_keys._close()
-            self.searchable_keys._close()
+            self.connection.close()
         except BaseException:
             pass
         self.lock.release()
@@ -325,12 +773,280 @@ class SQLiteStorePartition(KeyValueStorePartition):
         self.lock.acquire()
         try:
             self.data._commit()
-            self.unique_keys._commit()
-            self.searchable_keys._commit()
         except BaseException:
             pass
         self.lock.release()
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        with self.connection.transaction():
+            yield
+
+    def _unit_of_work(self, cbk: Callable, *args: Any, **kwargs: Any) -> Result:
+        # commits the writes of cbk at once, or none of them if it fails
+        return self.connection.unit_of_work(cbk, *args, **kwargs)
+
+    def _set(self, *args: Any, **kwargs: Any) -> Result[SyftObject, str]:
+        return self._unit_of_work(super()._set, *args, **kwargs)
+
+    def _update(self, *args: Any, **kwargs: Any) -> Result[SyftObject, str]:
+        return self._unit_of_work(super()._update, *args, **kwargs)
+
+    def _delete(self, *args: Any, **kwargs: Any) -> Result[SyftSuccess, Err]:
+        return self._unit_of_work(super()._delete, *args, **kwargs)
+
+    # The partition keys live in SQLiteIndexStores instead of a dict per key
+    # serialized into a single row, so writing or querying them never has to
+    # load more than the matching rows.
+
+    def _init_keys(self) -> None:
+        self.unique_keys = SQLiteIndexStore(
+            "unique_index", self.settings, self.store_config, connection=self.connection
+        )
+        self.searchable_keys = SQLiteIndexStore(
+            "search_index", self.settings, self.store_config, connection=self.connection
+        )
+        self.unique_key_names = {pk.key for pk in self.unique_cks}
+        self.searchable_key_names = {pk.key for pk in self.searchable_cks}
+
+        # every object has a row for its store key, stores written before the
+        # index tables existed get them from the stored objects
+        if len(self.unique_keys) == 0 and len(self.data) > 0:
+            with self.transaction():
+                for uid, obj in self.data.items():
+                    self._set_keys(str(uid), obj)
+
+    def _set_keys(self, uid: str, obj: SyftObject) -> None:
+        self.unique_keys.set_keys(
+            index_rows(self.settings.unique_keys.with_obj(obj), uid)
+        )
+        self.searchable_keys.set_keys(
+            index_rows(self.settings.searchable_keys.with_obj(obj), uid)
+        )
+
+    def _store_uid(self, query_keys: QueryKeys) -> UID:
+        for qk in query_keys.all:
+            if qk.partition_key == self.settings.store_key:
+                return qk.value
+        raise ValueError(f"Missing store key {self.settings.store_key} in {query_keys}")
+
+    def _remove_keys(
+        self,
+        unique_query_keys: QueryKeys,
+        searchable_query_keys: QueryKeys,
+    ) -> None:
+        # the unique keys always include the store key, all rows of its object go
+        uid = self._store_uid(unique_query_keys)
+        self.unique_keys.delete_uid(uid)
+        self.searchable_keys.delete_uid(uid)
+
+    def remove_keys(
+        self,
+        unique_query_keys: QueryKeys,
+        searchable_query_keys: QueryKeys,
+    ) -> None:
+        self._remove_keys(unique_query_keys, searchable_query_keys)
+
+    def _delete_unique_keys_for(self, obj: SyftObject) -> Result[SyftSuccess, str]:
+        self.unique_keys.delete_uid(self.settings.store_key.with_obj(obj).value)
+        return Ok(SyftSuccess(message="Deleted"))
+
+    def _delete_search_keys_for(self, obj: SyftObject) -> Result[SyftSuccess, str]:
+        self.searchable_keys.delete_uid(self.settings.store_key.with_obj(obj).value)
+        return Ok(SyftSuccess(message="Deleted"))
+
+    def _get_keys_index(self, qks: QueryKeys) -> Result[Set[Any], str]:
+        try:
+            # match AND
+            subsets = []
+            for qk in qks.all:
+                if qk.key not in self.unique_key_names:
+                    return Err(f"Failed to query index with {qk}")
+                uids = self.unique_keys.find_uids(qk.key, [qk.value])
+                if len(uids) == 0:
+                    # must be at least one in all query keys
+                    continue
+                subsets.append(uids)
+
+            if len(subsets) == 0:
+                return Ok(set())
+            # AND
+            return Ok(set.intersection(*subsets))
+        except Exception as e:
+            return Err(f"Failed to query with {qks}. {e}")
+
+    def _find_keys_search(self, qks: QueryKeys) -> Result[Set[QueryKey], str]:
+        try:
+            # match AND
+            subsets = []
+            for qk in qks.all:
+                if qk.key not in self.searchable_key_names:
+                    return Err(f"Failed to search with {qk}")
+                if qk.type_list:
+                    # match OR against the items of the list
+                    matches = self.searchable_keys.find_uids(qk.key, qk.value)
+                    if len(matches):
+                        subsets.append(matches)
+                else:
+                    subsets.append(self.searchable_keys.find_uids(qk.key, [qk.value]))
+
+            if len(subsets) == 0:
+                return Ok(set())
+            # AND
+            return Ok(set.intersection(*subsets))
+        except Exception as e:
+            return Err(f"Failed to query with {qks}. {e}")
+
+    def _uids_after(
+        self,
+        after: Optional[UID],
+        count: int,
+        index_qks: Optional[QueryKeys],
+        search_qks: Optional[QueryKeys],
+    ) -> Result[List[UID], str]:
+        # SQLite orders and limits the uids, only the rows of a page are read
+        table = self.data.table_name
+        conditions: List[Tuple[str, List[Any]]] = []
+        if index_qks is not None or search_qks is not None:
+            matches = self._match_conditions(
+                index_qks or QueryKeys(qks=[]), search_qks or QueryKeys(qks=[])
+            )
+            if matches.is_err():
+                return matches
+            if matches.ok() is None:
+                return Ok([])
+            table, conditions = matches.ok()
+        if after is not None:
+            conditions.append(("uid > ?", [str(after)]))
+
+        params = [
+            param for _, condition_params in conditions for param in condition_params
+        ]
+        if len(params) >= SQLITE_MAX_VARIABLES:
+            return super()._uids_after(after, count, index_qks, search_qks)
+
+        where = " and ".join(condition for condition, _ in conditions)
+        res = self.data._execute(
+            f"select uid from {table}"  # nosec
+            + (f" where {where}" if where else "")
+            + " order by uid limit ?",
+            [*params, count],
+        )
+        if res.is_err():
+            return res
+        # uids are stored as hex, so they sort like UIDs
+        return Ok([UID(row[0]) for row in res.ok().fetchall()])
+
+    def _match_conditions(
+        self, index_qks: QueryKeys, search_qks: QueryKeys
+    ) -> Result[Optional[Tuple[str, List[Tuple[str, List[Any]]]]], str]:
+        """The table to select uids from and the conditions on it, which find
+        what _find_uids finds, or None if that is nothing.
+
+        The rows of a searchable key and value are ordered by uid, so the first
+        one is selected from directly.
+        """
+        if len(index_qks.all) == 0 and len(search_qks.all) == 0:
+            return Ok(None)
+
+        table = self.data.table_name
+        conditions: List[Tuple[str, List[Any]]] = []
+        if len(index_qks.all) > 0:
+            # each unique key matches a single object at most
+            found = self._get_keys_index(index_qks)
+            if found.is_err():
+                return found
+            uids = [str(uid) for uid in found.ok()]
+            if len(uids) == 0:
+                return Ok(None)
+            conditions.append((f"uid in ({placeholders(uids)})", uids))
+
+        search_table = self.searchable_keys.table_name
+        lists = []
+        for qk in search_qks.all:
+            if qk.key not in self.searchable_key_names:
+                return Err(f"Failed to search with {qk}")
+            if not qk.type_list and table != search_table:
+                table = search_table
+                conditions.append(
+                    ("key = ? and value = ?", [qk.key, index_value(qk.value)])
+                )
+                continue
+
+            values = qk.value if qk.type_list else [qk.value]
+            match_params = [qk.key, *[index_value(value) for value in values]]
+            match = (
+                f"select uid from {search_table} where key = ? "  # nosec
+                + f"and value in ({placeholders(values)})"
+            )
+            if qk.type_list:
+                # a list matches any of its items, and is left out if none does
+                conditions.append(
+                    (f"(uid in ({match}) or not exists ({match}))", match_params * 2)
+                )
+                lists.append((match, match_params))
+            else:
+                conditions.append((f"uid in ({match})", match_params))
+        if len(lists) > 0 and len(lists) == len(search_qks.all):
+            # if every list is left out nothing is found
+            conditions.append(
+                (
+                    "(" + " or ".join(f"exists ({match})" for match, _ in lists) + ")",
+                    [param for _, match_params in lists for param in match_params],
+                )
+            )
+        return Ok((table, conditions))
+
+    def _check_partition_keys_unique(
+        self, unique_query_keys: QueryKeys
+    ) -> UniqueKeyCheck:
+        # dont check the store key
+        qks = [
+            x
+            for x in unique_query_keys.all
+            if x.partition_key != self.settings.store_key
+        ]
+        matches = []
+        for qk in qks:
+            if qk.key not in self.unique_key_names:
+                raise Exception(
+                    f"pk_key: {qk.key} not in unique_keys: {self.unique_key_names}"
+                )
+            if self.unique_keys.find_uids(qk.key, [qk.value]):
+                matches.append(qk.key)
+
+        if len(matches) == 0:
+            return UniqueKeyCheck.EMPTY
+        elif len(matches) == len(qks):
+            return UniqueKeyCheck.MATCHES
+
+        return UniqueKeyCheck.ERROR
+
+    def _set_many_data_and_keys(
+        self, entries: List[Tuple[QueryKey, QueryKeys, QueryKeys, SyftObject]]
+    ) -> None:
+        unique_rows = []
+        searchable_rows = []
+        for store_query_key, unique_query_keys, searchable_query_keys, _ in entries:
+            uid = str(store_query_key.value)
+            unique_rows.extend(index_rows(unique_query_keys, uid))
+            searchable_rows.extend(index_rows(searchable_query_keys, uid))
+        self.unique_keys.set_keys(unique_rows)
+        self.searchable_keys.set_keys(searchable_rows)
+        self.data.set_many({entry[0].value: entry[3] for entry in entries})
+
+    def _set_data_and_keys(
+        self,
+        store_query_key: QueryKey,
+        unique_query_keys: QueryKeys,
+        searchable_query_keys: QueryKeys,
+        obj: SyftObject,
+    ) -> None:
+        uid = str(store_query_key.value)
+        self.unique_keys.set_keys(index_rows(unique_query_keys, uid))
+        self.searchable_keys.set_keys(index_rows(searchable_query_keys, uid))
+        self.data[store_query_key.value] = obj
+
 
 # the base document store is already a dict but we can change it later
 @serializable()
@@ -363,12 +1079,32 @@ class SQLiteStoreClientConfig(StoreClientConfig):
             How many seconds the connection should wait before raising an exception, if the database
             is locked by another connection. If another connection opens a transaction to modify the
             database, it will be locked until that transaction is committed. Default five seconds.
+        `journal_mode`: str
+            SQLite journal mode, WAL (default) lets reads run next to a write. None keeps the
+            journal mode of the database file.
+        `synchronous`: str
+            How often SQLite waits for the disk, one of OFF, NORMAL (default), FULL or EXTRA.
+            With WAL, NORMAL can lose the last transactions on power loss but never corrupts the
+            database. None keeps the SQLite default, FULL.
+        `cached_statements`: int
+            Number of prepared statements kept per connection. Default 256.
+        `cache_size`: int
+            Number of stored messages kept in memory by each data and permissions store of a
+            partition, to read them again without a query. Default 0, the cache is off.
+        `cache_bytes`: int
+            Maximum size in bytes of the messages kept by each of these stores. Default 64 MiB,
+            0 disables the cache.
     """
 
     filename: Optional[str] = None
     path: Union[str, Path]
     check_same_thread: bool = True
     timeout: int = 5
+    journal_mode: Optional[str] = "WAL"
+    synchronous: Optional[str] = "NORMAL"
+    cached_statements: int = 256
+    cache_size: int = 0
+    cache_bytes: int = 64 * 1024 * 1024
 
     def __init__(
         self,
@@ -146,6 +146,9 @@ class SyftObject(SyftBaseObject, SyftObjectRegistry):
     class Config:
         arbitrary_types_allowed = True
 
+    # the message the object was read from, see serde.passthrough
+    __slots__ = ("_syft_encoding",)
+
     # all objects have a UID
     id: UID
 
@@ -350,6 +353,25 @@ class SyftObject(SyftBaseObject, SyftObjectRegistry):
         self._syft_set_validate_private_attrs_(**kwargs)
         self.__post_init__()
 
+    @classmethod
+    def _syft_can_construct_trusted(cls) -> bool:
+        # a custom __init__ may do more than validate, e.g. fill in fields
+        return cls.__init__ is SyftObject.__init__
+
+    @classmethod
+    def _syft_construct_trusted(cls, kwargs: Dict[str, Any]) -> "SyftObject":
+        """Creates an instance from values which were validated once already,
+        without running the pydantic validators and private attribute checks.
+        Used for trusted_deserialization."""
+        private_attrs = cls.__private_attributes__.keys() & kwargs.keys()
+        obj = cls.construct(
+            **{k: v for k, v in kwargs.items() if k not in private_attrs}
+        )
+        for attr in private_attrs:
+            setattr(obj, attr, kwargs[attr])
+        obj.__post_init__()
+        return obj
+
     @classmethod
     def _syft_keys_types_dict(cls, attr_name: str) -> Dict[str, type]:
         kt_dict = {}
@@ -41,6 +41,7 @@ import requests
 
 # relative
 from ..serde.serialize import _serialize
+from ..serde.wire_format import SERDE_VERSION_1
 from .logger import critical
 from .logger import debug
 from .logger import error
@@ -846,7 +847,7 @@ def recursive_hash(obj: Any) -> int:
         # and also for different python versions
         # to be modified in the hashing PR
         # Adding a temp fix for now
-        serde_bytes = _serialize(obj, to_bytes=True)
+        serde_bytes = _serialize(obj, to_bytes=True, version=SERDE_VERSION_1)
         hash_bytes = hashlib.sha256(serde_bytes).digest()
         hashes += int.from_bytes(hash_bytes, byteorder="big")
     return hashes
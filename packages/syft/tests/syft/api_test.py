@@ -1,4 +1,5 @@
 # stdlib
+from contextlib import contextmanager
 from textwrap import dedent
 from typing import Callable
 
@@ -8,6 +9,9 @@ import pytest
 
 # syft absolute
 import syft as sy
+from syft.client.api import SyftAPICall
+from syft.client.api import SyftAPIData
+from syft.node.credentials import SyftSigningKey
 from syft.service.response import SyftAttributeError
 from syft.service.user.user import UserUpdate
 from syft.service.user.user_roles import ServiceRole
@@ -74,3 +78,28 @@ def test_api_cache_invalidation_login(root_verify_key, worker):
     guest_client.login(email="a@b.org", password="aaa")
 
     assert guest_client.upload_dataset(dataset)
+
+
+def test_make_call_only_trusts_results_signed_by_the_node(worker, monkeypatch):
+    api = worker.root_client.api
+    trusted = []
+
+    @contextmanager
+    def record_trusted():
+        trusted.append(True)
+        yield
+
+    monkeypatch.setattr("syft.client.api.trusted_deserialization", record_trusted)
+    call = SyftAPICall(node_uid=worker.id, path="metadata", args=[], kwargs={})
+    assert api.make_call(call).id == worker.id
+    assert trusted == [True]
+
+    # validly signed, but by someone else
+    other_key = SyftSigningKey.generate()
+    monkeypatch.setattr(
+        type(api.connection),
+        "make_call",
+        lambda self, signed_call: SyftAPIData(data=worker.metadata).sign(other_key),
+    )
+    assert api.make_call(call).id == worker.id
+    assert trusted == [True]
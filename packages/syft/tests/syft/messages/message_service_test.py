@@ -16,6 +16,7 @@ from syft.service.response import SyftError
 from syft.service.response import SyftSuccess
 from syft.store.document_store import DocumentStore
 from syft.store.linked_obj import LinkedObject
+from syft.store.pagination import Page
 from syft.types.datetime import DateTime
 from syft.types.uid import UID
 
@@ -474,3 +475,38 @@ def test_messageservice_clear_error_on_delete_all_for_verify_key(
     assert isinstance(response, SyftError)
     assert response.message == expected_error
     assert len(inbox_after_delete) == 1
+
+
+def test_messageservice_get_all_pages(
+    message_service: MessageService,
+    authed_context: AuthedServiceContext,
+    message_stash: MessageStash,
+) -> None:
+    random_verify_key = SyftSigningKey.generate().verify_key
+    messages = [
+        add_mock_message(
+            authed_context.credentials,
+            message_stash,
+            random_verify_key,
+            test_verify_key,
+        )
+        for _ in range(5)
+    ]
+    # not in the inbox
+    add_mock_message(
+        authed_context.credentials, message_stash, test_verify_key, random_verify_key
+    )
+
+    page = message_service.get_all(authed_context, limit=2)
+    assert isinstance(page, Page)
+    received = list(page)
+    while page.next_cursor is not None:
+        page = message_service.get_all(authed_context, limit=2, cursor=page.next_cursor)
+        received += page.items
+
+    assert [message.id for message in received] == sorted(
+        message.id for message in messages
+    )
+
+    page = message_service.get_all(authed_context, limit=2, sort_key="created_at")
+    assert [message.id for message in page] == [message.id for message in messages[:2]]
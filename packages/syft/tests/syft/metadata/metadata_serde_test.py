@@ -7,6 +7,10 @@ from pytest import FixtureRequest
 
 # syft absolute
 import syft as sy
+from syft.serde.wire_format import SERDE_VERSION_1
+from syft.service.metadata.node_metadata import NodeMetadata
+from syft.service.metadata.node_metadata import NodeMetadataJSON
+from syft.service.metadata.node_metadata import NodeMetadataV2
 
 
 @pytest.mark.parametrize(
@@ -25,3 +29,24 @@ def test_node_metadata_serde(obj: Any, request: FixtureRequest) -> None:
     deser_data = sy.deserialize(ser_data, from_bytes=True)
     assert isinstance(deser_data, type(requested_obj))
     assert deser_data == requested_obj
+
+
+def test_node_metadata_v1_v2_transforms(metadata: NodeMetadata) -> None:
+    upgraded = metadata.to(NodeMetadataV2)
+    assert upgraded.__version__ == metadata.__version__ + 1
+    assert upgraded.id == metadata.id
+    assert upgraded.serde_version == SERDE_VERSION_1
+
+    downgraded = upgraded.to(NodeMetadata)
+    assert downgraded == metadata
+    assert not hasattr(downgraded, "serde_version")
+
+
+def test_node_metadata_v2_json_roundtrip(worker) -> None:
+    metadata = worker.metadata
+    assert isinstance(metadata, NodeMetadataV2)
+
+    metadata_json = metadata.to(NodeMetadataJSON)
+    assert metadata_json.serde_version == metadata.serde_version
+    assert metadata_json.to(NodeMetadataV2) == metadata
+    assert metadata_json.to(NodeMetadata).id == metadata.id
@@ -0,0 +1,59 @@
+# stdlib
+import os
+
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.compression import CompressionCodec
+from syft.serde.compression import CompressionPolicy
+from syft.serde.compression import compression_policy
+from syft.serde.compression import decompress
+from syft.serde.compression import is_compressed
+from syft.serde.wire_format import SERDE_VERSION_2
+
+KiB = 1024
+
+
+@pytest.mark.parametrize(
+    "data, codec",
+    [
+        (b"x" * KiB, CompressionCodec.NONE),
+        (os.urandom(64 * KiB), CompressionCodec.NONE),
+        (b"x" * 64 * KiB, CompressionCodec.LZ4),
+        (b"x" * 2048 * KiB, CompressionCodec.ZSTD),
+    ],
+)
+def test_compression_policy_choice(data, codec):
+    policy = CompressionPolicy()
+    payload = policy.compress(data)
+
+    assert policy.choose(data) is codec
+    assert is_compressed(payload) is (codec is not CompressionCodec.NONE)
+    assert decompress(payload) == data
+    assert policy.counters[codec].payloads == 1
+    assert policy.counters[codec].bytes_in == len(data)
+    assert policy.counters[codec].bytes_out == len(payload)
+
+
+def test_compressed_array_roundtrip():
+    compression_policy.reset_counters()
+    array = np.zeros(100_000)
+
+    blob = sy.serialize(array, to_bytes=True)
+    de = sy.deserialize(blob, from_bytes=True)
+
+    assert (de == array).all()
+    assert len(blob) < array.nbytes // 100
+    assert compression_policy.counters[CompressionCodec.LZ4].payloads == 1
+
+
+def test_compressed_bytes_roundtrip():
+    data = b"x" * 64 * KiB
+
+    blob = sy.serialize(data, to_bytes=True, version=SERDE_VERSION_2)
+
+    assert sy.deserialize(blob, from_bytes=True) == data
+    assert len(blob) < len(data) // 10
@@ -0,0 +1,114 @@
+# third party
+import numpy as np
+import pandas as pd
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.arrow import writable_arrays
+from syft.serde.third_party import deserialize_dataframe
+from syft.serde.third_party import deserialize_series
+from syft.serde.third_party import serialize_dataframe
+from syft.serde.third_party import serialize_series
+from syft.serde.wire_format import SERDE_VERSION_1
+from syft.serde.wire_format import SERDE_VERSION_2
+
+
+def make_dataframe(rows: int = 100_000) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "a": np.arange(rows),
+            "b": np.random.rand(rows),
+            "c": [f"s{i % 10}" for i in range(rows)],
+        },
+        index=pd.RangeIndex(10, 10 + 2 * rows, 2),
+    )
+
+
+@pytest.mark.parametrize("version", [SERDE_VERSION_1, SERDE_VERSION_2])
+def test_dataframe_roundtrip(version):
+    df = make_dataframe()
+    indexed = df.set_index("c")
+
+    for frame in (df, indexed):
+        blob = sy.serialize(frame, to_bytes=True, version=version)
+        pd.testing.assert_frame_equal(sy.deserialize(blob, from_bytes=True), frame)
+
+
+@pytest.mark.parametrize("version", [SERDE_VERSION_1, SERDE_VERSION_2])
+def test_series_roundtrip(version):
+    for series in (
+        make_dataframe()["b"],
+        pd.Series([1, 2, 3]),
+        pd.Series(["x"], name=0),
+    ):
+        blob = sy.serialize(series, to_bytes=True, version=version)
+        pd.testing.assert_series_equal(sy.deserialize(blob, from_bytes=True), series)
+
+
+def test_dataframe_projection():
+    df = make_dataframe()
+    blob = serialize_dataframe(df)
+
+    pd.testing.assert_frame_equal(
+        deserialize_dataframe(blob, columns=["b"], rows=(70_000, 90_005)),
+        df[["b"]].iloc[70_000:90_005],
+    )
+    pd.testing.assert_frame_equal(
+        deserialize_dataframe(blob, rows=(5, 7)), df.iloc[5:7]
+    )
+
+    with pytest.raises(KeyError):
+        deserialize_dataframe(blob, columns=["missing"])
+
+
+def test_series_projection():
+    series = make_dataframe()["a"]
+
+    pd.testing.assert_series_equal(
+        deserialize_series(serialize_series(series), rows=(1, 4)), series.iloc[1:4]
+    )
+
+
+@pytest.mark.parametrize("version", [SERDE_VERSION_1, SERDE_VERSION_2])
+def test_mixed_type_series_roundtrip(version):
+    # arrow can not convert it, so it falls back to the older dict encoding
+    series = pd.Series([1, "a", 2.5], name="mixed")
+    blob = sy.serialize(series, to_bytes=True, version=version)
+    pd.testing.assert_series_equal(sy.deserialize(blob, from_bytes=True), series)
+
+
+def test_deserialized_pandas_is_zero_copy():
+    df = make_dataframe(10)
+    # v1 copies nested payloads out of the capnp message, v2 does not
+    blob = sy.serialize(df, to_bytes=True, version=SERDE_VERSION_2)
+    de = sy.deserialize(blob, from_bytes=True)
+
+    assert np.shares_memory(de["b"].values, np.frombuffer(blob, dtype=np.uint8))
+    with pytest.raises(ValueError):
+        de.loc[10, "b"] = -1.0
+
+
+@pytest.mark.parametrize("version", [SERDE_VERSION_1, SERDE_VERSION_2])
+def test_writable_pandas(version):
+    df = make_dataframe(10)
+    df["d"] = pd.Categorical(["x", "y"] * 5)
+    with writable_arrays():
+        de = sy.deserialize(
+            sy.serialize(df, to_bytes=True, version=version), from_bytes=True
+        )
+
+    de["a"] += 1
+    de.loc[10, "b"] = -1.0
+    de.loc[10, "d"] = "y"
+    assert de["a"].tolist() == list(range(1, 11))
+    assert de.loc[10, "b"] == -1.0
+    assert de.loc[10, "d"] == "y"
+
+    series = pd.Series([1.0, 2.0, 3.0])
+    with writable_arrays():
+        de = sy.deserialize(
+            sy.serialize(series, to_bytes=True, version=version), from_bytes=True
+        )
+    de[0] = 5.0
+    assert de.tolist() == [5.0, 2.0, 3.0]
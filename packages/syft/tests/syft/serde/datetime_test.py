@@ -0,0 +1,58 @@
+# stdlib
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from datetime import timezone
+
+# third party
+import pandas as pd
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.serialize import _serialize
+from syft.serde.third_party import deserialize_date
+from syft.serde.third_party import deserialize_datetime
+from syft.serde.third_party import deserialize_pandas_timestamp
+from syft.serde.third_party import deserialize_time
+from syft.serde.wire_format import SERDE_VERSION_1
+from syft.serde.wire_format import SERDE_VERSION_2
+
+
+@pytest.mark.parametrize("version", [SERDE_VERSION_1, SERDE_VERSION_2])
+@pytest.mark.parametrize(
+    "obj",
+    [
+        datetime(2023, 5, 1, 12, 30, 15, 123456),
+        datetime(1969, 12, 31, 23, 59, 59, 1),
+        datetime(2023, 5, 1, tzinfo=timezone.utc),
+        datetime(2023, 5, 1, tzinfo=timezone(timedelta(hours=-5, minutes=-30))),
+        date(2023, 5, 1),
+        time(13, 5, 7, 123),
+        time(1, tzinfo=timezone(timedelta(hours=2))),
+        pd.Timestamp("2020-01-01 12:00:00.000000123"),
+        pd.Timestamp("2020-06-01", tz="Europe/Berlin"),
+    ],
+)
+def test_datetime_roundtrip(obj, version):
+    blob = sy.serialize(obj, to_bytes=True, version=version)
+    de = sy.deserialize(blob, from_bytes=True)
+
+    assert de == obj
+    assert type(de) is type(obj)
+    if type(obj) is not date:
+        assert de.utcoffset() == obj.utcoffset()
+
+
+@pytest.mark.parametrize("version", [SERDE_VERSION_1, SERDE_VERSION_2])
+def test_datetime_string_format_still_decodes(version):
+    dt = datetime(2023, 5, 1, 12, 30, tzinfo=timezone.utc)
+
+    def legacy(value):
+        return _serialize(value, to_bytes=True, version=version)
+
+    assert deserialize_datetime(legacy(dt.isoformat())) == dt
+    assert deserialize_time(legacy("13:05:07")) == time(13, 5, 7)
+    assert deserialize_date(legacy("2023-05-01")) == date(2023, 5, 1)
+    assert deserialize_pandas_timestamp(legacy(5)) == pd.Timestamp(5)
@@ -0,0 +1,172 @@
+# stdlib
+from collections import OrderedDict
+from collections import defaultdict
+
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.node.credentials import SyftSigningKey
+from syft.node.credentials import SyftVerifyKey
+from syft.serde.wire_format import MAGIC_V2
+from syft.serde.wire_format import SERDE_VERSION_1
+from syft.serde.wire_format import SERDE_VERSION_2
+from syft.serde.wire_format import serde_version_of
+from syft.serde.wire_format import use_serde_version
+from syft.types.uid import LineageID
+from syft.types.uid import UID
+
+
+def nested_payload():
+    uid = UID()
+    return {
+        "uid": uid,
+        "values": [1, 2.5, "three", None, True, b"bytes", -(2**70)],
+        "nested": {"tuple": (uid, (1, 2)), "set": {1, 2}, "frozen": frozenset([3])},
+        "ordered": OrderedDict(b=1, a=2),
+        "default": defaultdict(list, a=[1]),
+        "type": int,
+    }
+
+
+@pytest.mark.parametrize("version", [SERDE_VERSION_1, SERDE_VERSION_2])
+def test_roundtrip(version):
+    obj = nested_payload()
+
+    blob = sy.serialize(obj, to_bytes=True, version=version)
+    assert serde_version_of(blob) == version
+
+    de = sy.deserialize(blob, from_bytes=True)
+    assert de == obj
+    assert type(de["ordered"]) is OrderedDict
+    assert type(de["nested"]["frozen"]) is frozenset
+
+
+def test_v2_is_a_single_message():
+    obj = [[UID() for _ in range(10)] for _ in range(10)]
+
+    blob = sy.serialize(obj, to_bytes=True, version=SERDE_VERSION_2)
+
+    assert blob.startswith(MAGIC_V2)
+    assert blob.count(MAGIC_V2) == 1
+
+
+def test_v1_nests_only_v1():
+    blob = sy.serialize([UID(), np.arange(3)], to_bytes=True, version=SERDE_VERSION_1)
+
+    assert MAGIC_V2 not in blob
+
+
+def test_use_serde_version():
+    with use_serde_version(SERDE_VERSION_1):
+        blob = sy.serialize(UID(), to_bytes=True)
+    assert serde_version_of(blob) == SERDE_VERSION_1
+
+    with pytest.raises(ValueError):
+        with use_serde_version(99):
+            pass
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        None,
+        True,
+        False,
+        0,
+        -1,
+        2**63 - 1,
+        -(2**63),
+        2**63,
+        -(10**40),
+        1.5,
+        float("inf"),
+        "",
+        "héllo",
+        b"",
+        b"\x00\xff",
+    ],
+)
+def test_primitives_roundtrip(obj):
+    blob = sy.serialize(obj, to_bytes=True, version=SERDE_VERSION_2)
+    de = sy.deserialize(blob, from_bytes=True)
+
+    assert de == obj
+    assert type(de) is type(obj)
+
+
+def test_primitives_are_compact():
+    kwargs = {"uid": "a" * 32, "page": 1, "size": 50, "ratio": 0.5, "flag": True}
+
+    v1 = sy.serialize(kwargs, to_bytes=True, version=SERDE_VERSION_1)
+    v2 = sy.serialize(kwargs, to_bytes=True, version=SERDE_VERSION_2)
+
+    assert len(v2) * 3 < len(v1)
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        list(range(100)),
+        tuple(i / 3 for i in range(10)),
+        {str(i) for i in range(10)},
+        frozenset(range(10)),
+        [True, False] * 5,
+        ["héllo", "", "wörld"] * 5,
+        [UID() for _ in range(10)],
+        [2**70] * 10,
+        [1] * 10 + [True],
+    ],
+)
+def test_homogeneous_sequences_roundtrip(obj):
+    blob = sy.serialize(obj, to_bytes=True, version=SERDE_VERSION_2)
+    de = sy.deserialize(blob, from_bytes=True)
+
+    assert de == obj
+    assert type(de) is type(obj)
+    assert sorted(map(str, map(type, de))) == sorted(map(str, map(type, obj)))
+
+
+def test_homogeneous_sequences_are_packed():
+    blob = sy.serialize(list(range(1000)), to_bytes=True, version=SERDE_VERSION_2)
+
+    assert len(blob) < 1000 * 8 + 16
+
+
+def test_shared_references():
+    node_uid = UID()
+    verify_key = SyftSigningKey.generate().verify_key
+    messages = [
+        {
+            "id": UID(),
+            "node_uid": UID(node_uid.value),
+            "verify_key": SyftVerifyKey(verify_key=verify_key.verify_key),
+            "subject": "Request to run code",
+        }
+        for _ in range(100)
+    ]
+    unshared = sy.serialize(messages[:1], to_bytes=True, version=SERDE_VERSION_2)
+
+    blob = sy.serialize(messages, to_bytes=True, version=SERDE_VERSION_2)
+    de = sy.deserialize(blob, from_bytes=True)
+
+    assert de == messages
+    assert len(blob) < len(unshared) * 40
+    assert de[0]["node_uid"] is de[1]["node_uid"]
+    assert de[0]["verify_key"] is de[1]["verify_key"]
+    assert de[0]["id"] is not de[1]["id"]
+
+
+def test_shared_references_by_identity():
+    payload = OrderedDict(a=1)
+    objects = [LineageID(), payload]
+    objects += objects
+
+    de = sy.deserialize(
+        sy.serialize(objects, to_bytes=True, version=SERDE_VERSION_2), from_bytes=True
+    )
+
+    assert de == objects
+    assert de[0] is de[2]
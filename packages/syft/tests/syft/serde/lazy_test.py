@@ -0,0 +1,63 @@
+# syft absolute
+import syft as sy
+from syft.serde.lazy import LazyObject
+from syft.serde.lazy import materialize
+from syft.service.dataset.dataset import Contributor
+from syft.service.dataset.dataset import Dataset
+from syft.types.uid import UID
+
+
+def make_datasets(count: int = 3) -> list:
+    return [
+        Dataset(
+            name=f"dataset {i}",
+            description=f"{i} " + "x" * 5000,
+            contributors=[
+                Contributor(name=f"contributor {i} {j}", email="a@b.co", role="r")
+                for j in range(50)
+            ],
+            node_uid=UID(),
+        )
+        for i in range(count)
+    ]
+
+
+def test_lazy_deserialize():
+    datasets = make_datasets()
+    blob = sy.serialize(datasets, to_bytes=True)
+
+    lazy = sy.deserialize(blob, from_bytes=True, lazy=True)
+    dataset = lazy[0]
+
+    assert type(dataset) is LazyObject
+    assert isinstance(dataset, Dataset)
+    assert set(dataset._lazy_encoded) == {"description", "contributors"}
+
+    assert dataset.name == datasets[0].name
+    assert dataset.description == datasets[0].description
+    assert set(dataset._lazy_encoded) == {"contributors"}
+    assert dataset._lazy_obj is None
+
+    assert [materialize(dataset) for dataset in lazy] == datasets
+
+
+def test_lazy_object_materializes_on_write():
+    datasets = make_datasets(1)
+    dataset = sy.deserialize(
+        sy.serialize(datasets[0], to_bytes=True), from_bytes=True, lazy=True
+    )
+
+    dataset.name = "renamed"
+
+    assert dataset._lazy_obj is not None
+    assert dataset.name == "renamed"
+    assert sy.deserialize(sy.serialize(dataset, to_bytes=True), from_bytes=True) == (
+        materialize(dataset)
+    )
+
+
+def test_lazy_is_opt_in():
+    datasets = make_datasets(1)
+    blob = sy.serialize(datasets, to_bytes=True)
+
+    assert type(sy.deserialize(blob, from_bytes=True)[0]) is Dataset
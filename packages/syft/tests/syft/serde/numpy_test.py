@@ -0,0 +1,109 @@
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.arrow import numpy_deserialize
+from syft.serde.arrow import numpy_memmap
+from syft.serde.arrow import numpy_serialize
+from syft.serde.arrow import writable_arrays
+from syft.serde.wire_format import SERDE_VERSION_1
+from syft.serde.wire_format import SERDE_VERSION_2
+
+
+@pytest.mark.parametrize("version", [SERDE_VERSION_1, SERDE_VERSION_2])
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.arange(12.0).reshape(3, 4),
+        np.asfortranarray(np.arange(12).reshape(3, 4)),
+        np.arange(20)[::3],
+        np.array(5, dtype=np.int8),
+        np.zeros((0, 3)),
+        np.array(["2020-01-01"], dtype="datetime64[ns]"),
+        np.array([True, False]),
+        np.arange(6, dtype=">i4"),
+    ],
+)
+def test_numpy_roundtrip(array, version):
+    blob = sy.serialize(array, to_bytes=True, version=version)
+    de = sy.deserialize(blob, from_bytes=True)
+
+    assert de.dtype == array.dtype
+    assert de.shape == array.shape
+    assert (de == array).all()
+
+
+def test_numpy_deserialize_is_zero_copy():
+    array = np.asfortranarray(np.random.rand(10, 10))
+    buf = memoryview(bytearray(numpy_serialize(array)))
+    de = numpy_deserialize(buf)
+
+    assert de.flags.f_contiguous
+    assert not de.flags.owndata
+    de[0, 0] = -1.0
+    assert numpy_deserialize(buf)[0, 0] == -1.0
+
+
+def test_numpy_deserialize_shares_memory_with_message():
+    array = np.random.rand(10, 10)
+    blob = numpy_serialize(array)
+    de = numpy_deserialize(blob)
+
+    assert np.shares_memory(de, np.frombuffer(blob, dtype=np.uint8))
+    assert not de.flags.writeable
+    assert (de == array).all()
+
+
+def test_numpy_memmap(tmp_path):
+    array = np.asfortranarray(np.random.rand(10, 10))
+    path = tmp_path / "array.bin"
+    path.write_bytes(b"header" + numpy_serialize(array))
+
+    mapped = numpy_memmap(path, offset=len(b"header"))
+
+    assert isinstance(mapped, np.memmap)
+    assert mapped.flags.f_contiguous
+    assert (mapped == array).all()
+
+
+@pytest.mark.parametrize("version", [SERDE_VERSION_1, SERDE_VERSION_2])
+def test_writable_arrays(version):
+    array = np.asfortranarray(np.arange(12.0).reshape(3, 4))
+    blob = sy.serialize(array, to_bytes=True, version=version)
+    assert not sy.deserialize(blob, from_bytes=True).flags.writeable
+
+    with writable_arrays():
+        de = sy.deserialize(blob, from_bytes=True)
+
+    assert de.flags.writeable
+    assert de.flags.f_contiguous
+    de[0, 0] = 9.0
+    assert de[0, 0] == 9.0
+    assert (sy.deserialize(blob, from_bytes=True) == array).all()
+
+
+@pytest.mark.parametrize("version", [SERDE_VERSION_1, SERDE_VERSION_2])
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.array(["a", "bé", ""]),
+        np.array([["x", "yy"], ["zzz", "😀"]]),
+        np.array([], dtype="<U3"),
+        np.array(["a", None, "é"], dtype=object),
+        np.array(["a", "b", "c"])[::2],
+    ],
+)
+def test_string_array_roundtrip(array, version):
+    blob = sy.serialize(array, to_bytes=True, version=version)
+    de = sy.deserialize(blob, from_bytes=True)
+
+    assert de.dtype == array.dtype
+    assert de.shape == array.shape
+    assert de.tolist() == array.tolist()
+
+
+def test_string_array_rejects_mixed_objects():
+    with pytest.raises(ValueError):
+        numpy_serialize(np.array([1, "a"], dtype=object))
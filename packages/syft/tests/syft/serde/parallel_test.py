@@ -0,0 +1,88 @@
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.parallel import KiB
+from syft.serde.parallel import parallel_encoding
+from syft.serde.wire_format import SERDE_VERSION_2
+from syft.serde.wire_format import use_serde_version
+
+
+@pytest.fixture
+def parallel():
+    settings = (
+        parallel_encoding.max_workers,
+        parallel_encoding.min_leaf_size,
+        parallel_encoding.min_total_size,
+    )
+    parallel_encoding.configure(
+        max_workers=4, min_leaf_size=KiB, min_total_size=4 * KiB
+    )
+    yield parallel_encoding
+    parallel_encoding.configure(*settings)
+
+
+def weights():
+    rng = np.random.default_rng(0)
+    return {
+        "params": {
+            f"Dense_{i}": {
+                "kernel": rng.random((64, 32)).round(2),
+                "bias": np.zeros(32),
+            }
+            for i in range(8)
+        },
+        "step": 100,
+        "blob": b"x" * 8 * KiB,
+    }
+
+
+def test_parallel_encoding_is_deterministic(parallel):
+    obj = weights()
+    with use_serde_version(SERDE_VERSION_2):
+        parallel_blob = sy.serialize(obj, to_bytes=True)
+        parallel.configure(max_workers=1)
+        sequential_blob = sy.serialize(obj, to_bytes=True)
+
+    assert parallel_blob == sequential_blob
+
+    result = sy.deserialize(parallel_blob, from_bytes=True)
+    for name, layer in obj["params"].items():
+        assert (result["params"][name]["kernel"] == layer["kernel"]).all()
+        assert (result["params"][name]["bias"] == layer["bias"]).all()
+    assert result["blob"] == obj["blob"]
+
+
+def test_parallel_encoding_of_shared_leaves(parallel):
+    array = np.arange(4 * KiB)
+    obj = [array, array, np.ones(4 * KiB)]
+    with use_serde_version(SERDE_VERSION_2):
+        result = sy.deserialize(sy.serialize(obj, to_bytes=True), from_bytes=True)
+
+    assert result[0] is result[1]
+    assert (result[0] == array).all()
+
+
+def test_parallel_encoding_skips_small_payloads(parallel, monkeypatch):
+    def submit(serialize, obj):
+        raise AssertionError("small payloads are encoded in place")
+
+    monkeypatch.setattr(parallel, "submit", submit)
+    parallel.configure(min_total_size=1024 * KiB)
+    obj = [np.arange(4 * KiB), np.arange(4 * KiB)]
+
+    with use_serde_version(SERDE_VERSION_2):
+        blob = sy.serialize(obj, to_bytes=True)
+
+    result = sy.deserialize(blob, from_bytes=True)
+    assert all((a == b).all() for a, b in zip(result, obj))
+
+
+def test_parallel_encoding_raises_leaf_errors(parallel):
+    obj = [np.arange(4 * KiB), np.array([object()] * KiB)]
+
+    with use_serde_version(SERDE_VERSION_2):
+        with pytest.raises(ValueError):
+            sy.serialize(obj, to_bytes=True)
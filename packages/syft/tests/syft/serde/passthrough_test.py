@@ -0,0 +1,194 @@
+# stdlib
+import gc
+import weakref
+
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.client.api import SyftAPICall
+from syft.serde.arrow import writable_arrays
+from syft.serde.flat import TAG_MESSAGE
+from syft.serde.passthrough import encode_afresh
+from syft.serde.passthrough import encoding_of
+from syft.serde.passthrough import forget_encoding
+from syft.serde.passthrough import remember_encoding
+from syft.serde.serializable import serializable
+from syft.serde.wire_format import SERDE_VERSION_1
+from syft.serde.wire_format import SERDE_VERSION_2
+from syft.service.data_subject.data_subject import DataSubjectCreate
+from syft.service.dataset.dataset import Contributor
+from syft.service.dataset.dataset import Dataset
+from syft.types.syft_object import SYFT_OBJECT_VERSION_1
+from syft.types.syft_object import SyftObject
+from syft.types.uid import UID
+
+
+@serializable()
+class ArrayRecord(SyftObject):
+    __canonical_name__ = "PassthroughArrayRecord"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    array: np.ndarray
+
+
+def read(obj, version: int):
+    blob = sy.serialize(obj, to_bytes=True, version=version)
+    obj = sy.deserialize(blob, from_bytes=True)
+    remember_encoding(obj, blob)
+    return obj
+
+
+def read_contributor(version: int) -> Contributor:
+    return read(
+        Contributor(name="alice", email="a@b.co", role="r", note="x" * 1000), version
+    )
+
+
+def read_dataset(version: int) -> Dataset:
+    dataset = Dataset(
+        name="dataset",
+        description="x" * 1000,
+        contributors=[Contributor(name="alice", email="a@b.co", role="r")],
+        node_uid=UID(),
+    )
+    return read(dataset, version)
+
+
+def test_unchanged_object_is_copied():
+    contributor = read_contributor(SERDE_VERSION_2)
+    message = encoding_of(contributor, SERDE_VERSION_2)
+    assert message is not None
+
+    blob = sy.serialize(
+        [contributor, contributor], to_bytes=True, version=SERDE_VERSION_2
+    )
+    assert bytes([TAG_MESSAGE]) + len(message).to_bytes(8, "little") in blob
+    assert blob.count(message) == 1
+
+    result = sy.deserialize(blob, from_bytes=True)
+    assert result[0] == contributor
+    assert result[0] is result[1]
+
+
+@pytest.mark.parametrize("version", [SERDE_VERSION_1, SERDE_VERSION_2])
+def test_replaced_field_invalidates_encoding(version):
+    contributor = read_contributor(version)
+
+    contributor.id = UID(contributor.id.value)
+    assert encoding_of(contributor, version) is not None
+
+    contributor.name = "bob"
+    assert encoding_of(contributor, version) is None
+
+    blob = sy.serialize(contributor, to_bytes=True, version=version)
+    assert sy.deserialize(blob, from_bytes=True).name == "bob"
+
+
+@pytest.mark.parametrize("version", [SERDE_VERSION_1, SERDE_VERSION_2])
+def test_mutable_field_is_encoded_again(version):
+    dataset = read_dataset(version)
+    assert encoding_of(dataset, version) is not None
+
+    # changed in place, without replacing the field
+    dataset.contributors.append(Contributor(name="bob", email="b@b.co", role="r"))
+    assert encoding_of(dataset, version) is None
+
+    blob = sy.serialize(dataset, to_bytes=True, version=version)
+    names = [c.name for c in sy.deserialize(blob, from_bytes=True).contributors]
+    assert names == ["alice", "bob"]
+
+
+def test_nested_change_invalidates_encoding():
+    dataset = read_dataset(SERDE_VERSION_2)
+
+    dataset.contributors[0].name = "bob"
+    assert encoding_of(dataset, SERDE_VERSION_2) is None
+
+
+def test_frozen_arrays_are_tracked():
+    record = read(ArrayRecord(array=np.arange(10)), SERDE_VERSION_2)
+    assert not record.array.flags.writeable
+    assert encoding_of(record, SERDE_VERSION_2) is not None
+
+    record.array = np.arange(10)
+    assert encoding_of(record, SERDE_VERSION_2) is None
+
+
+def test_writable_arrays_are_not_remembered():
+    with writable_arrays():
+        record = read(ArrayRecord(array=np.arange(10)), SERDE_VERSION_2)
+    # could be changed in place without being replaced
+    assert record.array.flags.writeable
+    assert encoding_of(record, SERDE_VERSION_2) is None
+
+
+def test_encoding_lives_on_the_object():
+    contributor = read_contributor(SERDE_VERSION_2)
+
+    assert "_syft_encoding" not in contributor.__dict__
+    assert "_syft_encoding" not in dict(contributor)
+    assert encoding_of(contributor.copy(), SERDE_VERSION_2) is None
+
+    ref = weakref.ref(contributor)
+    del contributor
+    gc.collect()
+    assert ref() is None
+
+
+def test_forget_encoding():
+    contributor = read_contributor(SERDE_VERSION_2)
+
+    forget_encoding(contributor)
+    assert encoding_of(contributor, SERDE_VERSION_2) is None
+
+
+def test_encode_afresh():
+    contributor = read_contributor(SERDE_VERSION_2)
+    message = encoding_of(contributor, SERDE_VERSION_2)
+
+    with encode_afresh():
+        assert encoding_of(contributor, SERDE_VERSION_2) is None
+        blob = sy.serialize(contributor, to_bytes=True, version=SERDE_VERSION_2)
+    assert bytes([TAG_MESSAGE]) + len(message).to_bytes(8, "little") not in blob
+    assert sy.deserialize(blob, from_bytes=True) == contributor
+    assert encoding_of(contributor, SERDE_VERSION_2) is not None
+
+
+def test_v1_reuses_nested_message():
+    contributor = read_contributor(SERDE_VERSION_1)
+    message = encoding_of(contributor, SERDE_VERSION_1)
+
+    assert sy.serialize(contributor, to_bytes=True, version=SERDE_VERSION_1) == message
+    assert encoding_of(contributor, SERDE_VERSION_2) is None
+
+    blob = sy.serialize([contributor], to_bytes=True, version=SERDE_VERSION_1)
+    assert message in blob
+    assert sy.deserialize(blob, from_bytes=True) == [contributor]
+
+
+def test_store_backed_get_copies_stored_message(faker, tmp_path):
+    worker = sy.Worker.named(
+        name=faker.name(), local_db=True, sqlite_path=str(tmp_path)
+    )
+    client = worker.root_client
+    country = DataSubjectCreate(name="Country")
+    country.add_member(DataSubjectCreate(name="Canada"))
+    assert client.api.services.data_subject.add_data_subject(data_subject=country)
+
+    call = SyftAPICall(
+        node_uid=worker.id,
+        path="data_subject.get_by_name",
+        args=[],
+        kwargs={"name": "Canada"},
+    )
+    signed_result = worker.handle_api_call(call.sign(client.api.signing_key))
+    canada = signed_result.message.data
+    assert canada.name == "Canada"
+
+    store = worker.document_store.partitions["DataSubject"].data
+    row = store._execute(store.sql["get"], [str(canada.id)]).ok().fetchone()[0]
+    spliced = bytes([TAG_MESSAGE]) + len(row).to_bytes(8, "little") + row
+    assert spliced in signed_result.serialized_message
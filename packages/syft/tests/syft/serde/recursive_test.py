@@ -0,0 +1,94 @@
+# third party
+import numpy as np
+from pydantic import ValidationError
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.deserialize import trusted_deserialization
+from syft.serde.recursive import RESOLVED_CLASSES
+from syft.serde.recursive import combine_bytes
+from syft.serde.serializable import serializable
+from syft.serde.wire_format import SERDE_VERSION_1
+from syft.serde.wire_format import SERDE_VERSION_2
+from syft.service.dataset.dataset import Contributor
+from syft.service.policy.policy import add_class_to_user_module
+from syft.types.syft_object import SYFT_OBJECT_VERSION_1
+from syft.types.syft_object import SyftObject
+from syft.types.uid import UID
+
+
+def test_combine_bytes_single_chunk_is_not_copied():
+    chunk = b"0123456789"
+
+    assert combine_bytes([chunk]) is chunk
+
+
+def test_combine_bytes_multiple_chunks():
+    combined = combine_bytes([b"012", b"3456", b"789"])
+
+    assert bytes(combined) == b"0123456789"
+
+
+@pytest.mark.parametrize("version", [SERDE_VERSION_1, SERDE_VERSION_2])
+def test_deserialize_bytes_like(version):
+    obj = {"uid": UID(), "array": np.arange(10), "text": "héllo", "blob": b"\x00\x01"}
+    blob = sy.serialize(obj, to_bytes=True, version=version)
+
+    for buffer in [memoryview(blob), bytearray(blob)]:
+        de = sy.deserialize(buffer, from_bytes=True)
+        assert de["uid"] == obj["uid"]
+        assert (de["array"] == obj["array"]).all()
+        assert de["text"] == obj["text"]
+        assert de["blob"] == obj["blob"]
+        assert type(de["blob"]) is bytes
+
+
+def load_user_class() -> type:
+    # a new class on every call, like user code executed again on reload
+    @serializable()
+    class ResolvedClassTestPolicy(SyftObject):
+        __module__ = "syft.user"
+        __canonical_name__ = "ResolvedClassTestPolicy"
+        __version__ = SYFT_OBJECT_VERSION_1
+
+        value: int = 0
+
+    return add_class_to_user_module(ResolvedClassTestPolicy, "ResolvedClassTestPolicy")
+
+
+@pytest.mark.parametrize("version", [SERDE_VERSION_1, SERDE_VERSION_2])
+def test_resolved_user_classes_follow_reloads(version):
+    fqn = "syft.user.ResolvedClassTestPolicy"
+    first = load_user_class()
+    blob = sy.serialize(first(id=UID(), value=1), to_bytes=True, version=version)
+
+    assert type(sy.deserialize(blob, from_bytes=True)) is first
+    assert RESOLVED_CLASSES[fqn][0] is first
+
+    second = load_user_class()
+    assert type(sy.deserialize(blob, from_bytes=True)) is second
+
+    # loading a known class again swaps it in without registering it
+    add_class_to_user_module(first, "ResolvedClassTestPolicy")
+    assert fqn not in RESOLVED_CLASSES
+    assert type(sy.deserialize(blob, from_bytes=True)) is first
+
+
+@pytest.mark.parametrize("version", [SERDE_VERSION_1, SERDE_VERSION_2])
+def test_trusted_deserialization_skips_validation(version):
+    # only objects which were never validated can tell the two paths apart
+    contributor = Contributor.construct(
+        id=UID(), name=None, role="owner", email="alice@example.com"
+    )
+    blob = sy.serialize(contributor, to_bytes=True, version=version)
+
+    with pytest.raises(ValidationError):
+        sy.deserialize(blob, from_bytes=True)
+
+    trusted = sy.deserialize(blob, from_bytes=True, trusted=True)
+    assert type(trusted) is Contributor
+    assert trusted == contributor
+
+    with trusted_deserialization():
+        assert sy.deserialize(blob, from_bytes=True) == contributor
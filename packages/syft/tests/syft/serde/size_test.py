@@ -0,0 +1,51 @@
+# third party
+import numpy as np
+import pandas as pd
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.client.connection import is_streaming_upload
+from syft.client.connection import preflight_upload
+from syft.serde.size import serialized_size
+from syft.serde.wire_format import SERDE_VERSION_2
+from syft.service.action.action_object import ActionObject
+from syft.service.dataset.dataset import Contributor
+from syft.types.uid import UID
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        np.random.default_rng(0).random(100_000),
+        ActionObject.from_obj(np.random.default_rng(0).random(100_000)),
+        {
+            "uid": UID(),
+            "values": list(range(100)),
+            "text": "x" * 1000,
+            "contributors": [Contributor(name="a", email="b@c.d", role="r")] * 3,
+        },
+    ],
+)
+def test_serialized_size(obj):
+    size = len(sy.serialize(obj, to_bytes=True, version=SERDE_VERSION_2))
+
+    assert 0.9 * size <= serialized_size(obj) <= 1.2 * size
+
+
+def test_serialized_size_of_frames_uses_buffers():
+    df = pd.DataFrame({"a": np.arange(100_000), "b": np.ones(100_000)})
+
+    assert serialized_size(df) >= df.memory_usage().sum()
+
+
+def test_preflight_upload():
+    obj = ActionObject.from_obj(np.zeros(1000))
+
+    with preflight_upload(obj, threshold=1_000_000) as size:
+        assert size > 8000
+        assert not is_streaming_upload()
+
+    with preflight_upload(obj, threshold=1000):
+        assert is_streaming_upload()
+    assert not is_streaming_upload()
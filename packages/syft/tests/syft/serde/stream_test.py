@@ -0,0 +1,76 @@
+# stdlib
+import io
+
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.stream import deserialize_from
+from syft.serde.stream import iter_frames
+from syft.serde.stream import serialize_buffer
+from syft.serde.stream import serialize_to
+from syft.serde.wire_format import SERDE_VERSION_1
+from syft.serde.wire_format import SERDE_VERSION_2
+from syft.types.uid import UID
+
+
+class ReadOnlyStream:
+    """A stream without readinto which returns short reads."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = io.BytesIO(data)
+
+    def read(self, size: int) -> bytes:
+        return self.data.read(min(size, 7))
+
+
+@pytest.mark.parametrize("version", [SERDE_VERSION_1, SERDE_VERSION_2])
+def test_stream_roundtrip(version):
+    obj = {"array": np.arange(1000.0), "uid": UID(), "text": "x" * 100}
+    stream = io.BytesIO()
+
+    size = serialize_to(obj, stream, frame_size=1000, version=version)
+    assert size == len(stream.getvalue())
+
+    stream.seek(0)
+    result = deserialize_from(stream)
+    assert (result["array"] == obj["array"]).all()
+    assert result["uid"] == obj["uid"]
+    assert result["text"] == obj["text"]
+
+
+def test_stream_without_readinto():
+    stream = io.BytesIO()
+    serialize_to([1, 2, 3], stream, frame_size=2)
+
+    assert deserialize_from(ReadOnlyStream(stream.getvalue())) == [1, 2, 3]
+
+
+def test_stream_truncated():
+    stream = io.BytesIO()
+    serialize_to([1, 2, 3], stream, frame_size=2)
+
+    with pytest.raises(EOFError):
+        deserialize_from(io.BytesIO(stream.getvalue()[:-6]))
+
+    with pytest.raises(ValueError):
+        deserialize_from(io.BytesIO(b"\x00" * 16))
+
+
+def test_serialize_buffer_matches_serialize():
+    obj = {"array": np.arange(100), "uid": UID()}
+    buffer = serialize_buffer(obj)
+
+    assert bytes(buffer) == sy.serialize(obj, to_bytes=True)
+    assert sy.deserialize(buffer, from_bytes=True)["uid"] == obj["uid"]
+
+
+def test_iter_frames():
+    parts = [b"header", memoryview(np.arange(100, dtype=np.uint8))]
+
+    frames = list(iter_frames(parts, frame_size=30))
+
+    assert max(map(len, frames)) == 30
+    assert b"".join(frames) == b"header" + bytes(range(100))
@@ -2,13 +2,19 @@
 from time import time
 from typing import Callable
 from typing import Optional
+import uuid
 
 # third party
 from pydantic import BaseModel
+import pytest
 
 # syft absolute
 import syft as sy
+from syft.serde.recursive import TYPE_BANK
 from syft.serde.serializable import serializable
+from syft.serde.wire_format import SERDE_VERSION_1
+from syft.serde.wire_format import SERDE_VERSION_2
+from syft.types.uid import UID
 
 
 def get_fqn_for_class(cls):
@@ -306,3 +312,33 @@ def test_pydantic_derived_only():
     assert (data.uid, data.value, data.flag) != (de.uid, de.value, de.flag)
     assert (de.uid, de.value, de.flag) == (None, None, None)
     assert (data.source, data.target) == (de.source, de.target)
+
+
+# ------------------------------ Serde plans ------------------------------
+
+
+def test_field_plan_is_compiled_on_register():
+    *_, field_plan = TYPE_BANK[get_fqn_for_class(Derived)]
+
+    assert [attr_name for attr_name, _, _ in field_plan] == ["status", "uid", "value"]
+
+
+def test_field_plan_applies_serde_overrides():
+    uid = UID()
+    *_, field_plan = TYPE_BANK[get_fqn_for_class(UID)]
+
+    assert [attr_name for attr_name, _, _ in field_plan] == ["value"]
+    assert sy.deserialize(sy.serialize(uid, to_bytes=True), from_bytes=True) == uid
+
+
+@pytest.mark.parametrize("version", [SERDE_VERSION_1, SERDE_VERSION_2])
+def test_field_plan_drives_decoding(monkeypatch, version):
+    uid = UID()
+    *_, field_plan = TYPE_BANK[get_fqn_for_class(UID)]
+    assert list(field_plan.decoders) == ["value"]
+
+    # decoders use the transforms of the plan rather than __serde_overrides__
+    other = uuid.uuid4()
+    monkeypatch.setitem(field_plan.decoders, "value", lambda _: other)
+    blob = sy.serialize(uid, to_bytes=True, version=version)
+    assert sy.deserialize(blob, from_bytes=True).value == other
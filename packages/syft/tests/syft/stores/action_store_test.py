@@ -1,4 +1,5 @@
 # stdlib
+import sqlite3
 from typing import Any
 
 # third party
@@ -137,3 +138,27 @@ def test_action_store_test_data_set_get(store: Any):
     assert res.is_ok()
     res = store.delete(data_uid, client_key)
     assert res.is_err()
+
+
+def test_sqlite_action_store_batches_are_atomic(sqlite_action_store, monkeypatch):
+    store = sqlite_action_store
+    client_key = SyftVerifyKey.from_string(test_verify_key_string_client)
+    objs = [MockSyftObject(data=i) for i in range(3)]
+    uids = [obj.id for obj in objs]
+
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise sqlite3.OperationalError("disk I/O error")
+
+    # the data written before the permissions failed is rolled back
+    monkeypatch.setattr(store.permissions, "set_many", fail)
+    with pytest.raises(sqlite3.OperationalError):
+        store.set_many(client_key, objs)
+    assert not any(store.exists(uid) for uid in uids)
+
+    monkeypatch.undo()
+    assert store.set_many(client_key, objs, has_result_read_permission=True).is_ok()
+
+    monkeypatch.setattr(store.permissions, "delete_many", fail)
+    with pytest.raises(sqlite3.OperationalError):
+        store.delete_many(uids, client_key)
+    assert all(store.exists(uid) for uid in uids)
@@ -1,4 +1,6 @@
 # stdlib
+from functools import partial
+from pathlib import Path
 import random
 from typing import Any
 from typing import Callable
@@ -7,6 +9,7 @@ from typing import Dict
 from typing import List
 from typing import Tuple
 from typing import TypeVar
+import warnings
 
 # third party
 from faker import Faker
@@ -23,6 +26,12 @@ from syft.store.document_store import PartitionSettings
 from syft.store.document_store import QueryKey
 from syft.store.document_store import QueryKeys
 from syft.store.document_store import UIDPartitionKey
+from syft.store.pagination import FullScanWarning
+from syft.store.pagination import Page
+from syft.store.pagination import PageCursor
+from syft.store.sqlite_document_store import SQLiteDocumentStore
+from syft.store.sqlite_document_store import SQLiteStoreClientConfig
+from syft.store.sqlite_document_store import SQLiteStoreConfig
 from syft.types.syft_object import SyftObject
 from syft.types.uid import UID
 
@@ -83,6 +92,16 @@ def base_stash(root_verify_key) -> MockStash:
     return MockStash(store=DictDocumentStore(root_verify_key))
 
 
+@pytest.fixture(params=["dict", "sqlite"])
+def paged_stash(root_verify_key, tmp_path: Path, request) -> MockStash:
+    # stores page by id on their own, SQLite in its queries
+    if request.param == "dict":
+        return MockStash(store=DictDocumentStore(root_verify_key))
+    client_config = SQLiteStoreClientConfig(filename="stash.sqlite", path=tmp_path)
+    store_config = SQLiteStoreConfig(client_config=client_config)
+    return MockStash(store=SQLiteDocumentStore(root_verify_key, store_config))
+
+
 def random_sentence(faker: Faker) -> str:
     return faker.paragraph(nb_sentences=1)
 
@@ -447,3 +466,158 @@ def test_basestash_cannot_query_non_searchable(
     assert base_stash.query_all(
         root_verify_key, QueryKeys(qks=[qk, UIDPartitionKey.with_obj(obj.id)])
     ).is_err()
+
+
+def test_basestash_set_many_get_many(
+    root_verify_key, base_stash: MockStash, mock_objects: List[MockObject]
+) -> None:
+    result = base_stash.set_many(root_verify_key, mock_objects)
+    assert result.is_ok()
+
+    uids = [obj.id for obj in reversed(mock_objects)]
+    random_uid = create_unique(UID, uids)
+    result = base_stash.get_many_by_uid(root_verify_key, [*uids, random_uid])
+    assert result.is_ok()
+    assert result.ok() == list(reversed(mock_objects))
+
+
+def test_basestash_set_many_duplicate_unique_key(
+    root_verify_key, base_stash: MockStash, faker: Faker
+) -> None:
+    objs = [
+        MockObject(**kwargs)
+        for kwargs in multiple_object_kwargs(faker, n=3, name=faker.name())
+    ]
+
+    result = base_stash.set_many(root_verify_key, objs)
+    assert result.is_err()
+    assert len(base_stash.get_all(root_verify_key).ok()) == 0
+
+    result = base_stash.set_many(root_verify_key, objs, ignore_duplicates=True)
+    assert result.is_ok()
+    assert base_stash.get_all(root_verify_key).ok() == [objs[0]]
+
+
+def test_basestash_update_many(
+    root_verify_key, base_stash: MockStash, mock_objects: List[MockObject]
+) -> None:
+    base_stash.set_many(root_verify_key, mock_objects)
+
+    updated_objs = []
+    for i, obj in enumerate(mock_objects):
+        updated_obj = obj.copy()
+        updated_obj.value = i
+        updated_objs.append(updated_obj)
+
+    result = base_stash.update_many(root_verify_key, updated_objs)
+    assert result.is_ok()
+    assert result.ok() == updated_objs
+
+    stored = base_stash.get_many_by_uid(root_verify_key, [x.id for x in mock_objects])
+    assert [obj.value for obj in stored.ok()] == list(range(len(mock_objects)))
+
+    random_obj = mock_objects[0].copy()
+    random_obj.id = create_unique(UID, [obj.id for obj in mock_objects])
+    result = base_stash.update_many(root_verify_key, [random_obj])
+    assert result.is_err()
+
+
+def test_basestash_delete_many_by_uid(
+    root_verify_key, base_stash: MockStash, mock_objects: List[MockObject]
+) -> None:
+    base_stash.set_many(root_verify_key, mock_objects)
+
+    result = base_stash.delete_many_by_uid(
+        root_verify_key, [obj.id for obj in mock_objects[1:]]
+    )
+    assert result.is_ok()
+    assert base_stash.get_all(root_verify_key).ok() == mock_objects[:1]
+
+    random_uid = create_unique(UID, [obj.id for obj in mock_objects])
+    result = base_stash.delete_many_by_uid(root_verify_key, [random_uid])
+    assert result.is_err()
+
+    # the unique keys of deleted objects can be used again
+    objs = [MockObject(**{**obj.dict(), "id": UID()}) for obj in mock_objects[1:]]
+    result = base_stash.set_many(root_verify_key, objs)
+    assert result.is_ok()
+
+
+def get_pages(get_page: Callable[..., Any], limit: int, **kwargs: Any) -> List[Page]:
+    pages = []
+    cursor = None
+    while True:
+        result = get_page(limit=limit, cursor=cursor, **kwargs)
+        assert result.is_ok()
+        pages.append(result.ok())
+        cursor = pages[-1].next_cursor
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.parametrize("sort_key", ["id", "value"])
+def test_basestash_get_page(
+    root_verify_key, paged_stash: MockStash, faker: Faker, sort_key: str
+) -> None:
+    objs = [MockObject(**kwargs) for kwargs in multiple_object_kwargs(faker, n=25)]
+    assert paged_stash.set_many(root_verify_key, objs).is_ok()
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        pages = get_pages(
+            partial(paged_stash.get_page, root_verify_key), limit=10, sort_key=sort_key
+        )
+    assert [len(page) for page in pages] == [10, 10, 5]
+    # only pages by id are cut out by the store
+    full_scans = [w for w in caught if issubclass(w.category, FullScanWarning)]
+    assert len(full_scans) == (0 if sort_key == "id" else len(pages))
+
+    expected = sorted(objs, key=lambda obj: (getattr(obj, sort_key), obj.id))
+    assert [obj.id for page in pages for obj in page] == [obj.id for obj in expected]
+
+    # a full last page has no next one
+    pages = get_pages(
+        partial(paged_stash.get_page, root_verify_key), limit=25, sort_key=sort_key
+    )
+    assert len(pages) == 1
+
+    result = paged_stash.get_page(root_verify_key, limit=0)
+    assert result.is_err()
+    result = paged_stash.get_page(
+        root_verify_key,
+        limit=10,
+        cursor=PageCursor.after(objs[0], "id"),
+        sort_key="name",
+    )
+    assert result.is_err()
+
+
+def test_basestash_query_page(
+    root_verify_key,
+    paged_stash: MockStash,
+    mock_objects: List[MockObject],
+    faker: Faker,
+) -> None:
+    desc = random_sentence(faker)
+    similar_objects = [
+        MockObject(**kwargs) for kwargs in multiple_object_kwargs(faker, n=7, desc=desc)
+    ]
+    assert paged_stash.set_many(root_verify_key, mock_objects + similar_objects).is_ok()
+
+    qk = QueryKey.from_obj(DescPartitionKey, desc)
+    pages = get_pages(partial(paged_stash.query_page, root_verify_key, qk), limit=3)
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [obj.id for page in pages for obj in page] == sorted(
+        obj.id for obj in similar_objects
+    )
+
+    # unique keys narrow the search down to their object
+    qks = QueryKeys(
+        qks=[qk, QueryKey.from_obj(NamePartitionKey, similar_objects[0].name)]
+    )
+    pages = get_pages(partial(paged_stash.query_page, root_verify_key, qks), limit=3)
+    assert [obj.id for page in pages for obj in page] == [similar_objects[0].id]
+
+    qk = QueryKey.from_obj(DescPartitionKey, random_sentence(faker))
+    pages = get_pages(partial(paged_stash.query_page, root_verify_key, qk), limit=3)
+    assert [len(page) for page in pages] == [0]
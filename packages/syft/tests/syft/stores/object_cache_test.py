@@ -0,0 +1,59 @@
+# syft absolute
+from syft.store.object_cache import ObjectCache
+
+
+def test_object_cache_lru() -> None:
+    cache = ObjectCache(max_items=2, max_bytes=100)
+    cache.put("a", 1, 10, cache.generation)
+    cache.put("b", 2, 10, cache.generation)
+    assert cache.get("a") == 1
+    cache.put("c", 3, 10, cache.generation)
+
+    # b was the least recently used
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats() == {
+        "hits": 3,
+        "misses": 1,
+        "evictions": 1,
+        "items": 2,
+        "bytes": 20,
+    }
+
+
+def test_object_cache_max_bytes() -> None:
+    cache = ObjectCache(max_items=10, max_bytes=100)
+    cache.put("a", 1, 60, cache.generation)
+    cache.put("b", 2, 60, cache.generation)
+    assert "a" not in cache
+    assert "b" in cache
+
+    # too large to ever fit
+    cache.put("c", 3, 101, cache.generation)
+    assert "c" not in cache
+    assert cache.stats()["bytes"] == 60
+
+
+def test_object_cache_invalidate() -> None:
+    cache = ObjectCache(max_items=10, max_bytes=100)
+    cache.put("a", 1, 10, cache.generation)
+    cache.put("b", 2, 10, cache.generation)
+
+    # loaded before the invalidation, possibly before a write
+    generation = cache.generation
+    cache.invalidate(["a"])
+    cache.put("a", 0, 10, generation)
+    assert "a" not in cache
+    assert "b" in cache
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats()["bytes"] == 0
+
+
+def test_object_cache_disabled() -> None:
+    cache = ObjectCache(max_items=0, max_bytes=100)
+    assert not cache.enabled
+    cache.put("a", 1, 10, cache.generation)
+    assert "a" not in cache
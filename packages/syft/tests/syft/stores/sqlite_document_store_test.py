@@ -1,4 +1,5 @@
 # stdlib
+from pathlib import Path
 from threading import Thread
 from typing import Tuple
 
@@ -9,6 +10,7 @@ import pytest
 
 # syft absolute
 from syft.store.document_store import QueryKeys
+from syft.store.document_store import StorePartition
 from syft.store.sqlite_document_store import SQLiteStorePartition
 
 # relative
@@ -522,3 +524,258 @@ def test_sqlite_store_partition_set_delete_joblib(
         ).ok()
     )
     assert stored_cnt == 0
+
+
+def test_sqlite_store_partition_index_rows(
+    root_verify_key,
+    sqlite_store_partition: SQLiteStorePartition,
+) -> None:
+    objs = [MockSyftObject(data=i) for i in range(REPEATS)]
+    for obj in objs:
+        res = sqlite_store_partition.set(root_verify_key, obj, ignore_duplicates=False)
+        assert res.is_ok()
+
+    rows = len(sqlite_store_partition.unique_keys)
+    assert rows > 0
+    assert rows % REPEATS == 0
+
+    key = sqlite_store_partition.settings.store_key.with_obj(objs[0])
+    res = sqlite_store_partition.update(
+        root_verify_key, key, MockSyftObject(data="updated")
+    )
+    assert res.is_ok()
+    assert len(sqlite_store_partition.unique_keys) == rows
+
+    for obj in objs:
+        key = sqlite_store_partition.settings.store_key.with_obj(obj)
+        res = sqlite_store_partition.delete(root_verify_key, key)
+        assert res.is_ok()
+
+    assert len(sqlite_store_partition.unique_keys) == 0
+    assert len(sqlite_store_partition.searchable_keys) == 0
+
+
+def test_sqlite_store_partition_rebuild_index(
+    root_verify_key,
+    sqlite_workspace: Tuple[Path, str],
+) -> None:
+    sqlite_store_partition = sqlite_store_partition_fn(
+        root_verify_key, sqlite_workspace
+    )
+    objs = [MockSyftObject(data=i) for i in range(REPEATS)]
+    for obj in objs:
+        res = sqlite_store_partition.set(root_verify_key, obj, ignore_duplicates=False)
+        assert res.is_ok()
+    rows = len(sqlite_store_partition.unique_keys)
+
+    # stores written before the index tables existed only have the data table
+    table_name = sqlite_store_partition.unique_keys.table_name
+    sqlite_store_partition.unique_keys._execute(f"drop table {table_name}")  # nosec
+
+    sqlite_store_partition = sqlite_store_partition_fn(
+        root_verify_key, sqlite_workspace
+    )
+    assert len(sqlite_store_partition.unique_keys) == rows
+
+    for obj in objs:
+        key = sqlite_store_partition.settings.store_key.with_obj(obj)
+        res = sqlite_store_partition.get_all_from_store(
+            root_verify_key, QueryKeys(qks=[key])
+        )
+        assert res.is_ok()
+        assert res.ok()[0].data == obj.data
+
+
+def test_sqlite_store_partition_transaction(
+    root_verify_key,
+    sqlite_store_partition: SQLiteStorePartition,
+) -> None:
+    journal_mode = sqlite_store_partition.connection.db.execute("pragma journal_mode")
+    assert journal_mode.fetchone()[0] == "wal"
+
+    objs = [MockSyftObject(data=i) for i in range(REPEATS)]
+    with sqlite_store_partition.transaction():
+        for obj in objs:
+            res = sqlite_store_partition.set(root_verify_key, obj)
+            assert res.is_ok()
+    assert len(sqlite_store_partition.all(root_verify_key).ok()) == REPEATS
+    rows = len(sqlite_store_partition.unique_keys)
+
+    # nothing of a failing block is written
+    with pytest.raises(RuntimeError):
+        with sqlite_store_partition.transaction():
+            for i in range(REPEATS):
+                res = sqlite_store_partition.set(
+                    root_verify_key, MockSyftObject(data=i)
+                )
+                assert res.is_ok()
+            raise RuntimeError("rollback")
+    assert len(sqlite_store_partition.all(root_verify_key).ok()) == REPEATS
+    assert len(sqlite_store_partition.unique_keys) == rows
+
+    # failed operations inside a block are undone on their own
+    with sqlite_store_partition.transaction():
+        obj = MockSyftObject(data="new")
+        assert sqlite_store_partition.set(root_verify_key, obj).is_ok()
+        res = sqlite_store_partition.set(root_verify_key, obj, ignore_duplicates=False)
+        assert res.is_err()
+    assert len(sqlite_store_partition.all(root_verify_key).ok()) == REPEATS + 1
+
+
+def test_sqlite_store_partition_batch(
+    root_verify_key,
+    sqlite_store_partition: SQLiteStorePartition,
+) -> None:
+    objs = [MockSyftObject(data=i) for i in range(REPEATS)]
+    res = sqlite_store_partition.set_many(root_verify_key, objs)
+    assert res.is_ok()
+    rows = len(sqlite_store_partition.unique_keys)
+
+    # a duplicate fails the whole batch
+    res = sqlite_store_partition.set_many(
+        root_verify_key, [MockSyftObject(data="new"), objs[0]]
+    )
+    assert res.is_err()
+    assert len(sqlite_store_partition.all(root_verify_key).ok()) == REPEATS
+    assert len(sqlite_store_partition.unique_keys) == rows
+
+    uids = [obj.id for obj in objs]
+    res = sqlite_store_partition.get_many(root_verify_key, uids)
+    assert [obj.data for obj in res.ok()] == list(range(REPEATS))
+
+    qks = [sqlite_store_partition.settings.store_key.with_obj(obj) for obj in objs]
+    updates = [MockSyftObject(data=-i) for i in range(REPEATS)]
+    res = sqlite_store_partition.update_many(root_verify_key, qks, updates)
+    assert res.is_ok()
+    res = sqlite_store_partition.get_many(root_verify_key, uids)
+    assert [obj.data for obj in res.ok()] == [-i for i in range(REPEATS)]
+    assert len(sqlite_store_partition.unique_keys) == rows
+
+    res = sqlite_store_partition.delete_many(root_verify_key, qks)
+    assert res.is_ok()
+    assert len(sqlite_store_partition.all(root_verify_key).ok()) == 0
+    assert len(sqlite_store_partition.unique_keys) == 0
+
+
+def test_sqlite_store_partition_cache_is_off_by_default(
+    sqlite_store_partition: SQLiteStorePartition,
+) -> None:
+    assert sqlite_store_partition.cache_stats() == {}
+
+
+def test_sqlite_store_partition_cache(
+    root_verify_key,
+    sqlite_workspace: Tuple[Path, str],
+) -> None:
+    sqlite_store_partition = sqlite_store_partition_fn(
+        root_verify_key, sqlite_workspace, cache_size=1024
+    )
+    obj = MockSyftObject(data=1)
+    assert sqlite_store_partition.set(root_verify_key, obj).is_ok()
+    key = sqlite_store_partition.settings.store_key.with_obj(obj)
+
+    def get_data() -> int:
+        res = sqlite_store_partition.get_all_from_store(
+            root_verify_key, QueryKeys(qks=[key])
+        )
+        return res.ok()[0].data
+
+    assert get_data() == 1
+    stats = sqlite_store_partition.cache_stats()["data"]
+    assert get_data() == 1
+    assert sqlite_store_partition.cache_stats()["data"]["hits"] == stats["hits"] + 1
+
+    # every reader decodes its own object
+    first = sqlite_store_partition.data[obj.id]
+    assert first is not sqlite_store_partition.data[obj.id]
+    first.data = 2
+    assert get_data() == 1
+
+    # writes invalidate
+    assert sqlite_store_partition.update(root_verify_key, key, first).is_ok()
+    assert get_data() == 2
+
+    # so do the writes of another connection, like the one of another process
+    other_partition = sqlite_store_partition_fn(
+        root_verify_key, sqlite_workspace, cache_size=1024
+    )
+    res = other_partition.update(root_verify_key, key, MockSyftObject(data=3))
+    assert res.is_ok()
+    assert get_data() == 3
+
+    # and rolled back ones
+    with pytest.raises(RuntimeError):
+        with sqlite_store_partition.transaction():
+            res = sqlite_store_partition.update(
+                root_verify_key, key, MockSyftObject(data=4)
+            )
+            assert res.is_ok()
+            assert get_data() == 4
+            raise RuntimeError("rollback")
+    assert get_data() == 3
+
+    res = other_partition.delete(root_verify_key, key)
+    assert res.is_ok()
+    assert obj.id not in sqlite_store_partition.data
+
+
+def test_sqlite_store_partition_update_in_place(
+    root_verify_key,
+    sqlite_workspace: Tuple[Path, str],
+) -> None:
+    sqlite_store_partition = sqlite_store_partition_fn(
+        root_verify_key, sqlite_workspace, cache_size=1024
+    )
+    obj = MockSyftObject(data=["a"])
+    assert sqlite_store_partition.set(root_verify_key, obj).is_ok()
+    key = sqlite_store_partition.settings.store_key.with_obj(obj)
+
+    # like NodePeer.update_routes, changes a nested list without replacing it
+    stored = sqlite_store_partition.data[obj.id]
+    stored.data += ["b"]
+    assert sqlite_store_partition.update(root_verify_key, key, stored).is_ok()
+
+    assert sqlite_store_partition.data[obj.id].data == ["a", "b"]
+    other_partition = sqlite_store_partition_fn(root_verify_key, sqlite_workspace)
+    assert other_partition.data[obj.id].data == ["a", "b"]
+
+    # changes which are not written back do not reach the cache either
+    sqlite_store_partition.data[obj.id].data.append("c")
+    assert sqlite_store_partition.data[obj.id].data == ["a", "b"]
+
+
+def test_sqlite_store_partition_batch_fallback_rolls_back(
+    root_verify_key,
+    sqlite_store_partition: SQLiteStorePartition,
+) -> None:
+    first = MockSyftObject(data=1)
+    # the base class fallback, one object at a time
+    res = StorePartition._set_many(
+        sqlite_store_partition, root_verify_key, [first, MockSyftObject(data=2), first]
+    )
+
+    assert res.is_err()
+    assert len(sqlite_store_partition.all(root_verify_key).ok()) == 0
+
+
+def test_sqlite_store_partition_page_in_sql(
+    root_verify_key,
+    sqlite_store_partition: SQLiteStorePartition,
+) -> None:
+    objs = [MockSyftObject(data=i) for i in range(REPEATS)]
+    assert sqlite_store_partition.set_many(root_verify_key, objs).is_ok()
+
+    statements = []
+    sqlite_store_partition.data.db.set_trace_callback(statements.append)
+    page = sqlite_store_partition.page(root_verify_key, limit=5)
+    sqlite_store_partition.data.db.set_trace_callback(None)
+
+    assert page.is_ok()
+    expected = sorted(obj.id for obj in objs)[:5]
+    assert [obj.id for obj in page.ok()] == expected
+
+    # the uids are ordered and limited by SQLite, only the page is read
+    assert any("order by uid limit" in sql for sql in statements)
+    table = sqlite_store_partition.data.table_name
+    assert f"select uid, value from {table}" not in statements
+    assert f"select uid from {table}" not in statements
@@ -1,6 +1,7 @@
 # stdlib
 from pathlib import Path
 import tempfile
+from typing import Any
 from typing import Generator
 from typing import Tuple
 
@@ -78,20 +79,24 @@ def sqlite_workspace() -> Generator:
 
     yield sqlite_workspace_folder, sqlite_db_name
 
-    if db_path.exists():
-        try:
-            db_path.unlink()
-        except BaseException as e:
-            print("failed to cleanup sqlite db", e)
+    for path in [db_path, *db_path.parent.glob(f"{sqlite_db_name}-*")]:
+        if path.exists():
+            try:
+                path.unlink()
+            except BaseException as e:
+                print("failed to cleanup sqlite db", e)
 
 
 def sqlite_store_partition_fn(
     root_verify_key,
     sqlite_workspace: Tuple[Path, str],
     locking_config_name: str = "nop",
+    **client_config: Any,
 ):
     workspace, db_name = sqlite_workspace
-    sqlite_config = SQLiteStoreClientConfig(filename=db_name, path=workspace)
+    sqlite_config = SQLiteStoreClientConfig(
+        filename=db_name, path=workspace, **client_config
+    )
 
     locking_config = str_to_locking_config(locking_config_name)
     store_config = SQLiteStoreConfig(
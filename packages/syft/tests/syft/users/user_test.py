@@ -5,6 +5,7 @@ import pytest
 # syft absolute
 from syft.client.api import SyftAPICall
 from syft.service.context import AuthedServiceContext
+from syft.service.data_subject.data_subject import DataSubjectCreate
 from syft.service.user.user import ServiceRole
 from syft.service.user.user import UserCreate
 from syft.service.user.user import UserUpdate
@@ -94,6 +95,39 @@ def test_read_returns_view(root_domain_client):
         assert isinstance(root_domain_client.api.services.user[0], UserView)
 
 
+def test_read_users_in_pages(root_domain_client, ds_client, guest_client):
+    users = root_domain_client.api.services.user
+    page = users.get_all(limit=2)
+    assert len(page) == 2
+    assert page.next_cursor is not None
+
+    # fetched one page at a time, in the order of their ids
+    all_users = list(users.iter_all(page_size=1))
+    assert all(isinstance(user, UserView) for user in all_users)
+    assert [user.id for user in all_users] == sorted(
+        user.id for user in users.get_all()
+    )
+
+
+def test_iterate_users_in_pages(root_domain_client):
+    users = root_domain_client.api.services.user
+    assert users._paginates()
+    assert [user.id for user in users] == sorted(user.id for user in users.get_all())
+
+
+def test_iterate_module_without_pagination(root_domain_client):
+    # data_subject.get_all takes no limit or cursor, so it is not paged
+    data_subjects = root_domain_client.api.services.data_subject
+    data_subject = DataSubjectCreate(name="a")
+    data_subject.add_member(DataSubjectCreate(name="b"))
+    assert data_subjects.add_data_subject(data_subject=data_subject)
+
+    assert not data_subjects._paginates()
+    names = [data_subject.name for data_subject in data_subjects]
+    assert sorted(names) == ["a", "b"]
+    assert list(root_domain_client.api.services.code) == []
+
+
 def test_user_create(worker, do_client, guest_client, ds_client, root_domain_client):
     for client in [ds_client, guest_client]:
         assert not manually_call_service(worker, client, "user.create")
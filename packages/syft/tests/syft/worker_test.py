@@ -12,6 +12,7 @@ from result import Ok
 import syft as sy
 from syft.client.api import SignedSyftAPICall
 from syft.client.api import SyftAPICall
+from syft.client.api import is_signed_envelope
 from syft.node.credentials import SIGNING_KEY_FOR
 from syft.node.credentials import SyftSigningKey
 from syft.node.credentials import SyftVerifyKey
@@ -359,3 +360,33 @@ def test_worker_handle_api_response(
         assert isinstance(result, QueueItem)
     else:
         assert not isinstance(result, SyftError)
+
+
+def test_signed_envelope(worker) -> None:
+    root_client = worker.root_client
+    call = SyftAPICall(
+        node_uid=worker.id, path="metadata", args=[], kwargs={}, blocking=True
+    )
+    signed_api_call = call.sign(root_client.credentials)
+
+    envelope = signed_api_call.to_envelope()
+    assert is_signed_envelope(envelope)
+    # the signed payload is framed as it is, not serialized again
+    assert envelope.endswith(signed_api_call.serialized_message)
+
+    received = SignedSyftAPICall.from_envelope(envelope).ok()
+    assert received.is_valid
+    assert received.credentials == root_client.credentials.verify_key
+    assert received.message == call
+
+    signed_result = worker.handle_api_call(received)
+    result = SignedSyftAPICall.from_envelope(signed_result.to_envelope()).ok()
+    assert result.is_valid
+    assert not isinstance(result.message.data, SyftError)
+
+    # an envelope whose signature doesn't check out is never materialized
+    tampered = bytearray(envelope)
+    tampered[-1] ^= 1
+    assert SignedSyftAPICall.from_envelope(bytes(tampered)).is_err()
+
+    assert SignedSyftAPICall.from_envelope(signed_api_call.serialized_message).is_err()